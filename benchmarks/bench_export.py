@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Export throughput and peak memory: export_to_json vs the streamed formats.
+
+Each case exports events from an existing database in a fresh Python
+process, so its peak RSS is its own:
+
+  json           export_to_json: fetchall into dicts, then json.dump(indent=2)
+  ndjson         export_to_ndjson from a named cursor, at each --itersize
+  ndjson.zst     the same with zstd compression (needs zstandard)
+  csv            export_to_csv through COPY TO STDOUT
+
+For each case the median wall time over the rounds, rows per second, peak
+RSS and output size are reported. Files go to a temporary directory.
+
+Usage:
+    python benchmarks/bench_export.py [--database dispatch_911] [--limit N]
+                                      [--rounds 3] [--itersize 1000 5000 20000]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Runs one export in a child process and reports its rows, time and peak RSS
+CHILD = """
+import contextlib, io, json, resource, sys, time
+sys.path.insert(0, {root!r})
+from dispatch_ingester import DispatchIngester
+
+ingester = DispatchIngester(db_config={db_config!r})
+ingester._release_connection(ingester._get_connection())
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    rows = ingester.{method}({output!r}, {limit!r}, **{kwargs!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'rows': rows, 'seconds': elapsed,
+                  'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+
+def run_case(db_config: dict, method: str, output: str, limit, kwargs: dict) -> dict:
+    """Export once in a child process; return its rows, seconds and rss_kb."""
+    code = CHILD.format(root=ROOT, db_config=db_config, method=method,
+                        output=output, limit=limit, kwargs=kwargs)
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--host', default=os.environ.get('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('DB_PORT', 5432)))
+    parser.add_argument('--database', default=os.environ.get('DB_NAME', 'dispatch_911'))
+    parser.add_argument('--user', default=os.environ.get('DB_USER', 'postgres'))
+    parser.add_argument('--password', default=os.environ.get('DB_PASSWORD', ''))
+    parser.add_argument('--limit', type=int, help='Export at most this many events (default: all)')
+    parser.add_argument('--rounds', type=int, default=3, help='Exports per case (default: 3)')
+    parser.add_argument('--itersize', type=int, nargs='+', default=[1000, 5000, 20000],
+                        help='ndjson itersize values to time (default: 1000 5000 20000)')
+    args = parser.parse_args()
+
+    db_config = {
+        'host': args.host,
+        'port': args.port,
+        'database': args.database,
+        'user': args.user,
+        'password': args.password
+    }
+
+    cases = [('json', 'export_to_json', 'events.json', {})]
+    for itersize in args.itersize:
+        cases.append((f'ndjson ({itersize})', 'export_to_ndjson', 'events.ndjson',
+                      {'compression': 'none', 'itersize': itersize}))
+    if importlib.util.find_spec('zstandard') is not None:
+        cases.append((f'ndjson.zst ({args.itersize[-1]})', 'export_to_ndjson', 'events.ndjson.zst',
+                      {'compression': 'zstd', 'itersize': args.itersize[-1]}))
+    else:
+        print("zstandard is not installed; skipping the zstd case\n")
+    cases.append(('csv', 'export_to_csv', 'events.csv', {'compression': 'none'}))
+
+    print(f"{'case':<22}{'rows':>10}{'median s':>10}{'rows/s':>12}{'peak RSS MB':>13}{'file MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, method, filename, kwargs in cases:
+            output = os.path.join(tmp, filename)
+            runs = [run_case(db_config, method, output, args.limit, kwargs) for _ in range(args.rounds)]
+            seconds = statistics.median(run['seconds'] for run in runs)
+            rows = runs[-1]['rows']
+            if rows is None:
+                # export_to_json returns nothing; count its objects without
+                # loading the file here (children would inherit the peak RSS)
+                with open(output, encoding='utf-8') as f:
+                    rows = sum(1 for line in f if line.startswith('    "event_id":'))
+            rss = max(run['rss_kb'] for run in runs) / 1024
+            size = os.path.getsize(output) / (1024 * 1024)
+            print(f"{name:<22}{rows:>10}{seconds:>10.2f}{rows / seconds:>12,.0f}{rss:>13.1f}{size:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Per-poll latency: one-off requests.get vs the ingester's persistent session.
+
+Starts a local HTTP/1.1 stub that serves a synthetic EventListing payload
+(gzip-compressed when the client accepts it) and times repeated polls with
+each client. The one-off client opens a new connection every poll, as
+fetch_data() did before it kept a session.
+
+Usage:
+    python benchmarks/bench_http_session.py [--polls 200] [--rows 400]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from dispatch_ingester import DispatchIngester  # noqa: E402
+
+
+def make_payload(rows: int) -> bytes:
+    """Build a synthetic EventListing response body."""
+    return json.dumps({
+        'title': 'Benchmark Feed',
+        'columns': [{'field': f'Column{i}', 'header': f'Header {i}'} for i in range(1, 8)],
+        'rows': [{
+            'EventID': str(i),
+            'Column1': f'P{i:06d}',
+            'Column2': f'{i} MAIN ST',
+            'Column3': 'AID',
+            'Column4': 'E1,M2',
+            'Column5': '2025-12-10T10:34:30.603',
+            'Column6': 'Everett',
+            'Column7': 'Fire',
+            'Longitude': '-122.2',
+            'Latitude': '47.9'
+        } for i in range(rows)]
+    }).encode('utf-8')
+
+
+def start_stub(body: bytes) -> ThreadingHTTPServer:
+    """Serve body on 127.0.0.1 with keep-alive enabled."""
+    compressed = gzip.compress(body)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            # Headers and body go out in separate writes; without this, Nagle's
+            # algorithm stalls every keep-alive response on the client's delayed ACK
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_GET(self):
+            use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            data = compressed if use_gzip else body
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            if use_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def time_polls(get, url: str, polls: int) -> list:
+    """Return per-poll latencies in milliseconds."""
+    latencies = []
+    for _ in range(polls):
+        start = time.perf_counter()
+        response = get(url, params={'pubToken': 'bench'}, timeout=(5, 30))
+        response.raise_for_status()
+        response.json()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: list):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:<22} mean {statistics.mean(latencies):7.2f} ms   "
+          f"p50 {statistics.median(latencies):7.2f} ms   p95 {p95:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--polls', type=int, default=200, help='Polls per client (default: 200)')
+    parser.add_argument('--rows', type=int, default=400, help='Rows in the payload (default: 400)')
+    args = parser.parse_args()
+
+    server = start_stub(make_payload(args.rows))
+    url = f'http://127.0.0.1:{server.server_port}/EventListing'
+
+    def one_off_get(url, **kwargs):
+        # A fresh connection per poll, without compression
+        return requests.get(url, headers={'Accept-Encoding': 'identity', 'Connection': 'close'}, **kwargs)
+
+    session = DispatchIngester.create_http_session()
+    try:
+        print(f"{args.polls} polls, {args.rows} rows per payload\n")
+        report('requests.get', time_polls(one_off_get, url, args.polls))
+        report('persistent session', time_polls(session.get, url, args.polls))
+    finally:
+        session.close()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
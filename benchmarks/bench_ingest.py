@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Per-poll CPU time of the ingest path, broken down by stage and JSON backend.
+
+Builds a synthetic EventListing response and runs the work ingest() does
+on it before touching the database: parsing the body (whole, and streamed
+as for bodies over WHOLE_PARSE_MAX_BYTES), serializing each row for the
+raw_data column, and mapping rows to events. Every available JSON backend
+(orjson when installed, and the stdlib) is timed.
+
+Usage:
+    python benchmarks/bench_ingest.py [--polls 50] [--rows 400]
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import dispatch_ingester  # noqa: E402
+from dispatch_ingester import DispatchIngester  # noqa: E402
+
+
+def make_payload(rows: int) -> bytes:
+    """Build a synthetic EventListing response body."""
+    return json.dumps({
+        'title': 'Benchmark Feed',
+        'columns': [{'field': f'Column{i}', 'header': f'Header {i}'} for i in range(1, 8)],
+        'rows': [{
+            'EventID': str(i),
+            'Column1': f'P{i:06d}',
+            'Column2': f'{i} MAIN ST',
+            'Column3': 'AID',
+            'Column4': 'E1,M2',
+            'Column5': '2025-12-10T10:34:30.603',
+            'Column6': 'Everett',
+            'Column7': 'Fire',
+            'Longitude': '-122.2',
+            'Latitude': '47.9'
+        } for i in range(rows)]
+    }).encode('utf-8')
+
+
+def time_stage(stage, polls: int) -> list:
+    """Return per-poll times of stage() in milliseconds."""
+    times = []
+    for _ in range(polls):
+        start = time.perf_counter()
+        stage()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def report(name: str, times: list):
+    times = sorted(times)
+    p95 = times[int(len(times) * 0.95) - 1]
+    print(f"  {name:<18} mean {statistics.mean(times):8.2f} ms   "
+          f"p50 {statistics.median(times):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--polls', type=int, default=50, help='Polls per stage (default: 50)')
+    parser.add_argument('--rows', type=int, default=400, help='Rows in the payload (default: 400)')
+    args = parser.parse_args()
+
+    body = make_payload(args.rows)
+    ingester = DispatchIngester(db_config={})
+    data = json.loads(body)
+    rows, columns = data['rows'], data['columns']
+
+    def parse(limit: int):
+        def stage():
+            ingester.WHOLE_PARSE_MAX_BYTES = limit
+            for _ in ingester._payload_members(io.BytesIO(body)):
+                pass
+        return stage
+
+    backends = ['stdlib']
+    if importlib.util.find_spec('orjson') is not None:
+        backends.insert(0, 'orjson')
+    else:
+        print("orjson is not installed; timing the stdlib backend only\n")
+
+    print(f"{args.polls} polls, {args.rows} rows ({len(body) / 1024:.0f} KiB) per payload")
+    for backend in backends:
+        dispatch_ingester.set_json_backend(backend)
+        dumps = dispatch_ingester.json_codec()[2]
+        print(f"\n{backend}")
+        report('parse (whole)', time_stage(parse(len(body)), args.polls))
+        report('parse (streamed)', time_stage(parse(0), args.polls))
+        report('serialize raw_data', time_stage(lambda: [dumps(row) for row in rows], args.polls))
+        mapper = ingester._row_mapper(columns)
+        report('map rows', time_stage(lambda: [mapper(row, 'Benchmark Feed') for row in rows], args.polls))
+
+
+if __name__ == '__main__':
+    main()
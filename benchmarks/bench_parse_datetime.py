@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+call_created parsing: the previous per-row parser vs the memoized one.
+
+Three workloads are timed, each starting from an empty cache:
+
+  polls     the same --rows timestamps parsed on every one of --polls polls,
+            as a resident daemon sees them
+  replay    --polls polls of --rows timestamps where each poll drops the
+            oldest --churn of the previous poll's values and adds as many new
+            ones, as when recorded polls of a sliding window are replayed
+  unique    --rows * --polls distinct timestamps, each parsed once: the
+            worst case, where the cache never hits
+
+Usage:
+    python benchmarks/bench_parse_datetime.py [--rows 400] [--polls 50] [--churn 0.1] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from dispatch_ingester import DispatchIngester  # noqa: E402
+
+
+def previous_parse_datetime(value):
+    """_parse_datetime as it was before memoization."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+
+
+def timestamps(count: int) -> list:
+    """Distinct API-style timestamps, e.g. "2025-12-10T10:34:30.603"."""
+    start = datetime(2025, 12, 10)
+    return [
+        (start + timedelta(seconds=7 * i, milliseconds=i % 1000)).isoformat(timespec='milliseconds')
+        for i in range(count)
+    ]
+
+
+def time_parser(parse, values: list, rounds: int) -> float:
+    """
+    Return the median nanoseconds per value over rounds.
+    
+    parse is None for the memoized parser, which is taken from a new
+    DispatchIngester each round so its cache and hit-rate windows start empty.
+    """
+    results = []
+    for _ in range(rounds):
+        current = parse or DispatchIngester(db_config={})._parse_datetime
+        start = time.perf_counter()
+        for value in values:
+            current(value)
+        results.append((time.perf_counter() - start) * 1e9 / len(values))
+    return statistics.median(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=400, help='Timestamps per poll (default: 400)')
+    parser.add_argument('--polls', type=int, default=50, help='Polls per round (default: 50)')
+    parser.add_argument('--churn', type=float, default=0.1,
+                        help='Share of values replaced per replayed poll (default: 0.1)')
+    parser.add_argument('--rounds', type=int, default=5, help='Rounds per case (default: 5)')
+    args = parser.parse_args()
+
+    shift = max(1, int(args.rows * args.churn))
+    window = timestamps(args.rows + shift * args.polls)
+    workloads = {
+        'polls': timestamps(args.rows) * args.polls,
+        'replay': [value for poll in range(args.polls)
+                   for value in window[poll * shift:poll * shift + args.rows]],
+        'unique': timestamps(args.rows * args.polls),
+    }
+
+    print(f"{args.rows} rows x {args.polls} polls, median of {args.rounds} rounds "
+          f"(cache size {DispatchIngester.DATETIME_CACHE_SIZE})\n")
+    for name, values in workloads.items():
+        before = time_parser(previous_parse_datetime, values, args.rounds)
+        after = time_parser(None, values, args.rounds)
+        print(f"{name:<10} previous {before:7.0f} ns/value   memoized {after:7.0f} ns/value   "
+              f"({before / after:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
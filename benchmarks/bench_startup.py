@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+CLI cold-start cost per subcommand, measured with `python -X importtime`.
+
+Each subcommand is launched twice per round:
+
+  help   `dispatch_ingester.py <command> --help` (argument parsing only)
+  run    the command itself against a closed local port, so it imports what
+         it needs, fails its first connection and exits without a database
+
+For each case the median wall time over the rounds is reported together with
+the total import time and the most expensive top-level imports from the
+importtime trace.
+
+Usage:
+    python benchmarks/bench_startup.py [--rounds 5] [--top 3]
+"""
+
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dispatch_ingester.py')
+
+# Subcommands and the extra arguments they need to run (None: --help only,
+# for commands that never exit on their own)
+COMMANDS = {
+    'ingest': [],
+    'stats': [],
+    'search': ['--limit', '1'],
+    'export': ['csv', '--output', os.devnull],
+    'migrate': [],
+    'dedupe': [],
+    'daemon': None,
+    'schedule': None,
+}
+
+IMPORT_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def closed_port() -> int:
+    """Return a local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def launch(args: list) -> tuple:
+    """Run the CLI once; return (wall seconds, importtime stderr)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', SCRIPT] + args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=60
+    )
+    return time.perf_counter() - start, proc.stderr
+
+
+def top_level_imports(trace: str) -> list:
+    """Return (cumulative microseconds, module) for top-level imports, largest first."""
+    imports = []
+    for match in IMPORT_LINE.finditer(trace):
+        cumulative, indent, module = int(match.group(2)), match.group(3), match.group(4)
+        if len(indent) == 1:
+            imports.append((cumulative, module))
+    return sorted(imports, reverse=True)
+
+
+def measure(args: list, rounds: int) -> tuple:
+    walls, traces = [], []
+    for _ in range(rounds):
+        wall, trace = launch(args)
+        walls.append(wall)
+        traces.append(trace)
+    imports = top_level_imports(traces[-1])
+    return statistics.median(walls), sum(us for us, _ in imports), imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rounds', type=int, default=5, help='Launches per case (default: 5)')
+    parser.add_argument('--top', type=int, default=3, help='Top-level imports to list (default: 3)')
+    args = parser.parse_args()
+
+    db_args = ['--host', '127.0.0.1', '--port', str(closed_port())]
+
+    print(f"{'case':<18}{'wall ms':>9}{'imports ms':>12}   top imports")
+    cases = [('(no command)', [])]
+    for command, extra in COMMANDS.items():
+        cases.append((f'{command} --help', [command, '--help']))
+        if extra is not None:
+            cases.append((command, db_args + [command] + extra))
+
+    for name, cli_args in cases:
+        wall, import_us, imports = measure(cli_args, args.rounds)
+        top = ', '.join(f'{module} {us / 1000:.1f}' for us, module in imports[:args.top])
+        print(f"{name:<18}{wall * 1000:9.1f}{import_us / 1000:12.1f}   {top}")
+
+
+if __name__ == '__main__':
+    main()
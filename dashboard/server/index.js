@@ -190,7 +190,9 @@ app.get('/api/dispatches', async (req, res) => {
     const safeSortBy = allowedSortFields.includes(sortBy) ? sortBy : 'call_created';
     const safeSortOrder = sortOrder === 'asc' ? 'ASC' : 'DESC';
 
-    let whereClause = 'WHERE 1=1';
+    // One row per incident: the ingester flags the canonical row of rows
+    // sharing call type, address, call time and jurisdiction (incident_key)
+    let whereClause = 'WHERE is_canonical';
     const params = [];
     let paramIndex = 1;
 
@@ -237,19 +239,14 @@ app.get('/api/dispatches', async (req, res) => {
 
     // Get total count for pagination (deduplicated)
     const countResult = await pool.query(
-      `SELECT COUNT(*) as total FROM (
-        SELECT DISTINCT ON (call_type, address, call_created, jurisdiction) id
-        FROM events ${whereClause}
-      ) as unique_events`,
+      `SELECT COUNT(*) as total FROM events ${whereClause}`,
       params
     );
     const total = parseInt(countResult.rows[0].total);
 
-    // Get paginated results (deduplicated by call attributes)
-    // Uses DISTINCT ON to get unique events based on call_type, address, call_created, jurisdiction
-    // This handles cases where the same incident gets multiple event_ids from the source
+    // Get paginated results (canonical rows only, see whereClause)
     const query = `
-      SELECT DISTINCT ON (call_type, address, call_created, jurisdiction)
+      SELECT
         id,
         event_id,
         call_number,
@@ -266,12 +263,11 @@ app.get('/api/dispatches', async (req, res) => {
         times_seen
       FROM events
       ${whereClause}
-      ORDER BY call_type, address, call_created, jurisdiction, first_seen DESC
     `;
 
-    // Wrap in subquery to apply custom sorting and pagination
+    // Apply custom sorting and pagination
     const paginatedQuery = `
-      SELECT * FROM (${query}) as deduplicated
+      ${query}
       ORDER BY ${safeSortBy} ${safeSortOrder}
       LIMIT $${paramIndex} OFFSET $${paramIndex + 1}
     `;
@@ -292,6 +288,72 @@ app.get('/api/dispatches', async (req, res) => {
   }
 });
 
+// Stats count queries over events, for a first_seen date filter.
+// Order: total, by agency type, top jurisdictions, unique jurisdictions, timeline.
+function eventCountQueries(dateFilter, params) {
+  return [
+    // Total events
+    pool.query(`SELECT COUNT(*) as total FROM events ${dateFilter}`, params),
+    
+    // Events by agency type
+    pool.query(`
+      SELECT COALESCE(LOWER(agency_type), 'unknown') as event_type, COUNT(*) as count 
+      FROM events ${dateFilter}
+      GROUP BY LOWER(agency_type)`, params),
+    
+    // Events by jurisdiction (top 10)
+    pool.query(`
+      SELECT COALESCE(jurisdiction, 'Unknown') as jurisdiction, COUNT(*) as count 
+      FROM events ${dateFilter}
+      GROUP BY jurisdiction
+      ORDER BY count DESC
+      LIMIT 10`, params),
+    
+    // Unique jurisdictions count
+    pool.query(`SELECT COUNT(DISTINCT jurisdiction) as count FROM events ${dateFilter}`, params),
+    
+    // Events by hour (for timeline)
+    pool.query(`
+      SELECT DATE_TRUNC('hour', call_created) as hour, COUNT(*) as count
+      FROM events ${dateFilter}
+      GROUP BY DATE_TRUNC('hour', call_created)
+      ORDER BY hour DESC
+      LIMIT 24`, params)
+  ];
+}
+
+// The same stats count queries over event_rollups (hourly counts by agency
+// type, jurisdiction and call type, NULL stored as '')
+function rollupCountQueries() {
+  return [
+    pool.query(`SELECT COALESCE(SUM(events), 0) as total FROM event_rollups`),
+    
+    pool.query(`
+      SELECT COALESCE(LOWER(NULLIF(agency_type, '')), 'unknown') as event_type, SUM(events) as count
+      FROM event_rollups
+      GROUP BY 1
+      HAVING SUM(events) > 0`),
+    
+    pool.query(`
+      SELECT COALESCE(NULLIF(jurisdiction, ''), 'Unknown') as jurisdiction, SUM(events) as count
+      FROM event_rollups
+      GROUP BY jurisdiction
+      HAVING SUM(events) > 0
+      ORDER BY count DESC
+      LIMIT 10`),
+    
+    pool.query(`SELECT COUNT(DISTINCT jurisdiction) as count FROM event_rollups WHERE jurisdiction <> '' AND events > 0`),
+    
+    pool.query(`
+      SELECT hour, SUM(events) as count
+      FROM event_rollups
+      GROUP BY hour
+      HAVING SUM(events) > 0
+      ORDER BY hour DESC
+      LIMIT 24`)
+  ];
+}
+
 // Get statistics
 app.get('/api/stats', async (req, res) => {
   try {
@@ -306,35 +368,12 @@ app.get('/api/stats', async (req, res) => {
       params.push(startDate, endDate);
     }
 
-    // Run simple indexed queries in parallel for speed
+    // Without a date filter, counts come from the hourly event_rollups the
+    // ingester keeps current, which stay small as events grows
+    const countQueries = dateFilter ? eventCountQueries(dateFilter, params) : rollupCountQueries();
+
     const [totalResult, byTypeResult, byJurisdictionResult, jurisdictionsResult, byHourResult, recentResult] = await Promise.all([
-      // Total events
-      pool.query(`SELECT COUNT(*) as total FROM events ${dateFilter}`, params),
-      
-      // Events by agency type
-      pool.query(`
-        SELECT COALESCE(LOWER(agency_type), 'unknown') as event_type, COUNT(*) as count 
-        FROM events ${dateFilter}
-        GROUP BY LOWER(agency_type)`, params),
-      
-      // Events by jurisdiction (top 10)
-      pool.query(`
-        SELECT COALESCE(jurisdiction, 'Unknown') as jurisdiction, COUNT(*) as count 
-        FROM events ${dateFilter}
-        GROUP BY jurisdiction
-        ORDER BY count DESC
-        LIMIT 10`, params),
-      
-      // Unique jurisdictions count
-      pool.query(`SELECT COUNT(DISTINCT jurisdiction) as count FROM events ${dateFilter}`, params),
-      
-      // Events by hour (for timeline)
-      pool.query(`
-        SELECT DATE_TRUNC('hour', call_created) as hour, COUNT(*) as count
-        FROM events ${dateFilter}
-        GROUP BY DATE_TRUNC('hour', call_created)
-        ORDER BY hour DESC
-        LIMIT 24`, params),
+      ...countQueries,
       
       // Recent activity (last 6 hours) - always calculated
       pool.query(`SELECT COUNT(*) as count FROM events WHERE first_seen >= NOW() - INTERVAL '6 hours'`)
@@ -411,40 +450,28 @@ app.get('/api/dispatches/latest', async (req, res) => {
 // Get unique values for filters with counts (deduplicated)
 app.get('/api/filters', async (req, res) => {
   try {
-    // Use deduplicated counts for accurate filter values
-    const deduplicatedCTE = `
-      WITH deduplicated AS (
-        SELECT DISTINCT ON (call_type, address, call_created, jurisdiction)
-          call_type, address, call_created, jurisdiction, agency_type
-        FROM events
-        ORDER BY call_type, address, call_created, jurisdiction, first_seen DESC
-      )
-    `;
-
+    // Counts of canonical (deduplicated) events per filter value, kept
+    // current by the ingester, so this reads one row per value
     const agencyTypesResult = await pool.query(
-      `${deduplicatedCTE}
-       SELECT COALESCE(agency_type, 'Unknown') as agency_type, COUNT(*) as count
-       FROM deduplicated 
-       GROUP BY agency_type
+      `SELECT COALESCE(NULLIF(value, ''), 'Unknown') as agency_type, events as count
+       FROM facet_counts
+       WHERE facet = 'agency_type' AND events > 0
        ORDER BY count DESC`
     );
     
     const jurisdictionsResult = await pool.query(
-      `${deduplicatedCTE}
-       SELECT jurisdiction, COUNT(*) as count
-       FROM deduplicated 
-       WHERE jurisdiction IS NOT NULL
-       GROUP BY jurisdiction
+      `SELECT value as jurisdiction, events as count
+       FROM facet_counts
+       WHERE facet = 'jurisdiction' AND value <> '' AND events > 0
        ORDER BY count DESC`
     );
 
     const callTypesResult = await pool.query(
-      `${deduplicatedCTE}
-       SELECT COALESCE(call_type, 'Unknown') as call_type, 
-              COALESCE(agency_type, 'Unknown') as agency_type,
-              COUNT(*) as count 
-       FROM deduplicated 
-       GROUP BY call_type, agency_type
+      `SELECT COALESCE(NULLIF(value, ''), 'Unknown') as call_type, 
+              COALESCE(NULLIF(agency_type, ''), 'Unknown') as agency_type,
+              events as count 
+       FROM facet_counts
+       WHERE facet = 'call_type' AND events > 0
        ORDER BY count DESC
        LIMIT 200`
     );
@@ -8,7 +8,7 @@
 # 2. Set up Python virtual environment
 # 3. Copy the Python script
 # 4. Install Python dependencies in venv
-# 5. Set up a cron job to run every 5 minutes
+# 5. Install a systemd service running the resident ingest daemon
 # 6. Run an initial test
 #
 
@@ -19,7 +19,8 @@ INSTALL_DIR="/opt/dispatch_ingester"
 SCRIPT_NAME="dispatch_ingester.py"
 LOG_DIR="/var/log/dispatch_ingester"
 VENV_DIR="$INSTALL_DIR/venv"
-CRON_SCHEDULE="*/5 * * * *"  # Every 5 minutes
+SERVICE_NAME="dispatch-ingester"
+INTERVAL_SECONDS=300  # Every 5 minutes
 
 echo "================================================"
 echo "911 Dispatch Ingester - Deployment Script"
@@ -37,10 +38,14 @@ echo "[1/7] Creating installation directory..."
 mkdir -p "$INSTALL_DIR"
 mkdir -p "$LOG_DIR"
 
-# Copy the script (assumes script is in same directory as this deploy script)
+# Copy the script (prefers the repository copy next to deploy/, else the one in this directory)
 echo "[2/7] Installing Python script..."
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-cp "$SCRIPT_DIR/$SCRIPT_NAME" "$INSTALL_DIR/"
+SCRIPT_SRC="$SCRIPT_DIR/../$SCRIPT_NAME"
+if [ ! -f "$SCRIPT_SRC" ]; then
+    SCRIPT_SRC="$SCRIPT_DIR/$SCRIPT_NAME"
+fi
+cp "$SCRIPT_SRC" "$INSTALL_DIR/$SCRIPT_NAME"
 chmod +x "$INSTALL_DIR/$SCRIPT_NAME"
 
 # Ensure python3-venv is installed
@@ -58,18 +63,31 @@ echo "[5/7] Installing Python dependencies in virtual environment..."
 "$VENV_DIR/bin/pip" install --upgrade pip
 "$VENV_DIR/bin/pip" install psycopg2-binary requests
 
-# Create a wrapper script for cron
-echo "[6/7] Creating cron wrapper script..."
-cat > "$INSTALL_DIR/run_ingester.sh" << EOF
-#!/bin/bash
-# Wrapper script for cron execution
-cd $INSTALL_DIR
-$VENV_DIR/bin/python dispatch_ingester.py ingest >> $LOG_DIR/ingester.log 2>&1
+# Create the systemd service for the resident daemon
+# Database settings (DB_HOST, DB_USER, DB_PASSWORD, ...) are read from $INSTALL_DIR/.env if present
+echo "[6/7] Creating systemd service..."
+cat > "/etc/systemd/system/$SERVICE_NAME.service" << EOF
+[Unit]
+Description=911 Dispatch Ingester daemon
+After=network-online.target postgresql.service
+Wants=network-online.target
+
+[Service]
+Type=simple
+WorkingDirectory=$INSTALL_DIR
+EnvironmentFile=-$INSTALL_DIR/.env
+ExecStart=$VENV_DIR/bin/python -u $INSTALL_DIR/$SCRIPT_NAME daemon --interval $INTERVAL_SECONDS
+Restart=on-failure
+RestartSec=10
+StandardOutput=append:$LOG_DIR/ingester.log
+StandardError=append:$LOG_DIR/ingester.log
+
+[Install]
+WantedBy=multi-user.target
 EOF
-chmod +x "$INSTALL_DIR/run_ingester.sh"
 
-# Set up log rotation
-echo "[7/7] Setting up log rotation and cron job..."
+# Set up log rotation (copytruncate: the daemon keeps its log file open)
+echo "[7/7] Setting up log rotation and removing the old cron job..."
 cat > /etc/logrotate.d/dispatch_ingester << EOF
 /var/log/dispatch_ingester/*.log {
     daily
@@ -78,19 +96,13 @@ cat > /etc/logrotate.d/dispatch_ingester << EOF
     compress
     delaycompress
     notifempty
-    create 0640 root root
+    copytruncate
 }
 EOF
 
-# Set up cron job
-CRON_JOB="$CRON_SCHEDULE $INSTALL_DIR/run_ingester.sh"
-
-# Remove existing cron job if present
+# Remove the cron job used by earlier installs
 crontab -l 2>/dev/null | grep -v "dispatch_ingester" | crontab - 2>/dev/null || true
 
-# Add new cron job
-(crontab -l 2>/dev/null; echo "$CRON_JOB") | crontab -
-
 echo ""
 echo "================================================"
 echo "Installation Complete!"
@@ -99,7 +111,7 @@ echo ""
 echo "Installation directory: $INSTALL_DIR"
 echo "Virtual environment: $VENV_DIR"
 echo "Log directory: $LOG_DIR"
-echo "Cron schedule: Every 5 minutes"
+echo "Schedule: Every $INTERVAL_SECONDS seconds (systemd service $SERVICE_NAME)"
 echo ""
 echo "Running initial test..."
 echo ""
@@ -108,14 +120,19 @@ echo ""
 cd "$INSTALL_DIR"
 "$VENV_DIR/bin/python" dispatch_ingester.py ingest
 
+# Start the daemon
+systemctl daemon-reload
+systemctl enable "$SERVICE_NAME"
+systemctl restart "$SERVICE_NAME"
+
 echo ""
 echo "================================================"
-echo "Setup successful! The ingester will now run"
-echo "automatically every 5 minutes."
+echo "Setup successful! The ingester daemon is now"
+echo "running every $INTERVAL_SECONDS seconds."
 echo ""
 echo "Useful commands:"
 echo "  View logs:    tail -f $LOG_DIR/ingester.log"
 echo "  Check stats:  $VENV_DIR/bin/python $INSTALL_DIR/dispatch_ingester.py stats"
 echo "  Manual run:   $VENV_DIR/bin/python $INSTALL_DIR/dispatch_ingester.py ingest"
-echo "  View cron:    crontab -l"
+echo "  Service:      systemctl status $SERVICE_NAME"
 echo "================================================"
@@ -26,17 +26,200 @@ License: MIT
 Repository: https://github.com/wnelson/firstwatch.net
 """
 
-import json
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import requests
+# Only cheap stdlib modules are imported here. psycopg2, requests, json, csv
+# and friends are imported inside the functions that use them, so --help,
+# argument errors and each subcommand only pay for what they touch.
 import time
+from collections import namedtuple
 from datetime import datetime
-from typing import Optional
-import csv
+from typing import Optional, TYPE_CHECKING
 import argparse
 import os
 
+if TYPE_CHECKING:
+    import requests
+
+# JSON backend for response parsing and raw_data: 'auto' uses orjson when it
+# is installed and the stdlib json module otherwise ('orjson' or 'stdlib' force one)
+JSON_BACKEND = os.environ.get('DISPATCH_JSON_BACKEND', 'auto')
+_json_codec = None
+
+
+def json_codec() -> tuple:
+    """
+    Return the JSON codec for JSON_BACKEND as (name, loads, dumps).
+    
+    loads accepts bytes or str. dumps(value, sort_keys=False) returns compact
+    UTF-8 bytes with non-ASCII text kept as is and other types through str(),
+    so both backends produce the same bytes for API data.
+    
+    Raises:
+        ImportError: If JSON_BACKEND is 'orjson' and orjson is not installed
+        ValueError: If JSON_BACKEND is not a known backend
+    """
+    global _json_codec
+    if _json_codec is not None:
+        return _json_codec
+    
+    if JSON_BACKEND not in ('auto', 'orjson', 'stdlib'):
+        raise ValueError(f"Unknown JSON backend: {JSON_BACKEND}")
+    
+    if JSON_BACKEND != 'stdlib':
+        try:
+            import orjson
+        except ImportError:
+            if JSON_BACKEND == 'orjson':
+                raise
+        else:
+            def dumps(value, sort_keys: bool = False) -> bytes:
+                return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+            
+            _json_codec = ('orjson', orjson.loads, dumps)
+            return _json_codec
+    
+    import json
+    
+    def dumps(value, sort_keys: bool = False) -> bytes:
+        return json.dumps(
+            value, sort_keys=sort_keys, separators=(',', ':'), ensure_ascii=False, default=str
+        ).encode('utf-8')
+    
+    _json_codec = ('stdlib', json.loads, dumps)
+    return _json_codec
+
+
+def set_json_backend(name: str) -> str:
+    """
+    Switch the JSON backend ('auto', 'orjson' or 'stdlib').
+    
+    Returns:
+        str: Name of the backend now in use
+    """
+    global JSON_BACKEND, _json_codec
+    JSON_BACKEND = name
+    _json_codec = None
+    return json_codec()[0]
+
+
+class JsonBytes:
+    """
+    Serialized JSON handed to psycopg2 as a quoted literal (e.g. for '...'::jsonb).
+    
+    raw_data goes from the serializer's bytes into the statement without being
+    decoded to str first.
+    """
+    
+    __slots__ = ('data',)
+    
+    def __init__(self, data: bytes):
+        self.data = data
+    
+    def __conform__(self, protocol):
+        from psycopg2.extensions import QuotedString
+        
+        return QuotedString(self.data)
+
+
+def iter_payload(fp, stream_key: str = 'rows', chunk_size: int = 64 * 1024):
+    """
+    Incrementally parse a JSON object from a binary file.
+    
+    Yields (key, value) for each top-level member, except that the elements
+    of the `stream_key` array are yielded one at a time as (stream_key,
+    element). Only the current member (a single row, for the rows array) and
+    a read buffer are held in memory, however long the array is.
+    
+    Args:
+        fp: Binary file positioned at the start of the object
+        stream_key: Member whose array elements are yielded individually
+        chunk_size: Bytes read from fp at a time
+    
+    Raises:
+        ValueError: If the input is not a JSON object (json.JSONDecodeError
+                    for a malformed member)
+    """
+    import codecs
+    import json
+    
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buf, pos, eof = '', 0, False
+    
+    def fill():
+        nonlocal buf, pos, eof
+        data = fp.read(chunk_size)
+        eof = not data
+        buf = buf[pos:] + utf8.decode(data, final=eof)
+        pos = 0
+    
+    def peek() -> str:
+        """Skip whitespace and return the next character ('' at the end of input)."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\n\r':
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos:pos + 1]
+            fill()
+    
+    def expect(chars: str) -> str:
+        nonlocal pos
+        char = peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON payload, got {char!r}")
+        pos += 1
+        return char
+    
+    def value():
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                result, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            if not eof and (end == len(buf) or buf[end] not in ' \t\n\r,]}'):
+                # Only a delimiter proves the value complete: a number cut off
+                # at the end of the buffer (12|.5) continues in the next chunk
+                fill()
+                continue
+            pos = end
+            return result
+    
+    expect('{')
+    if peek() == '}':
+        return
+    while True:
+        key = value()
+        expect(':')
+        if key == stream_key and peek() == '[':
+            expect('[')
+            if peek() == ']':
+                expect(']')
+            else:
+                while True:
+                    yield key, value()
+                    if expect(',]') == ']':
+                        break
+        else:
+            yield key, value()
+        if expect(',}') == '}':
+            return
+
+
+# A mapped API row, with fields in events INSERT column order
+Event = namedtuple('Event', (
+    'event_id', 'call_number', 'address', 'call_type', 'units', 'call_created',
+    'jurisdiction', 'agency_type', 'longitude', 'latitude',
+    'link_url_1', 'link_url_2', 'link_url_3', 'link_url_4', 'link_url_5',
+    'column_1', 'column_2', 'column_3', 'column_4', 'column_5',
+    'column_6', 'column_7', 'column_8', 'column_9', 'column_10',
+    'raw_data', 'source_title', 'source_token',
+))
+
 
 class DispatchIngester:
     """
@@ -70,12 +253,116 @@ class DispatchIngester:
         'password': os.environ.get('DB_PASSWORD', '')
     }
     
+    # Events sent per set-based upsert statement
+    UPSERT_PAGE_SIZE = 1000
+    
+    # HTTP timeouts in seconds (connect, read)
+    CONNECT_TIMEOUT = 5
+    READ_TIMEOUT = 30
+    
+    # Response bodies are spooled in memory up to this size, then to a temp file
+    SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+    
+    # Bytes read at a time when streaming and parsing a response body
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # Bodies up to this size are parsed in one call by the JSON backend;
+    # larger ones are parsed incrementally (iter_payload)
+    WHOLE_PARSE_MAX_BYTES = 2 * 1024 * 1024
+    
+    # Event fields taken from a data column: (field, default column, headers).
+    # The column is found by its header in the API's columns list (lowercase,
+    # letters and digits only); the default is used when no header matches.
+    COLUMN_ROLES = (
+        ('call_number', 'Column1', ('callnumber', 'callno', 'incidentnumber', 'eventnumber')),
+        ('address', 'Column2', ('address', 'location')),
+        ('call_type', 'Column3', ('calltype', 'type', 'nature', 'incidenttype')),
+        ('units', 'Column4', ('units', 'unit')),
+        ('call_created', 'Column5', ('callcreated', 'created', 'calltime', 'received')),
+        ('jurisdiction', 'Column6', ('jurisdiction', 'city')),
+        ('agency_type', 'Column7', ('agencytype', 'agency', 'discipline')),
+    )
+    
+    # Event fields with few distinct values, interned so rows share one string
+    INTERNED_FIELDS = ('call_type', 'jurisdiction', 'agency_type')
+    
+    # Timestamp strings remembered by _parse_datetime before its cache starts
+    # over. Most of a poll's call_created values were in the previous poll.
+    DATETIME_CACHE_SIZE = 16384
+    
+    # _parse_datetime judges its cache every DATETIME_WINDOW_MISSES misses; a
+    # window where fewer than 1 in 8 lookups hit (a backfill or replay of
+    # mostly unseen values) bypasses the cache for the next DATETIME_SKIP_CALLS
+    # calls, then the next window is judged the same way
+    DATETIME_WINDOW_MISSES = 1024
+    DATETIME_SKIP_CALLS = 65536
+    
+    # Ordered schema migrations: (version, description, method)
+    MIGRATIONS = [
+        (1, 'Base tables and indexes', '_migrate_base_schema'),
+        (2, 'Unique composite key index on events', '_migrate_identity_index'),
+        (3, 'Poll state columns on source_metadata', '_migrate_poll_state'),
+        (4, 'Metadata fingerprint on source_metadata', '_migrate_metadata_hash'),
+        (5, 'Hourly event_rollups maintained by triggers on events', '_migrate_rollups'),
+        (6, 'Canonical incident key and is_canonical flag on events', '_migrate_incident_key'),
+        (7, 'facet_counts of canonical events maintained by triggers', '_migrate_facet_counts'),
+        (8, 'event_changes outbox and change_consumers checkpoints', '_migrate_event_changes'),
+        (9, 'source_token in the events composite key', '_migrate_source_identity'),
+        (10, 'event_changes update trigger on content columns only', '_migrate_change_triggers'),
+        (11, 'event_rollups update trigger on rollup key columns only', '_migrate_rollup_triggers'),
+        (12, 'Canonical election update trigger on incident key and first_seen only', '_migrate_canonical_triggers'),
+        (13, 'facet_counts update trigger on counted columns only', '_migrate_facet_triggers'),
+        (14, 'event_changes read in transaction order instead of under a lock', '_migrate_change_order'),
+    ]
+    
+    # pg_advisory_xact_lock key held while migrating
+    MIGRATION_LOCK_ID = 9110001
+    
+    # Monthly partitions kept ready past the current month once events is
+    # partitioned (see partition_events)
+    PARTITION_MONTHS_AHEAD = 2
+    
+    # Cold storage (see archive_events): Parquet files under ARCHIVE_DIR hold
+    # events older than ARCHIVE_AFTER_DAYS days
+    ARCHIVE_DIR = os.environ.get('DISPATCH_ARCHIVE_DIR', 'archive')
+    ARCHIVE_AFTER_DAYS = int(os.environ.get('DISPATCH_ARCHIVE_AFTER_DAYS', 365))
+    
+    # Rows fetched and written to a Parquet file at a time while archiving
+    ARCHIVE_BATCH_ROWS = 50000
+    
+    # pg_advisory_xact_lock key held while a month is archived
+    ARCHIVE_LOCK_ID = 9110002
+    
+    # Rows between progress lines of export_to_csv and export_to_ndjson
+    EXPORT_PROGRESS_ROWS = 100000
+    
+    # Rows fetched from the server-side cursor at a time by export_to_ndjson
+    EXPORT_ITERSIZE = 5000
+    
+    # LISTEN/NOTIFY channel announcing each committed ingestion (see
+    # _notify_batch for the payload and subscribe() for a consumer)
+    NOTIFY_CHANNEL = os.environ.get('DISPATCH_NOTIFY_CHANNEL', 'dispatch_events')
+    
+    # Parquet types of events columns by PostgreSQL data_type; other columns
+    # (text, jsonb, ...) are archived as text
+    ARCHIVE_TYPES = {
+        'smallint': 'int16',
+        'integer': 'int32',
+        'bigint': 'int64',
+        'real': 'float32',
+        'double precision': 'float64',
+        'boolean': 'bool_',
+        'date': 'date32',
+        'timestamp without time zone': 'timestamp',
+    }
+    
     def __init__(self, db_config: Optional[dict] = None, pub_token: Optional[str] = None):
         """
         Initialize the dispatch ingester.
         
-        Sets up the database connection configuration and API token. Creates the
-        database and required tables if they don't exist.
+        Sets up the database connection configuration and API token. Nothing is
+        sent to the database until the first connection, which creates the
+        database if it doesn't exist and applies pending schema migrations.
         
         Args:
             db_config: PostgreSQL connection configuration dictionary with keys:
@@ -84,18 +371,127 @@ class DispatchIngester:
         """
         self.db_config = db_config or self.DEFAULT_DB_CONFIG.copy()
         self.pub_token = pub_token or self.DEFAULT_TOKEN
-        self._ensure_database_exists()
-        self._init_database()
+        self._poll_state = None
+        self._response_validators = {}
+        # Previous poll's rows: {(call_number, call date): content hash}
+        self._snapshot = None
+        # Row mapper compiled for the last columns header: (header key, mapper)
+        self._mapper = None
+        # Parsed timestamps by API string, with the hit and miss counts of the
+        # current window and the calls left that bypass it (see _parse_datetime)
+        self._datetime_cache = {}
+        self._datetime_hits = 0
+        self._datetime_misses = 0
+        self._datetime_skip = 0
+        self._session = None
+        self._pool = None
+        self._owns_pool = False
+        self._schema_checked = False
+        self._partitioned = False
+        # (year, month) whose upcoming partitions were last ensured
+        self._partition_month = None
     
     def _get_connection(self, database: Optional[str] = None):
-        """Get a PostgreSQL connection."""
-        config = self.db_config.copy()
+        """
+        Get a PostgreSQL connection (from the pool when one is open).
+        
+        The first connection to the ingest database also checks the schema
+        version (see _init_database).
+        """
+        import psycopg2
+        
         if database:
-            config['database'] = database
-        return psycopg2.connect(**config)
+            return psycopg2.connect(**dict(self.db_config, database=database))
+        if not self._schema_checked:
+            return self._init_database()
+        if self._pool is not None:
+            return self._pool.getconn()
+        return psycopg2.connect(**self.db_config)
+    
+    def _release_connection(self, conn, discard: bool = False):
+        """
+        Release a connection from _get_connection().
+        
+        Pooled connections go back to the pool (rolled back if a transaction is
+        still open); discard=True closes them instead, e.g. after an error that
+        may have broken the connection. Unpooled connections are closed.
+        """
+        if self._pool is not None:
+            self._pool.putconn(conn, close=discard or bool(conn.closed))
+        else:
+            conn.close()
+    
+    def open_pool(self, minconn: int = 1, maxconn: int = 4):
+        """
+        Keep warm database connections for a long-running process.
+        
+        Args:
+            minconn: Connections opened up front
+            maxconn: Maximum connections held by the pool
+        """
+        from psycopg2.pool import ThreadedConnectionPool
+        
+        if not self._schema_checked:
+            # The pool connects eagerly, so create/migrate the database first
+            self._init_database().close()
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(minconn, maxconn, **self.db_config)
+            self._owns_pool = True
+    
+    def share_pool(self, owner: 'DispatchIngester'):
+        """
+        Use another ingester's connection pool, e.g. one ingester per source.
+        
+        The owner must have called open_pool() (which also checked the schema)
+        and stays responsible for closing the pool.
+        """
+        self._pool = owner._pool
+        self._owns_pool = False
+        self._has_identity_index = owner._has_identity_index
+        self._partitioned = owner._partitioned
+        self._partition_month = owner._partition_month
+        self._schema_checked = True
+    
+    @classmethod
+    def create_http_session(cls) -> 'requests.Session':
+        """
+        Create an HTTP session for polling the FirstWatch API.
+        
+        The session keeps connections alive between polls (no DNS, TCP or TLS
+        setup per request) and asks for gzip/deflate compressed responses.
+        
+        Returns:
+            requests.Session: Configured session
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        return session
+    
+    def close(self):
+        """Close the HTTP session and any pooled database connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._pool is not None:
+            if self._owns_pool:
+                self._pool.closeall()
+            self._pool = None
+            self._owns_pool = False
     
     def _ensure_database_exists(self):
         """Create the database if it doesn't exist."""
+        import psycopg2
+        
         # Connect to default postgres database to create our database
         config = self.db_config.copy()
         target_db = config.pop('database', 'dispatch_911')
@@ -122,10 +518,314 @@ class DispatchIngester:
             print(f"Warning: Could not check/create database: {e}")
     
     def _init_database(self):
-        """Initialize the PostgreSQL database with required tables."""
+        """
+        Bring the database schema up to date.
+        
+        Reads the applied schema version with a single query and runs DDL only
+        when migrations are pending. If the first connection fails, the
+        database is created when pg_database lacks it and the connection is
+        retried once; the original error is raised if that fails too. When
+        events is partitioned, the coming months' partitions are created as
+        well.
+        
+        Returns:
+            Connection used for the check, ready for the caller's own work
+        """
+        import psycopg2
+        
+        try:
+            conn = self._pool.getconn() if self._pool is not None else psycopg2.connect(**self.db_config)
+        except psycopg2.OperationalError as e:
+            # The server's message is localized (lc_messages) and a missing
+            # role reads much the same, so look the database up instead
+            self._ensure_database_exists()
+            try:
+                conn = psycopg2.connect(**self.db_config)
+            except psycopg2.OperationalError:
+                raise e from None
+        
+        cursor = conn.cursor()
+        version = self._get_schema_version(cursor)
+        if version < self.MIGRATIONS[-1][0]:
+            self._apply_migrations(cursor)
+        self._partitioned = self._events_partitioned(cursor)
+        if self._partitioned:
+            self._ensure_partitions(cursor, datetime.now())
+            conn.commit()
+        else:
+            conn.rollback()
+        cursor.close()
+        
+        # A partitioned events table has the composite key index per partition
+        # only, which ON CONFLICT cannot use
+        self._has_identity_index = not self._partitioned
+        self._schema_checked = True
+        return conn
+    
+    def _get_schema_version(self, cursor) -> int:
+        """Return the applied schema version (0 for a database without schema_version)."""
+        import psycopg2
+        
+        try:
+            cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+            return cursor.fetchone()[0]
+        except psycopg2.ProgrammingError as e:
+            if e.pgcode != '42P01':  # undefined_table
+                raise
+            cursor.connection.rollback()
+            return 0
+    
+    def _apply_migrations(self, cursor) -> list:
+        """
+        Apply pending migrations from MIGRATIONS in one transaction.
+        
+        An advisory lock serializes concurrent migrators (e.g. a cron run
+        starting while the daemon upgrades), and the version is re-read once
+        the lock is held.
+        
+        Returns:
+            list: Versions applied
+        """
+        conn = cursor.connection
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (self.MIGRATION_LOCK_ID,))
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+        current = cursor.fetchone()[0]
+        
+        applied = []
+        for version, description, method in self.MIGRATIONS:
+            if version <= current:
+                continue
+            getattr(self, method)(cursor)
+            cursor.execute(
+                "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                (version, description)
+            )
+            applied.append(version)
+            print(f"Applied migration {version}: {description}")
+        
+        conn.commit()
+        if applied:
+            print(f"Database schema at version {applied[-1]}: {self.db_config['database']} on {self.db_config['host']}")
+        return applied
+    
+    def migrate(self) -> int:
+        """
+        Apply any pending schema migrations.
+        
+        Returns:
+            int: Schema version after migrating
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        self._apply_migrations(cursor)
+        version = self._get_schema_version(cursor)
+        cursor.close()
+        self._release_connection(conn)
+        return version
+    
+    def _events_partitioned(self, cursor) -> bool:
+        """Return True if events is a partitioned table (see partition_events)."""
+        cursor.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('events')")
+        row = cursor.fetchone()
+        return bool(row and row[0])
+    
+    @staticmethod
+    def _add_months(value: datetime, months: int) -> datetime:
+        """Return the first day of the month `months` after value's month."""
+        index = value.year * 12 + value.month - 1 + months
+        return datetime(index // 12, index % 12 + 1, 1)
+    
+    def partition_events(self) -> dict:
+        """
+        Convert events into a table partitioned by month of call_created.
+        
+        Runs in one transaction that holds an exclusive lock on events while
+        the rows are copied, so ingestion waits until it finishes. The new
+        table gets the old columns, defaults, id sequence, indexes and
+        triggers. Monthly partitions cover the stored rows up to
+        PARTITION_MONTHS_AHEAD months from now; events_default takes rows
+        without call_created or beyond the last partition.
+        
+        A partitioned table can only hold unique indexes that contain the
+        partition key itself, so the composite key index becomes one unique
+        index per partition (still unique overall, since a call date never
+        spans two months), and upserts switch from ON CONFLICT to
+        update-then-insert.
+        
+        Returns:
+            dict: Partitions created and rows moved (zeros if already partitioned)
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
         
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (self.MIGRATION_LOCK_ID,))
+        if self._events_partitioned(cursor):
+            conn.rollback()
+            cursor.close()
+            self._release_connection(conn)
+            print("events is already partitioned")
+            return {'partitions_created': 0, 'rows_moved': 0}
+        
+        cursor.execute("LOCK TABLE events IN ACCESS EXCLUSIVE MODE")
+        
+        # Definitions are read before the rename so they still say "ON events"
+        cursor.execute("""
+            SELECT pg_get_indexdef(indexrelid)
+            FROM pg_index
+            WHERE indrelid = 'events'::regclass AND NOT indisunique
+        """)
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute("""
+            SELECT pg_get_triggerdef(oid)
+            FROM pg_trigger
+            WHERE tgrelid = 'events'::regclass AND NOT tgisinternal
+        """)
+        triggers = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT pg_get_serial_sequence('events', 'id')")
+        sequence = cursor.fetchone()[0]
+        cursor.execute("SELECT MIN(call_created) FROM events")
+        first = cursor.fetchone()[0]
+        
+        cursor.execute("ALTER TABLE events RENAME TO events_unpartitioned")
+        cursor.execute("""
+            CREATE TABLE events (LIKE events_unpartitioned INCLUDING DEFAULTS)
+            PARTITION BY RANGE (call_created)
+        """)
+        if sequence:
+            cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY events.id")
+        cursor.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+        self._create_identity_index(cursor, 'events_default')
+        
+        now = datetime.now()
+        created = self._ensure_partitions(cursor, now, first=min(first or now, now))
+        
+        cursor.execute("INSERT INTO events SELECT * FROM events_unpartitioned")
+        moved = cursor.rowcount
+        cursor.execute("DROP TABLE events_unpartitioned")
+        
+        for definition in indexes:
+            cursor.execute(definition)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_id ON events (id)")
+        for definition in triggers:
+            cursor.execute(definition)
+        
+        conn.commit()
+        cursor.close()
+        self._release_connection(conn)
+        
+        self._partitioned = True
+        self._has_identity_index = False
+        print(f"Partitioned events: {moved} rows in {len(created)} monthly partitions plus events_default")
+        return {'partitions_created': len(created), 'rows_moved': moved}
+    
+    def _ensure_partitions(self, cursor, now: datetime, first: Optional[datetime] = None) -> list:
+        """
+        Create missing monthly events partitions (caller commits).
+        
+        Covers first's month (default: now's) through PARTITION_MONTHS_AHEAD
+        months past now. The advisory migration lock keeps concurrent
+        ingesters from creating the same partition.
+        
+        Returns:
+            list: Names of the partitions created
+        """
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (self.MIGRATION_LOCK_ID,))
+        month = self._add_months(first or now, 0)
+        last = self._add_months(now, self.PARTITION_MONTHS_AHEAD)
+        
+        created = []
+        while month <= last:
+            name = f"events_{month:%Y_%m}"
+            upper = self._add_months(month, 1)
+            cursor.execute("SELECT to_regclass(%s)", (name,))
+            if cursor.fetchone()[0] is None:
+                self._create_partition(cursor, name, month, upper)
+                created.append(name)
+            month = upper
+        
+        self._partition_month = (now.year, now.month)
+        return created
+    
+    def _create_partition(self, cursor, name: str, lower: datetime, upper: datetime):
+        """
+        Create the events partition for [lower, upper).
+        
+        A partition cannot be added while events_default holds rows in its
+        range (e.g. a backfill ran past the prepared months), so such rows
+        are moved into the new table before it is attached.
+        """
+        bounds = (lower.strftime('%Y-%m-%d'), upper.strftime('%Y-%m-%d'))
+        cursor.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM events_default
+                WHERE call_created >= %s::timestamp AND call_created < %s::timestamp
+            )
+        """, bounds)
+        if cursor.fetchone()[0]:
+            cursor.execute(f"CREATE TABLE {name} (LIKE events INCLUDING DEFAULTS)")
+            cursor.execute(f"""
+                WITH moved AS (
+                    DELETE FROM events_default
+                    WHERE call_created >= %s::timestamp AND call_created < %s::timestamp
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+            """, bounds)
+            cursor.execute(f"ALTER TABLE events ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)", bounds)
+        else:
+            cursor.execute(f"CREATE TABLE {name} PARTITION OF events FOR VALUES FROM (%s) TO (%s)", bounds)
+        self._create_identity_index(cursor, name)
+    
+    def _create_identity_index(self, cursor, table: str):
+        """
+        Create the unique composite key index on events or one of its partitions.
+        
+        Call numbers are only unique per source (agencies reuse them), so
+        the key is call number, call date and source_token.
+        """
+        name = 'idx_events_identity' if table == 'events' else f"{table}_identity"
+        cursor.execute(f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS {name}
+            ON {table} (call_number, (call_created::date), source_token)
+        """)
+    
+    def _maintain_partitions(self, cursor, now: datetime):
+        """
+        Create upcoming partitions when a resident process enters a new month.
+        
+        Runs in its own transaction, committed before the poll's writes.
+        """
+        if self._partition_month == (now.year, now.month):
+            return
+        self._ensure_partitions(cursor, now)
+        cursor.connection.commit()
+    
+    def ensure_partitions(self) -> list:
+        """
+        Create any missing upcoming partitions of a partitioned events table.
+        
+        Returns:
+            list: Names of the partitions created (empty if events is not partitioned)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        created = []
+        if self._events_partitioned(cursor):
+            created = self._ensure_partitions(cursor, datetime.now())
+        conn.commit()
+        cursor.close()
+        self._release_connection(conn)
+        return created
+    
+    def _migrate_base_schema(self, cursor):
+        """Migration 1: events, ingestion_log, column_definitions and source_metadata."""
         # Create main events table with ALL possible fields
         # NOTE: call_number + call_created date is the unique identifier, NOT event_id (which changes every API call)
         cursor.execute("""
@@ -242,135 +942,1519 @@ class DispatchIngester:
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        print(f"Database initialized: {self.db_config['database']} on {self.db_config['host']}")
     
-    def fetch_data(self) -> dict:
+    def _migrate_identity_index(self, cursor):
         """
-        Fetch current dispatch data from the API.
+        Migration 2: unique index on (call_number, call_created::date).
         
-        Returns:
-            dict: Raw API response containing columns and rows
+        Lookups and ON CONFLICT upserts on the composite key become index-only.
+        Duplicate keys written before the index existed are merged first.
         """
-        params = {"pubToken": self.pub_token}
-        
-        try:
-            response = requests.get(self.BASE_URL, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            raise Exception(f"Failed to fetch data: {e}")
+        groups, removed = self._merge_duplicates(cursor, by_source=False)
+        if groups:
+            print(f"Merged {groups} duplicate groups ({removed} rows removed)")
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_events_identity
+            ON events (call_number, (call_created::date))
+        """)
     
-    def _parse_datetime(self, value: str) -> Optional[datetime]:
-        """Parse datetime string from API response."""
-        if not value:
-            return None
-        try:
-            # Handle format like "2025-12-10T10:34:30.603"
-            return datetime.fromisoformat(value.replace('Z', '+00:00'))
-        except (ValueError, TypeError):
-            return None
+    def _migrate_poll_state(self, cursor):
+        """Migration 3: conditional-fetch validators and fingerprint of the last stored poll."""
+        cursor.execute("""
+            ALTER TABLE source_metadata
+                ADD COLUMN IF NOT EXISTS etag TEXT,
+                ADD COLUMN IF NOT EXISTS http_last_modified TEXT,
+                ADD COLUMN IF NOT EXISTS payload_hash TEXT,
+                ADD COLUMN IF NOT EXISTS last_polled TIMESTAMP
+        """)
     
-    def _save_source_metadata(self, cursor, data: dict):
-        """Save source metadata from API response."""
+    def _migrate_metadata_hash(self, cursor):
+        """Migration 4: fingerprint of the stored source metadata and column header."""
         cursor.execute("""
-            INSERT INTO source_metadata (
-                source_token, title, logo_url, disclaimer, time_format,
-                filters, default_sort_column, default_sort_direction, last_updated
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-            ON CONFLICT (source_token) DO UPDATE SET
-                title = EXCLUDED.title,
-                logo_url = EXCLUDED.logo_url,
-                disclaimer = EXCLUDED.disclaimer,
-                time_format = EXCLUDED.time_format,
-                filters = EXCLUDED.filters,
-                default_sort_column = EXCLUDED.default_sort_column,
-                default_sort_direction = EXCLUDED.default_sort_direction,
-                last_updated = CURRENT_TIMESTAMP
-        """, (
-            self.pub_token,
-            data.get('title'),
-            data.get('logoUrl'),
-            data.get('disclaimer'),
-            data.get('timeFormat'),
-            json.dumps(data.get('filters', [])),
-            data.get('defaultSortColumn'),
-            data.get('defaultSortDirection')
-        ))
+            ALTER TABLE source_metadata
+                ADD COLUMN IF NOT EXISTS metadata_hash TEXT
+        """)
     
-    def _save_column_definitions(self, cursor, columns: list):
-        """Save column definitions from API response."""
-        for i, col in enumerate(columns):
-            cursor.execute("""
-                INSERT INTO column_definitions (source_token, column_field, column_header, column_order, last_updated)
-                VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP)
-                ON CONFLICT (source_token, column_field) DO UPDATE SET
-                    column_header = EXCLUDED.column_header,
-                    column_order = EXCLUDED.column_order,
-                    last_updated = CURRENT_TIMESTAMP
-            """, (
-                self.pub_token,
-                col.get('field'),
-                col.get('header'),
-                i
-            ))
+    def _migrate_rollups(self, cursor):
+        """
+        Migration 5: event_rollups, event counts by hour of call_created.
+        
+        Counts are kept per (hour, agency type, jurisdiction, call type).
+        Triggers on events apply each INSERT, UPDATE or DELETE to the
+        rollups in the same transaction, whichever engine or command writes
+        the rows (see _create_rollup_triggers). A NULL key column is stored
+        as '' and a NULL call_created under hour '-infinity'.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS event_rollups (
+                hour TIMESTAMP NOT NULL,
+                agency_type TEXT NOT NULL,
+                jurisdiction TEXT NOT NULL,
+                call_type TEXT NOT NULL,
+                events BIGINT NOT NULL,
+                PRIMARY KEY (hour, agency_type, jurisdiction, call_type)
+            )
+        """)
+        self._create_rollup_triggers(cursor)
+        self._rebuild_rollups(cursor)
     
-    def _map_row_to_event(self, row: dict, columns: list, source_title: str) -> dict:
+    def _create_rollup_triggers(self, cursor):
         """
-        Map a raw row to a structured event dictionary.
+        (Re)create events_update_rollups() and the events_rollups_* triggers.
+        
+        Inserts and deletes are applied by statement triggers, one upsert
+        per statement from the transition tables. Updates use a row trigger
+        on UPDATE OF the four columns the rollup key is made of, with a WHEN
+        guard on the same columns, so polls that only bump last_seen and
+        times_seen neither fire it nor collect transition tables.
+        """
+        key = ('call_created', 'agency_type', 'jurisdiction', 'call_type')
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION events_update_rollups() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                -- Each trigger can only read the transition tables it declares.
+                -- Keys are upserted in order, so concurrent writers lock
+                -- rollup rows in the same order.
+                IF TG_OP = 'INSERT' THEN
+                    INSERT INTO event_rollups (hour, agency_type, jurisdiction, call_type, events)
+                    SELECT COALESCE(date_trunc('hour', call_created), '-infinity'),
+                           COALESCE(agency_type, ''), COALESCE(jurisdiction, ''),
+                           COALESCE(call_type, ''), COUNT(*)
+                    FROM new_rows
+                    GROUP BY 1, 2, 3, 4
+                    ORDER BY 1, 2, 3, 4
+                    ON CONFLICT (hour, agency_type, jurisdiction, call_type)
+                    DO UPDATE SET events = event_rollups.events + EXCLUDED.events;
+                ELSIF TG_OP = 'UPDATE' THEN
+                    INSERT INTO event_rollups (hour, agency_type, jurisdiction, call_type, events)
+                    SELECT COALESCE(date_trunc('hour', call_created), '-infinity'),
+                           COALESCE(agency_type, ''), COALESCE(jurisdiction, ''),
+                           COALESCE(call_type, ''), SUM(events)
+                    FROM (VALUES
+                        (NEW.call_created, NEW.agency_type, NEW.jurisdiction, NEW.call_type, 1),
+                        (OLD.call_created, OLD.agency_type, OLD.jurisdiction, OLD.call_type, -1)
+                    ) AS changed (call_created, agency_type, jurisdiction, call_type, events)
+                    GROUP BY 1, 2, 3, 4
+                    HAVING SUM(events) <> 0
+                    ORDER BY 1, 2, 3, 4
+                    ON CONFLICT (hour, agency_type, jurisdiction, call_type)
+                    DO UPDATE SET events = event_rollups.events + EXCLUDED.events;
+                ELSE
+                    INSERT INTO event_rollups (hour, agency_type, jurisdiction, call_type, events)
+                    SELECT COALESCE(date_trunc('hour', call_created), '-infinity'),
+                           COALESCE(agency_type, ''), COALESCE(jurisdiction, ''),
+                           COALESCE(call_type, ''), -COUNT(*)
+                    FROM old_rows
+                    GROUP BY 1, 2, 3, 4
+                    ORDER BY 1, 2, 3, 4
+                    ON CONFLICT (hour, agency_type, jurisdiction, call_type)
+                    DO UPDATE SET events = event_rollups.events + EXCLUDED.events;
+                END IF;
+                RETURN NULL;
+            END
+            $$
+        """)
+        for event, clause in (
+            ('INSERT', 'AFTER INSERT ON events REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT'),
+            ('UPDATE', f"""AFTER UPDATE OF {', '.join(key)} ON events FOR EACH ROW
+                WHEN (({', '.join(f'OLD.{name}' for name in key)})
+                      IS DISTINCT FROM ({', '.join(f'NEW.{name}' for name in key)}))"""),
+            ('DELETE', 'AFTER DELETE ON events REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT'),
+        ):
+            name = f"events_rollups_{event.lower()}"
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON events")
+            cursor.execute(f"""
+                CREATE TRIGGER {name}
+                {clause}
+                EXECUTE FUNCTION events_update_rollups()
+            """)
+    
+    def _rebuild_rollups(self, cursor) -> int:
+        """
+        Recount event_rollups from events (caller commits).
+        
+        events is locked against writes while it is scanned, so no statement
+        can change it between the count and the commit.
+        
+        Returns:
+            int: Rollup rows written
+        """
+        cursor.execute("LOCK TABLE events IN SHARE MODE")
+        cursor.execute("DELETE FROM event_rollups")
+        cursor.execute("""
+            INSERT INTO event_rollups (hour, agency_type, jurisdiction, call_type, events)
+            SELECT COALESCE(date_trunc('hour', call_created), '-infinity'),
+                   COALESCE(agency_type, ''), COALESCE(jurisdiction, ''),
+                   COALESCE(call_type, ''), COUNT(*)
+            FROM events
+            GROUP BY 1, 2, 3, 4
+        """)
+        return cursor.rowcount
+    
+    def _migrate_incident_key(self, cursor):
+        """
+        Migration 6: incident_key and is_canonical on events.
+        
+        The feed can list one incident under several call numbers. Rows with
+        the same call type, address, call_created and jurisdiction share an
+        incident_key (an md5 of those fields, NULLs included), and the one
+        first seen most recently is canonical, the row that readers'
+        DISTINCT ON (call_type, address, call_created, jurisdiction) kept.
+        Readers filter on is_canonical (idx_events_canonical) instead.
+        
+        A row trigger sets the key as rows are written, and AFTER triggers
+        re-elect the canonical row of every incident an INSERT, UPDATE or
+        DELETE touched, in the same transaction (see
+        _create_canonical_triggers).
+        """
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION events_incident_key(
+                call_type TEXT, address TEXT, call_created TIMESTAMP, jurisdiction TEXT
+            ) RETURNS TEXT
+            LANGUAGE sql IMMUTABLE AS $$
+                SELECT md5(format(
+                    '%L|%L|%L|%L', call_type, address,
+                    to_char(call_created, 'YYYY-MM-DD HH24:MI:SS.US'), jurisdiction
+                ))
+            $$
+        """)
+        cursor.execute("""
+            ALTER TABLE events
+                ADD COLUMN IF NOT EXISTS incident_key TEXT,
+                ADD COLUMN IF NOT EXISTS is_canonical BOOLEAN NOT NULL DEFAULT true
+        """)
+        
+        # Backfill in one pass; the flags are net zero for event_rollups
+        cursor.execute("ALTER TABLE events DISABLE TRIGGER events_rollups_update")
+        cursor.execute("""
+            UPDATE events e SET
+                incident_key = k.incident_key,
+                is_canonical = k.rank = 1
+            FROM (
+                SELECT id, incident_key,
+                       row_number() OVER (
+                           PARTITION BY incident_key ORDER BY first_seen DESC, id DESC
+                       ) AS rank
+                FROM (
+                    SELECT id, first_seen,
+                           events_incident_key(call_type, address, call_created, jurisdiction) AS incident_key
+                    FROM events
+                ) AS keyed
+            ) AS k
+            WHERE e.id = k.id
+        """)
+        cursor.execute("ALTER TABLE events ENABLE TRIGGER events_rollups_update")
+        
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_incident_key ON events (incident_key)")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_events_canonical
+            ON events (call_created DESC) WHERE is_canonical
+        """)
+        
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION events_set_incident_key() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                NEW.incident_key := events_incident_key(
+                    NEW.call_type, NEW.address, NEW.call_created, NEW.jurisdiction
+                );
+                IF TG_OP = 'INSERT' THEN
+                    -- A new row is its incident's most recently seen one
+                    NEW.is_canonical := true;
+                END IF;
+                RETURN NEW;
+            END
+            $$
+        """)
+        self._create_canonical_triggers(cursor)
+    
+    def _create_canonical_triggers(self, cursor):
+        """
+        (Re)create events_update_canonical() and the triggers that keep
+        incident_key and is_canonical current.
+        
+        Inserts and deletes re-elect from statement triggers reading the
+        transition tables. Only a new incident key or first_seen can change
+        an election, so updates use a row trigger on UPDATE OF the columns
+        those come from, with a WHEN guard on the two: bumps of last_seen
+        and times_seen never fire it, and neither does the flag update the
+        election itself makes.
+        """
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION events_update_canonical() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                keys TEXT[];
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    SELECT array_agg(DISTINCT incident_key) INTO keys FROM new_rows;
+                ELSIF TG_OP = 'UPDATE' THEN
+                    keys := ARRAY[NEW.incident_key, OLD.incident_key];
+                ELSE
+                    SELECT array_agg(DISTINCT incident_key) INTO keys
+                    FROM old_rows WHERE is_canonical;
+                END IF;
+                
+                IF keys IS NULL THEN
+                    RETURN NULL;
+                END IF;
+                UPDATE events e SET is_canonical = (e.id = c.id)
+                FROM (
+                    SELECT DISTINCT ON (incident_key) incident_key, id
+                    FROM events
+                    WHERE incident_key = ANY(keys)
+                    ORDER BY incident_key, first_seen DESC, id DESC
+                ) AS c
+                WHERE e.incident_key = c.incident_key
+                  AND e.is_canonical IS DISTINCT FROM (e.id = c.id);
+                RETURN NULL;
+            END
+            $$
+        """)
+        cursor.execute("DROP TRIGGER IF EXISTS events_incident_key ON events")
+        cursor.execute("""
+            CREATE TRIGGER events_incident_key
+            BEFORE INSERT OR UPDATE OF call_type, address, call_created, jurisdiction ON events
+            FOR EACH ROW EXECUTE FUNCTION events_set_incident_key()
+        """)
+        for event, clause in (
+            ('INSERT', 'AFTER INSERT ON events REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT'),
+            ('UPDATE', """AFTER UPDATE OF call_type, address, call_created, jurisdiction, first_seen, incident_key
+                ON events FOR EACH ROW
+                WHEN ((OLD.incident_key, OLD.first_seen) IS DISTINCT FROM (NEW.incident_key, NEW.first_seen))"""),
+            ('DELETE', 'AFTER DELETE ON events REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT'),
+        ):
+            name = f"events_canonical_{event.lower()}"
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON events")
+            cursor.execute(f"""
+                CREATE TRIGGER {name}
+                {clause}
+                EXECUTE FUNCTION events_update_canonical()
+            """)
+    
+    def _migrate_facet_counts(self, cursor):
+        """
+        Migration 7: facet_counts, canonical events per filter value.
+        
+        Rows of facet 'agency_type' and 'jurisdiction' count events by that
+        column; rows of facet 'call_type' count them by call type and agency
+        type. Only canonical rows are counted (see _migrate_incident_key),
+        NULL is stored as ''. Triggers on events apply each write, including
+        canonical flags flipped by the incident key trigger, in the same
+        transaction (see _create_facet_triggers).
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS facet_counts (
+                facet TEXT NOT NULL,
+                value TEXT NOT NULL,
+                agency_type TEXT NOT NULL,
+                events BIGINT NOT NULL,
+                PRIMARY KEY (facet, value, agency_type)
+            )
+        """)
+        self._create_facet_triggers(cursor)
+        self._rebuild_facets(cursor)
+    
+    def _create_facet_triggers(self, cursor):
+        """
+        (Re)create events_update_facets() and the events_facets_* triggers.
+        
+        Inserts and deletes are applied by statement triggers, one upsert
+        per statement from the transition tables. Updates use a row trigger
+        on UPDATE OF the counted columns and is_canonical, with a WHEN guard
+        on the same columns, so polls that only bump last_seen and
+        times_seen neither fire it nor collect transition tables.
+        """
+        counted = ('call_type', 'jurisdiction', 'agency_type', 'is_canonical')
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION events_update_facets() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                changed TEXT;
+            BEGIN
+                -- Each trigger can only read the transition tables it declares
+                IF TG_OP = 'INSERT' THEN
+                    changed := 'SELECT call_type, jurisdiction, agency_type, 1 AS events
+                                FROM new_rows WHERE is_canonical';
+                ELSIF TG_OP = 'UPDATE' THEN
+                    changed := 'SELECT ($1).call_type, ($1).jurisdiction, ($1).agency_type, 1 AS events
+                                WHERE ($1).is_canonical
+                                UNION ALL
+                                SELECT ($2).call_type, ($2).jurisdiction, ($2).agency_type, -1
+                                WHERE ($2).is_canonical';
+                ELSE
+                    changed := 'SELECT call_type, jurisdiction, agency_type, -1 AS events
+                                FROM old_rows WHERE is_canonical';
+                END IF;
+                EXECUTE format($sql$
+                    INSERT INTO facet_counts (facet, value, agency_type, events)
+                    SELECT f.facet, f.value, f.agency_type, SUM(d.events)
+                    FROM (%s) AS d,
+                    LATERAL (VALUES
+                        ('agency_type', COALESCE(d.agency_type, ''), ''),
+                        ('jurisdiction', COALESCE(d.jurisdiction, ''), ''),
+                        ('call_type', COALESCE(d.call_type, ''), COALESCE(d.agency_type, ''))
+                    ) AS f (facet, value, agency_type)
+                    GROUP BY 1, 2, 3
+                    HAVING SUM(d.events) <> 0
+                    ORDER BY 1, 2, 3
+                    ON CONFLICT (facet, value, agency_type)
+                    DO UPDATE SET events = facet_counts.events + EXCLUDED.events
+                $sql$, changed) USING NEW, OLD;
+                RETURN NULL;
+            END
+            $$
+        """)
+        for event, clause in (
+            ('INSERT', 'AFTER INSERT ON events REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT'),
+            ('UPDATE', f"""AFTER UPDATE OF {', '.join(counted)} ON events FOR EACH ROW
+                WHEN (({', '.join(f'OLD.{name}' for name in counted)})
+                      IS DISTINCT FROM ({', '.join(f'NEW.{name}' for name in counted)}))"""),
+            ('DELETE', 'AFTER DELETE ON events REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT'),
+        ):
+            name = f"events_facets_{event.lower()}"
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON events")
+            cursor.execute(f"""
+                CREATE TRIGGER {name}
+                {clause}
+                EXECUTE FUNCTION events_update_facets()
+            """)
+    
+    def _rebuild_facets(self, cursor) -> int:
+        """
+        Recount facet_counts from the canonical events (caller commits).
+        
+        Returns:
+            int: Facet rows written
+        """
+        cursor.execute("LOCK TABLE events IN SHARE MODE")
+        cursor.execute("DELETE FROM facet_counts")
+        cursor.execute("""
+            INSERT INTO facet_counts (facet, value, agency_type, events)
+            SELECT f.facet, f.value, f.agency_type, COUNT(*)
+            FROM events e,
+            LATERAL (VALUES
+                ('agency_type', COALESCE(e.agency_type, ''), ''),
+                ('jurisdiction', COALESCE(e.jurisdiction, ''), ''),
+                ('call_type', COALESCE(e.call_type, ''), COALESCE(e.agency_type, ''))
+            ) AS f (facet, value, agency_type)
+            WHERE e.is_canonical
+            GROUP BY 1, 2, 3
+        """)
+        return cursor.rowcount
+    
+    def rebuild_facets(self) -> int:
+        """
+        Recount facet_counts from scratch.
+        
+        Like rebuild_rollups(), for repairs after changes that bypass the
+        triggers on events.
+        
+        Returns:
+            int: Facet rows written
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            rows = self._rebuild_facets(cursor)
+            conn.commit()
+        finally:
+            cursor.close()
+            self._release_connection(conn)
+        print(f"Rebuilt facet_counts: {rows} rows")
+        return rows
+    
+    def _migrate_event_changes(self, cursor):
+        """
+        Migration 8: event_changes outbox and change_consumers checkpoints.
+        
+        Triggers on events append one entry per inserted, changed or deleted
+        row, in the same transaction (see _create_change_triggers). An update
+        counts as a change when a column _content_hash compares differs, so
+        polls that only see a call again add nothing.
+        
+        seq comes from a bigserial and identifies an entry; entries are read
+        in the order of the transactions that wrote them (see
+        _migrate_change_order). Consumers read with changes_since(), record
+        their position with save_checkpoint(), and prune_changes() drops
+        entries every registered checkpoint has passed.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS event_changes (
+                seq BIGSERIAL PRIMARY KEY,
+                op TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                call_number TEXT,
+                call_created TIMESTAMP,
+                changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS change_consumers (
+                name TEXT PRIMARY KEY,
+                seq BIGINT NOT NULL,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self._create_change_triggers(cursor)
+    
+    def _create_change_triggers(self, cursor):
+        """
+        (Re)create events_record_changes() and the events_changes_* triggers.
+        
+        Inserts and deletes are recorded by statement triggers reading the
+        transition tables. Updates use a row trigger instead: transition
+        tables cannot be combined with an UPDATE OF column list, and the
+        list plus a WHEN guard on the same columns means bumps of last_seen
+        and times_seen never fire it, and rewrites that leave the content as
+        it was stop at the WHEN comparison without running the function.
+        The columns are the ones _content_hash compares.
+        """
+        content = Event._fields[1:-3] + Event._fields[-2:]
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION events_record_changes() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                -- Each trigger can only read the transition tables it declares
+                IF TG_OP = 'INSERT' THEN
+                    INSERT INTO event_changes (op, id, call_number, call_created)
+                    SELECT 'insert', id, call_number, call_created
+                    FROM new_rows ORDER BY id;
+                ELSIF TG_OP = 'UPDATE' THEN
+                    INSERT INTO event_changes (op, id, call_number, call_created)
+                    VALUES ('update', NEW.id, NEW.call_number, NEW.call_created);
+                ELSE
+                    INSERT INTO event_changes (op, id, call_number, call_created)
+                    SELECT 'delete', id, call_number, call_created
+                    FROM old_rows ORDER BY id;
+                END IF;
+                RETURN NULL;
+            END
+            $$
+        """)
+        for event, clause in (
+            ('INSERT', 'AFTER INSERT ON events REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT'),
+            ('UPDATE', f"""AFTER UPDATE OF {', '.join(content)} ON events FOR EACH ROW
+                WHEN (({', '.join(f'OLD.{name}' for name in content)})
+                      IS DISTINCT FROM ({', '.join(f'NEW.{name}' for name in content)}))"""),
+            ('DELETE', 'AFTER DELETE ON events REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT'),
+        ):
+            name = f"events_changes_{event.lower()}"
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON events")
+            cursor.execute(f"""
+                CREATE TRIGGER {name}
+                {clause}
+                EXECUTE FUNCTION events_record_changes()
+            """)
+    
+    def _migrate_source_identity(self, cursor):
+        """
+        Migration 9: source_token joins call_number and call date in the key.
+        
+        Two agencies polled by one database can use the same call number on
+        the same day; under the old key their calls were merged into one
+        row. Rows stored without a token are assigned the most recently
+        polled source's (or DEFAULT_TOKEN), the column becomes NOT NULL and
+        the identity indexes are rebuilt on the three columns.
+        """
+        cursor.execute("""
+            UPDATE events SET source_token = COALESCE(
+                (SELECT source_token FROM source_metadata
+                 ORDER BY last_polled DESC NULLS LAST, last_updated DESC NULLS LAST LIMIT 1),
+                %s
+            )
+            WHERE source_token IS NULL
+        """, (self.DEFAULT_TOKEN,))
+        cursor.execute("ALTER TABLE events ALTER COLUMN source_token SET NOT NULL")
+        if self._events_partitioned(cursor):
+            cursor.execute("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'events'::regclass")
+            for (partition,) in cursor.fetchall():
+                cursor.execute(f"DROP INDEX IF EXISTS {partition}_identity")
+                self._create_identity_index(cursor, partition)
+        else:
+            cursor.execute("SELECT to_regclass('idx_events_identity')")
+            if cursor.fetchone()[0] is not None:
+                cursor.execute("DROP INDEX idx_events_identity")
+                self._create_identity_index(cursor, 'events')
+    
+    def _migrate_change_triggers(self, cursor):
+        """
+        Migration 10: record updates with a content-column row trigger.
+        
+        The statement trigger from migration 8 joined the transition tables
+        and compared to_jsonb() of whole rows on every poll, including polls
+        that only bumped last_seen and times_seen.
+        """
+        self._create_change_triggers(cursor)
+    
+    def _migrate_rollup_triggers(self, cursor):
+        """
+        Migration 11: apply updates to event_rollups with a key-column row trigger.
+        
+        The statement trigger from migration 5 declared OLD and NEW
+        transition tables, so every update of events collected both, bumps
+        of last_seen and times_seen included.
+        """
+        self._create_rollup_triggers(cursor)
+    
+    def _migrate_canonical_triggers(self, cursor):
+        """
+        Migration 12: re-elect canonical rows on update from a row trigger.
+        
+        The statement trigger from migration 6 declared OLD and NEW
+        transition tables, so every update of events collected both, bumps
+        of last_seen and times_seen included.
+        """
+        self._create_canonical_triggers(cursor)
+    
+    def _migrate_facet_triggers(self, cursor):
+        """
+        Migration 13: apply updates to facet_counts with a row trigger.
+        
+        The statement trigger from migration 7 declared OLD and NEW
+        transition tables, so every update of events collected both, bumps
+        of last_seen and times_seen included.
+        """
+        self._create_facet_triggers(cursor)
+    
+    def _migrate_change_order(self, cursor):
+        """
+        Migration 14: xid on event_changes and change_consumers.
+        
+        Writers took an advisory lock until commit so that seq values became
+        visible in order, which serialized every transaction writing events.
+        Each entry now records the id of the transaction that wrote it
+        (column default, so the triggers and _drop_archived_partition need
+        not set it). changes_since() orders by (xid, seq) and only returns
+        entries of transactions older than the oldest one still running, so
+        nothing that sorts before an entry already read can commit later.
+        A checkpoint is the (xid, seq) of the last entry read; existing
+        entries and checkpoints all get this migration's xid, which keeps
+        their order.
+        """
+        cursor.execute("""
+            ALTER TABLE event_changes
+                ADD COLUMN IF NOT EXISTS xid xid8 NOT NULL DEFAULT pg_current_xact_id()
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_event_changes_xid ON event_changes (xid, seq)")
+        cursor.execute("""
+            ALTER TABLE change_consumers
+                ADD COLUMN IF NOT EXISTS xid xid8 NOT NULL DEFAULT pg_current_xact_id()
+        """)
+        cursor.execute("ALTER TABLE change_consumers ALTER COLUMN xid DROP DEFAULT")
+        self._create_change_triggers(cursor)
+    
+    def rebuild_rollups(self) -> int:
+        """
+        Recount event_rollups from scratch.
+        
+        The triggers keep the rollups current; this repairs them after
+        changes that bypass triggers, such as TRUNCATE, a restore of events
+        alone, or ALTER TABLE ... DISABLE TRIGGER.
+        
+        Returns:
+            int: Rollup rows written
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            rows = self._rebuild_rollups(cursor)
+            conn.commit()
+        finally:
+            cursor.close()
+            self._release_connection(conn)
+        print(f"Rebuilt event_rollups: {rows} rows")
+        return rows
+    
+    def fetch_data(self) -> Optional[dict]:
+        """
+        Fetch current dispatch data from the API.
+        
+        Sends If-None-Match / If-Modified-Since when the previous stored poll
+        recorded an ETag or Last-Modified header from the server. ingest()
+        does not use this; it parses the spooled body in passes (_fetch_payload).
+        
+        Returns:
+            dict: Raw API response containing columns and rows, or None if the
+                  server answered 304 Not Modified
+        """
+        payload = self._fetch_payload()
+        if payload is None:
+            return None
+        with payload:
+            return json_codec()[1](payload.read())
+    
+    def _fetch_payload(self):
+        """
+        Fetch the current response body without parsing it.
+        
+        The body is streamed into a SpooledTemporaryFile, in memory up to
+        SPOOL_MAX_MEMORY and on disk beyond, so a large feed never has to be
+        held as one bytes object plus its parsed form.
+        
+        Returns:
+            Binary file positioned at the start of the (decompressed) body, or
+            None if the server answered 304 Not Modified
+        """
+        import tempfile
+        import requests
+        
+        params = {"pubToken": self.pub_token}
+        headers = {}
+        
+        state = self._poll_state or {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('http_last_modified'):
+            headers['If-Modified-Since'] = state['http_last_modified']
+        
+        payload = None
+        try:
+            if self._session is None:
+                self._session = self.create_http_session()
+            with self._session.get(
+                self.BASE_URL,
+                params=params,
+                headers=headers,
+                timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT),
+                stream=True
+            ) as response:
+                if response.status_code == 304:
+                    return None
+                response.raise_for_status()
+                self._response_validators = {
+                    'etag': response.headers.get('ETag'),
+                    'http_last_modified': response.headers.get('Last-Modified')
+                }
+                payload = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_MEMORY)
+                for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                    payload.write(chunk)
+            payload.seek(0)
+            return payload
+        except requests.RequestException as e:
+            if payload is not None:
+                payload.close()
+            raise Exception(f"Failed to fetch data: {e}")
+    
+    def _scan_payload(self, payload) -> tuple:
+        """
+        First pass over a spooled response: metadata, row count and fingerprint.
+        
+        Rows are parsed one at a time, hashed without their per-request EventID
+        and dropped, so memory stays flat however many rows the feed carries.
+        They get their own digest, combined with the metadata at the end,
+        because the metadata members may come before or after the rows.
+        
+        Args:
+            payload: Spooled response body from _fetch_payload
+        
+        Returns:
+            tuple: (metadata without rows, row count, SHA-256 hex fingerprint)
+        """
+        import hashlib
+        
+        dumps = json_codec()[2]
+        metadata = {}
+        rows = hashlib.sha256()
+        count = 0
+        for key, value in self._payload_members(payload):
+            if key == 'rows':
+                content = {field: item for field, item in value.items() if field != 'EventID'}
+                rows.update(dumps(content, sort_keys=True))
+                count += 1
+            else:
+                metadata[key] = value
+        
+        digest = hashlib.sha256(dumps(metadata, sort_keys=True))
+        digest.update(rows.digest())
+        return metadata, count, digest.hexdigest()
+    
+    def _payload_members(self, payload):
+        """
+        Yield (key, value) for the members of a spooled response, rows one by one.
+        
+        Bodies up to WHOLE_PARSE_MAX_BYTES are parsed in a single call by the
+        JSON backend (orjson when installed), which is the fastest route for
+        a normal feed. Larger bodies go through the incremental iter_payload()
+        so memory stays bounded.
+        
+        Args:
+            payload: Spooled response body from _fetch_payload
+        """
+        payload.seek(0, os.SEEK_END)
+        size = payload.tell()
+        payload.seek(0)
+        if size > self.WHOLE_PARSE_MAX_BYTES:
+            yield from iter_payload(payload, chunk_size=self.STREAM_CHUNK_SIZE)
+            return
+        
+        data = json_codec()[1](payload.read())
+        if not isinstance(data, dict):
+            raise ValueError("Expected a JSON object in the API response")
+        for key, value in data.items():
+            if key == 'rows' and isinstance(value, list):
+                for row in value:
+                    yield key, row
+            else:
+                yield key, value
+    
+    def _row_chunks(self, payload):
+        """
+        Second pass over a spooled response: yield its rows in lists of UPSERT_PAGE_SIZE.
+        
+        Args:
+            payload: Spooled response body from _fetch_payload
+        """
+        chunk = []
+        for key, row in self._payload_members(payload):
+            if key != 'rows':
+                continue
+            chunk.append(row)
+            if len(chunk) == self.UPSERT_PAGE_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def _load_poll_state(self, cursor) -> dict:
+        """Load HTTP validators and payload/metadata fingerprints of the last stored poll."""
+        cursor.execute("""
+            SELECT etag, http_last_modified, payload_hash, last_polled, metadata_hash
+            FROM source_metadata
+            WHERE source_token = %s
+        """, (self.pub_token,))
+        row = cursor.fetchone()
+        if not row:
+            return {}
+        return dict(zip(('etag', 'http_last_modified', 'payload_hash', 'last_polled', 'metadata_hash'), row))
+    
+    def _save_poll_state(self, cursor):
+        """Persist the current poll state so the next (cron) run can compare against it."""
+        cursor.execute("""
+            UPDATE source_metadata SET
+                etag = %s,
+                http_last_modified = %s,
+                payload_hash = %s,
+                last_polled = %s,
+                metadata_hash = %s
+            WHERE source_token = %s
+        """, (
+            self._poll_state.get('etag'),
+            self._poll_state.get('http_last_modified'),
+            self._poll_state.get('payload_hash'),
+            self._poll_state.get('last_polled'),
+            self._poll_state.get('metadata_hash'),
+            self.pub_token
+        ))
+    
+    def _touch_unchanged(self, cursor, now: datetime) -> int:
+        """
+        Bump last_seen and times_seen for events of an unchanged payload.
+        
+        The previous poll stamped every event it saw with last_seen equal to
+        its poll time, so those rows are exactly the ones to carry forward.
+        times_seen goes up by one, as for a call listed once by a parsed
+        poll (the body is not parsed here, so a call listed twice in the
+        same response counts once).
+        
+        Returns:
+            int: Number of events touched
+        """
+        cursor.execute(
+            """
+            UPDATE events SET last_seen = %s, times_seen = times_seen + 1
+            WHERE source_token = %s AND last_seen = %s
+            """,
+            (now, self.pub_token, self._poll_state['last_polled'])
+        )
+        return cursor.rowcount
+    
+    def _parse_datetime(self, value: str) -> Optional[datetime]:
+        """
+        Parse datetime string from API response.
+        
+        Parsed values are remembered in a dict that starts over once it holds
+        DATETIME_CACHE_SIZE strings, so a timestamp repeated across polls is
+        parsed once (datetime objects are immutable and safe to share). The
+        usual "2025-12-10T10:34:30.603" shape goes to fromisoformat() as is;
+        only other shapes (a trailing Z, for one) are normalized first.
+        
+        Storing a miss costs more than the parse itself, so when a window of
+        DATETIME_WINDOW_MISSES misses saw fewer than one hit per eight
+        misses, the next DATETIME_SKIP_CALLS calls skip the cache and only
+        parse, as before memoization. The window after that uses the cache
+        again and is judged the same way.
+        """
+        skip = self._datetime_skip
+        if skip:
+            self._datetime_skip = skip - 1
+            try:
+                return datetime.fromisoformat(value)
+            except TypeError:
+                return None
+            except ValueError:
+                try:
+                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+                except ValueError:
+                    return None
+        
+        if type(value) is not str:
+            return None
+        cache = self._datetime_cache
+        parsed = cache.get(value)
+        if parsed is not None:
+            self._datetime_hits += 1
+            return parsed
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+        
+        misses = self._datetime_misses + 1
+        if misses >= self.DATETIME_WINDOW_MISSES:
+            if self._datetime_hits * 8 < misses:
+                self._datetime_skip = self.DATETIME_SKIP_CALLS
+            self._datetime_hits = misses = 0
+        self._datetime_misses = misses
+        if len(cache) >= self.DATETIME_CACHE_SIZE:
+            cache.clear()
+        cache[value] = parsed
+        return parsed
+    
+    def _save_source_metadata(self, cursor, data: dict):
+        """Save source metadata from API response."""
+        import json
+        
+        cursor.execute("""
+            INSERT INTO source_metadata (
+                source_token, title, logo_url, disclaimer, time_format,
+                filters, default_sort_column, default_sort_direction, last_updated
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (source_token) DO UPDATE SET
+                title = EXCLUDED.title,
+                logo_url = EXCLUDED.logo_url,
+                disclaimer = EXCLUDED.disclaimer,
+                time_format = EXCLUDED.time_format,
+                filters = EXCLUDED.filters,
+                default_sort_column = EXCLUDED.default_sort_column,
+                default_sort_direction = EXCLUDED.default_sort_direction,
+                last_updated = CURRENT_TIMESTAMP
+        """, (
+            self.pub_token,
+            data.get('title'),
+            data.get('logoUrl'),
+            data.get('disclaimer'),
+            data.get('timeFormat'),
+            json.dumps(data.get('filters', [])),
+            data.get('defaultSortColumn'),
+            data.get('defaultSortDirection')
+        ))
+    
+    def _save_column_definitions(self, cursor, columns: list):
+        """Save column definitions from API response in one statement."""
+        from psycopg2.extras import execute_values
+        
+        rows = self._column_rows(columns)
+        if not rows:
+            return
+        execute_values(cursor, """
+            INSERT INTO column_definitions (source_token, column_field, column_header, column_order, last_updated)
+            VALUES %s
+            ON CONFLICT (source_token, column_field) DO UPDATE SET
+                column_header = EXCLUDED.column_header,
+                column_order = EXCLUDED.column_order,
+                last_updated = CURRENT_TIMESTAMP
+        """, rows, template='(%s, %s, %s, %s, CURRENT_TIMESTAMP)', page_size=len(rows))
+    
+    def _column_rows(self, columns: list) -> list:
+        """
+        Build (source_token, field, header, order) rows for column_definitions.
+        
+        A field listed twice keeps its last header and position, as writing
+        the columns one by one would; a single upsert cannot touch a row twice.
+        """
+        rows = {}
+        for i, col in enumerate(columns):
+            rows[col.get('field')] = (self.pub_token, col.get('field'), col.get('header'), i)
+        return list(rows.values())
+    
+    def _metadata_fingerprint(self, metadata: dict) -> str:
+        """
+        Hash the metadata fields and column header that get stored.
+        
+        Args:
+            metadata: Non-row members of the API response (see _scan_payload)
+        
+        Returns:
+            str: Hex digest compared with metadata_hash from the last poll
+        """
+        import hashlib
+        
+        stored = {
+            key: metadata.get(key) for key in (
+                'title', 'logoUrl', 'disclaimer', 'timeFormat', 'filters',
+                'defaultSortColumn', 'defaultSortDirection'
+            )
+        }
+        stored['columns'] = [(col.get('field'), col.get('header')) for col in metadata.get('columns', [])]
+        return hashlib.sha256(json_codec()[2](stored, sort_keys=True)).hexdigest()
+    
+    def _save_metadata(self, cursor, metadata: dict) -> bool:
+        """
+        Save source metadata and column definitions if they changed.
+        
+        They almost never do, so they are fingerprinted and compared with the
+        hash stored with the last poll; an unchanged header costs no writes.
+        The new hash is saved with the poll state.
+        
+        Returns:
+            bool: True if they were written
+        """
+        fingerprint = self._metadata_fingerprint(metadata)
+        if fingerprint == self._poll_state.get('metadata_hash'):
+            return False
+        
+        self._save_source_metadata(cursor, metadata)
+        self._save_column_definitions(cursor, metadata.get('columns', []))
+        self._poll_state['metadata_hash'] = fingerprint
+        return True
+    
+    def _map_row_to_event(self, row: dict, columns: list, source_title: str) -> Event:
+        """
+        Map a raw row to a structured event.
+        
+        Args:
+            row: Raw row data from API
+            columns: Column definitions from API
+            source_title: Title of the data source
+        
+        Returns:
+            Event: Structured event data (raw_data as serialized JSON bytes)
+        """
+        return self._row_mapper(columns)(row, source_title)
+    
+    def _row_mapper(self, columns: list):
+        """
+        Return the row mapper for a columns header, compiling it on first use.
+        
+        The mapper is kept until the header (or the JSON backend) changes, so
+        a poll compiles it at most once.
+        """
+        key = (
+            json_codec()[0],
+            tuple((col.get('field'), col.get('header')) for col in columns)
+        )
+        if self._mapper is None or self._mapper[0] != key:
+            self._mapper = (key, self._compile_mapper(columns))
+        return self._mapper[1]
+    
+    def _compile_mapper(self, columns: list):
+        """
+        Build a function mapping a raw row to an Event for a columns header.
+        
+        Each COLUMN_ROLES field is read from the column whose header names it,
+        so a reordered header still maps correctly. The row's Column1-10 and
+        any other column used are read once per row; the role fields are then
+        picked out of those values by position.
+        
+        Args:
+            columns: Column definitions from API
+        
+        Returns:
+            callable: mapper(row, source_title) -> Event
+        """
+        import re
+        import sys
+        
+        by_header = {}
+        for col in columns:
+            header = re.sub(r'[^a-z0-9]', '', str(col.get('header') or '').lower())
+            if col.get('field') and header not in by_header:
+                by_header[header] = col['field']
+        
+        role_fields = {}
+        for name, default, headers in self.COLUMN_ROLES:
+            matches = [by_header[header] for header in headers if header in by_header]
+            role_fields[name] = matches[0] if matches else default
+        
+        # Every field read from a row, once: Column1-10 (which fill column_1..10),
+        # Longitude, Latitude, LinkURL1-5, then any other column a role maps to
+        fields = [f'Column{n}' for n in range(1, 11)]
+        fields += ['Longitude', 'Latitude'] + [f'LinkURL{n}' for n in range(1, 6)]
+        fields += [field for field in dict.fromkeys(role_fields.values()) if field not in fields]
+        fields = tuple(fields)
+        position = {name: fields.index(field) for name, field in role_fields.items()}
+        number, address, call_type, units, created, jurisdiction, agency_type = (
+            position[name] for name, _, _ in self.COLUMN_ROLES
+        )
+        interned = tuple(position[name] for name in self.INTERNED_FIELDS)
+        
+        parse_datetime = self._parse_datetime
+        safe_float = self._safe_float
+        dumps = json_codec()[2]
+        intern = sys.intern
+        token = self.pub_token
+        new = tuple.__new__
+        
+        def mapper(row: dict, source_title: str) -> Event:
+            get = row.get
+            values = list(map(get, fields))
+            for index in interned:
+                value = values[index]
+                if type(value) is str:
+                    values[index] = intern(value)
+            # Through _parse_datetime even on a cache hit, so its hit rate
+            # counts them
+            call_created = parse_datetime(values[created])
+            # Event._make without its length check
+            return new(Event, (
+                get('EventID', ''), values[number], values[address], values[call_type],
+                values[units], call_created, values[jurisdiction],
+                values[agency_type], safe_float(values[10]), safe_float(values[11]),
+                *values[12:17], *values[:10], dumps(row), source_title, token
+            ))
+        
+        return mapper
+    
+    def _safe_float(self, value) -> Optional[float]:
+        """Safely convert value to float."""
+        if value is None or value == '':
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+    
+    def _collapse_batch(self, events: list) -> list:
+        """
+        Collapse events sharing a composite key into a single batch entry.
+        
+        Call numbers reset daily, so call_number + call date identifies an event
+        (event_id from the API changes every request). A key that appears more
+        than once in a poll keeps the fields of its first occurrence, the
+        event_id of its last occurrence, and a hit count so times_seen and the
+        new/updated counts match row-by-row processing.
+        
+        Args:
+            events: Mapped events from _map_row_to_event
+        
+        Returns:
+            list: (event, hits) tuples in first-seen order
+        """
+        batch = {}
+        for event in events:
+            if not event.call_number or not event.call_created:
+                continue
+            
+            key = (event.call_number, event.call_created.date())
+            if key in batch:
+                batch[key][0] = batch[key][0]._replace(event_id=event.event_id)
+                batch[key][1] += 1
+            else:
+                batch[key] = [event, 1]
+        
+        return [(event, hits) for event, hits in batch.values()]
+    
+    def _content_hash(self, event: Event) -> int:
+        """
+        Hash an event's content for comparison with the previous poll.
+        
+        event_id (new on every request) and raw_data (which embeds it) are left
+        out. Python's hash is salted per process, which is fine for a snapshot
+        that never leaves memory.
+        """
+        # event_id is the first field; raw_data comes before source_title/token
+        return hash(event[1:-3] + event[-2:])
+    
+    def _batch_values(self, batch: list, now: datetime) -> tuple:
+        """
+        Build execute_values rows for a collapsed batch.
+        
+        Args:
+            batch: (event, hits) tuples from _collapse_batch
+            now: Timestamp recorded as seen_at
+        
+        Returns:
+            tuple: (values, template) with one row per key, ending in seen_at and hits
+        """
+        # Event fields are already in column order; only raw_data needs adapting
+        values = [
+            event[:-3] + (JsonBytes(event.raw_data),) + event[-2:] + (now, hits)
+            for event, hits in batch
+        ]
+        
+        # Casts keep column types stable when every value in a page is NULL
+        template = """(
+            %s, %s, %s, %s, %s, %s::timestamp, %s, %s, %s::double precision,
+            %s::double precision, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s::timestamp, %s::integer
+        )"""
+        return values, template
+    
+    def _upsert_events(self, cursor, batch: list, now: datetime) -> tuple:
+        """
+        Insert new events and refresh existing ones with set-based statements.
+        
+        The batch is sent as a VALUES list (paged by UPSERT_PAGE_SIZE).
+        Each page updates rows already stored under the composite key and
+        inserts the rest in a single statement, instead of a SELECT plus an
+        UPDATE or INSERT per row. Existing rows get their stored fields
+        rewritten, as in _refresh_changed. When idx_events_identity is
+        available the pages go through INSERT ... ON CONFLICT instead (see
+        _upsert_on_conflict).
         
         Args:
-            row: Raw row data from API
-            columns: Column definitions from API
-            source_title: Title of the data source
-            
+            cursor: Open database cursor (caller commits)
+            batch: (event, hits) tuples from _collapse_batch
+            now: Timestamp recorded as first_seen/last_seen
+        
         Returns:
-            dict: Structured event data
-        """
-        event = {
-            'event_id': row.get('EventID', ''),
-            'call_number': row.get('Column1'),
-            'address': row.get('Column2'),
-            'call_type': row.get('Column3'),
-            'units': row.get('Column4'),
-            'call_created': self._parse_datetime(row.get('Column5', '')),
-            'jurisdiction': row.get('Column6'),
-            'agency_type': row.get('Column7'),
-            'longitude': self._safe_float(row.get('Longitude')),
-            'latitude': self._safe_float(row.get('Latitude')),
-            'link_url_1': row.get('LinkURL1'),
-            'link_url_2': row.get('LinkURL2'),
-            'link_url_3': row.get('LinkURL3'),
-            'link_url_4': row.get('LinkURL4'),
-            'link_url_5': row.get('LinkURL5'),
-            'column_1': row.get('Column1'),
-            'column_2': row.get('Column2'),
-            'column_3': row.get('Column3'),
-            'column_4': row.get('Column4'),
-            'column_5': row.get('Column5'),
-            'column_6': row.get('Column6'),
-            'column_7': row.get('Column7'),
-            'column_8': row.get('Column8'),
-            'column_9': row.get('Column9'),
-            'column_10': row.get('Column10'),
-            'raw_data': json.dumps(row),
-            'source_title': source_title,
-            'source_token': self.pub_token
-        }
+            tuple: (new_events, updated_events)
+        """
+        from psycopg2.extras import execute_values
+        
+        if not batch:
+            return 0, 0
         
-        return event
+        values, template = self._batch_values(batch, now)
+        
+        if self._has_identity_index:
+            return self._upsert_on_conflict(cursor, batch, values, template)
+        
+        pages = execute_values(cursor, """
+            WITH incoming (
+                event_id, call_number, address, call_type, units,
+                call_created, jurisdiction, agency_type, longitude,
+                latitude, link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
+                column_1, column_2, column_3, column_4, column_5,
+                column_6, column_7, column_8, column_9, column_10,
+                raw_data, source_title, source_token, seen_at, hits
+            ) AS (
+                VALUES %s
+            ),
+            updated AS (
+                UPDATE events e SET
+                    event_id = i.event_id, address = i.address, call_type = i.call_type,
+                    units = i.units, call_created = i.call_created,
+                    jurisdiction = i.jurisdiction, agency_type = i.agency_type,
+                    longitude = i.longitude, latitude = i.latitude,
+                    link_url_1 = i.link_url_1, link_url_2 = i.link_url_2, link_url_3 = i.link_url_3,
+                    link_url_4 = i.link_url_4, link_url_5 = i.link_url_5,
+                    column_1 = i.column_1, column_2 = i.column_2, column_3 = i.column_3,
+                    column_4 = i.column_4, column_5 = i.column_5, column_6 = i.column_6,
+                    column_7 = i.column_7, column_8 = i.column_8, column_9 = i.column_9,
+                    column_10 = i.column_10, raw_data = i.raw_data,
+                    last_seen = i.seen_at,
+                    times_seen = e.times_seen + i.hits
+                FROM incoming i
+                WHERE e.call_number = i.call_number
+                  AND DATE(e.call_created) = DATE(i.call_created)
+                  AND e.source_token = i.source_token
+                RETURNING i.call_number, i.call_created, i.hits
+            ),
+            inserted AS (
+                INSERT INTO events (
+                    event_id, call_number, address, call_type, units,
+                    call_created, jurisdiction, agency_type, longitude,
+                    latitude, link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
+                    column_1, column_2, column_3, column_4, column_5,
+                    column_6, column_7, column_8, column_9, column_10,
+                    first_seen, last_seen, times_seen, raw_data, source_title, source_token
+                )
+                SELECT
+                    i.event_id, i.call_number, i.address, i.call_type, i.units,
+                    i.call_created, i.jurisdiction, i.agency_type, i.longitude,
+                    i.latitude, i.link_url_1, i.link_url_2, i.link_url_3, i.link_url_4, i.link_url_5,
+                    i.column_1, i.column_2, i.column_3, i.column_4, i.column_5,
+                    i.column_6, i.column_7, i.column_8, i.column_9, i.column_10,
+                    i.seen_at, i.seen_at, i.hits, i.raw_data, i.source_title, i.source_token
+                FROM incoming i
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM events e
+                    WHERE e.call_number = i.call_number
+                      AND DATE(e.call_created) = DATE(i.call_created)
+                      AND e.source_token = i.source_token
+                )
+                RETURNING times_seen
+            )
+            SELECT
+                (SELECT COUNT(*) FROM inserted),
+                (SELECT COALESCE(SUM(times_seen - 1), 0) FROM inserted)
+                    + (SELECT COALESCE(SUM(hits), 0)
+                       FROM (SELECT DISTINCT call_number, call_created, hits FROM updated) u)
+        """, values, template=template, page_size=self.UPSERT_PAGE_SIZE, fetch=True)
+        
+        new_events = sum(page[0] for page in pages)
+        updated_events = sum(page[1] for page in pages)
+        return int(new_events), int(updated_events)
     
-    def _safe_float(self, value) -> Optional[float]:
-        """Safely convert value to float."""
-        if value is None or value == '':
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
+    def _write_delta(self, cursor, batch: list, now: datetime, snapshot: dict, delta: dict) -> tuple:
+        """
+        Write a collapsed batch as the difference from the previous poll.
+        
+        Each key is classified against the in-memory snapshot of the previous
+        poll. Keys the snapshot doesn't know (new calls, or every call after a
+        restart) go through _upsert_events. Keys whose content changed get
+        their stored fields rewritten, and keys that are merely still present
+        only get last_seen/times_seen bumped in one statement. A key the
+        snapshot knows but the table no longer holds falls back to the upsert.
+        
+        A poll is written as several batches when it is streamed; a key that an
+        earlier batch of the same poll already wrote is only bumped, just like
+        a repeated row within one batch.
+        
+        Args:
+            cursor: Open database cursor (caller commits)
+            batch: (event, hits) tuples from _collapse_batch
+            now: Timestamp recorded as first_seen/last_seen
+            snapshot: Keys of this poll written so far with their content
+                      hashes; the batch's keys are added (keep it once the
+                      poll is committed)
+            delta: new/changed/unchanged key counts, incremented for the batch
+        
+        Returns:
+            tuple: (new_events, updated_events)
+        """
+        unknown, changed, unchanged, repeated = self._classify_batch(batch, snapshot)
+        delta['new'] += len(unknown)
+        delta['changed'] += len(changed)
+        delta['unchanged'] += len(unchanged)
+        
+        updated_events = 0
+        missing = []
+        for entries, refresh in ((changed, self._refresh_changed),
+                                 (unchanged + repeated, self._bump_unchanged)):
+            if entries:
+                hits, not_found = self._match_refreshed(entries, refresh(cursor, entries, now))
+                updated_events += hits
+                missing += not_found
+        
+        new_events, upserted = self._upsert_events(cursor, unknown + missing, now)
+        updated_events += upserted
+        return new_events, updated_events
+    
+    def _classify_batch(self, batch: list, snapshot: dict) -> tuple:
+        """
+        Split a collapsed batch against the previous poll's snapshot.
+        
+        Args:
+            batch: (event, hits) tuples from _collapse_batch
+            snapshot: Keys of this poll written so far; new keys are added
+        
+        Returns:
+            tuple: (unknown, changed, unchanged, repeated) entries, where
+                   repeated keys were already written earlier in this poll
+        """
+        previous = self._snapshot or {}
+        unknown, changed, unchanged, repeated = [], [], [], []
+        for entry in batch:
+            event = entry[0]
+            key = (event.call_number, event.call_created.date())
+            if key in snapshot:
+                repeated.append(entry)
+                continue
+            content = self._content_hash(event)
+            snapshot[key] = content
+            if key not in previous:
+                unknown.append(entry)
+            elif previous[key] != content:
+                changed.append(entry)
+            else:
+                unchanged.append(entry)
+        return unknown, changed, unchanged, repeated
+    
+    def _finish_delta(self, snapshot: dict, delta: dict) -> Optional[dict]:
+        """
+        Complete a poll's delta with the keys that disappeared since the last poll.
+        
+        Returns:
+            dict: new/changed/unchanged/disappeared counts, or None when there
+                  was no previous snapshot to compare with
+        """
+        if self._snapshot is None:
             return None
+        delta['disappeared'] = len(self._snapshot.keys() - snapshot.keys())
+        return delta
+    
+    def _match_refreshed(self, entries: list, found: set) -> tuple:
+        """
+        Count refreshed entries and collect those whose row was not found.
+        
+        Returns:
+            tuple: (updated_events, missing entries for the upsert)
+        """
+        updated_events = 0
+        missing = []
+        for event, hits in entries:
+            if (event.call_number, event.call_created.date()) in found:
+                updated_events += hits
+            else:
+                missing.append((event, hits))
+        return updated_events, missing
+    
+    def _refresh_changed(self, cursor, batch: list, now: datetime) -> set:
+        """
+        Rewrite stored fields of events whose content changed since the last poll.
+        
+        Returns:
+            set: (call_number, call date) keys that were found and updated
+        """
+        from psycopg2.extras import execute_values
+        
+        values, template = self._batch_values(batch, now)
+        rows = execute_values(cursor, """
+            UPDATE events e SET
+                event_id = i.event_id, address = i.address, call_type = i.call_type,
+                units = i.units, call_created = i.call_created,
+                jurisdiction = i.jurisdiction, agency_type = i.agency_type,
+                longitude = i.longitude, latitude = i.latitude,
+                link_url_1 = i.link_url_1, link_url_2 = i.link_url_2, link_url_3 = i.link_url_3,
+                link_url_4 = i.link_url_4, link_url_5 = i.link_url_5,
+                column_1 = i.column_1, column_2 = i.column_2, column_3 = i.column_3,
+                column_4 = i.column_4, column_5 = i.column_5, column_6 = i.column_6,
+                column_7 = i.column_7, column_8 = i.column_8, column_9 = i.column_9,
+                column_10 = i.column_10, raw_data = i.raw_data,
+                last_seen = i.seen_at,
+                times_seen = e.times_seen + i.hits
+            FROM (VALUES %s) AS i (
+                event_id, call_number, address, call_type, units,
+                call_created, jurisdiction, agency_type, longitude,
+                latitude, link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
+                column_1, column_2, column_3, column_4, column_5,
+                column_6, column_7, column_8, column_9, column_10,
+                raw_data, source_title, source_token, seen_at, hits
+            )
+            WHERE e.call_number = i.call_number
+              AND e.call_created::date = i.call_created::date
+              AND e.source_token = i.source_token
+            RETURNING i.call_number, i.call_created::date
+        """, values, template=template, page_size=self.UPSERT_PAGE_SIZE, fetch=True)
+        return set(rows)
+    
+    def _bump_unchanged(self, cursor, batch: list, now: datetime) -> set:
+        """
+        Bump last_seen/times_seen of events unchanged since the last poll.
+        
+        The keys are passed as arrays, so the whole set is one UPDATE with a
+        handful of parameters regardless of its size.
+        
+        Returns:
+            set: (call_number, call date) keys that were found and updated
+        """
+        cursor.execute("""
+            UPDATE events e SET
+                last_seen = %s,
+                times_seen = e.times_seen + s.hits,
+                event_id = s.event_id
+            FROM unnest(%s::text[], %s::date[], %s::text[], %s::integer[])
+                AS s (call_number, call_date, event_id, hits)
+            WHERE e.call_number = s.call_number
+              AND e.call_created::date = s.call_date
+              AND e.source_token = %s
+            RETURNING s.call_number, s.call_date
+        """, (
+            now,
+            [event.call_number for event, _ in batch],
+            [event.call_created.date() for event, _ in batch],
+            [event.event_id for event, _ in batch],
+            [hits for _, hits in batch],
+            self.pub_token
+        ))
+        return set(cursor.fetchall())
+    
+    def _upsert_on_conflict(self, cursor, batch: list, values: list, template: str) -> tuple:
+        """
+        Upsert a collapsed batch with INSERT ... ON CONFLICT on idx_events_identity.
+        
+        Existing rows get their stored fields rewritten as in
+        _refresh_changed, so a poll without a snapshot (the first after a
+        restart, or any cron run) stores changed content as well.
+        
+        Args:
+            cursor: Open database cursor (caller commits)
+            batch: (event, hits) tuples from _collapse_batch
+            values: Row tuples matching template
+            template: execute_values row template
+            
+        Returns:
+            tuple: (new_events, updated_events)
+        """
+        from psycopg2.extras import execute_values
+        
+        rows = execute_values(cursor, """
+            INSERT INTO events (
+                event_id, call_number, address, call_type, units,
+                call_created, jurisdiction, agency_type, longitude,
+                latitude, link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
+                column_1, column_2, column_3, column_4, column_5,
+                column_6, column_7, column_8, column_9, column_10,
+                first_seen, last_seen, times_seen, raw_data, source_title, source_token
+            )
+            SELECT
+                i.event_id, i.call_number, i.address, i.call_type, i.units,
+                i.call_created, i.jurisdiction, i.agency_type, i.longitude,
+                i.latitude, i.link_url_1, i.link_url_2, i.link_url_3, i.link_url_4, i.link_url_5,
+                i.column_1, i.column_2, i.column_3, i.column_4, i.column_5,
+                i.column_6, i.column_7, i.column_8, i.column_9, i.column_10,
+                i.seen_at, i.seen_at, i.hits, i.raw_data, i.source_title, i.source_token
+            FROM (VALUES %s) AS i (
+                event_id, call_number, address, call_type, units,
+                call_created, jurisdiction, agency_type, longitude,
+                latitude, link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
+                column_1, column_2, column_3, column_4, column_5,
+                column_6, column_7, column_8, column_9, column_10,
+                raw_data, source_title, source_token, seen_at, hits
+            )
+            ON CONFLICT (call_number, (call_created::date), source_token) DO UPDATE SET
+                event_id = EXCLUDED.event_id, address = EXCLUDED.address, call_type = EXCLUDED.call_type,
+                units = EXCLUDED.units, call_created = EXCLUDED.call_created,
+                jurisdiction = EXCLUDED.jurisdiction, agency_type = EXCLUDED.agency_type,
+                longitude = EXCLUDED.longitude, latitude = EXCLUDED.latitude,
+                link_url_1 = EXCLUDED.link_url_1, link_url_2 = EXCLUDED.link_url_2, link_url_3 = EXCLUDED.link_url_3,
+                link_url_4 = EXCLUDED.link_url_4, link_url_5 = EXCLUDED.link_url_5,
+                column_1 = EXCLUDED.column_1, column_2 = EXCLUDED.column_2, column_3 = EXCLUDED.column_3,
+                column_4 = EXCLUDED.column_4, column_5 = EXCLUDED.column_5, column_6 = EXCLUDED.column_6,
+                column_7 = EXCLUDED.column_7, column_8 = EXCLUDED.column_8, column_9 = EXCLUDED.column_9,
+                column_10 = EXCLUDED.column_10, raw_data = EXCLUDED.raw_data,
+                last_seen = EXCLUDED.last_seen,
+                times_seen = events.times_seen + EXCLUDED.times_seen
+            RETURNING (xmax = 0) AS inserted, call_number, call_created::date
+        """, values, template=template, page_size=self.UPSERT_PAGE_SIZE, fetch=True)
+        return self._count_upserted(batch, rows)
+    
+    def _count_upserted(self, batch: list, rows: list) -> tuple:
+        """
+        Turn ON CONFLICT upsert results into new/updated counts.
+        
+        Args:
+            batch: (event, hits) tuples that were upserted
+            rows: (inserted, call_number, call date) rows returned by the upsert
+        
+        Returns:
+            tuple: (new_events, updated_events)
+        """
+        hits_by_key = {
+            (event.call_number, event.call_created.date()): hits
+            for event, hits in batch
+        }
+        
+        new_events = 0
+        updated_events = 0
+        for inserted, call_number, call_date in rows:
+            hits = hits_by_key[(call_number, call_date)]
+            if inserted:
+                new_events += 1
+                updated_events += hits - 1
+            else:
+                updated_events += hits
+        
+        return new_events, updated_events
     
     def ingest(self) -> dict:
         """
@@ -389,116 +2473,91 @@ class DispatchIngester:
             'duration_seconds': 0
         }
         
+        conn = None
+        payload = None
         try:
-            # Fetch data from API
-            data = self.fetch_data()
-            
-            columns = data.get('columns', [])
-            rows = data.get('rows', [])
-            source_title = data.get('title', '')
-            result['events_fetched'] = len(rows)
-            
-            print(f"Fetched {len(rows)} events from API")
-            print(f"Title: {source_title}")
-            
             # Connect to database
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            # Save metadata
-            self._save_source_metadata(cursor, data)
-            self._save_column_definitions(cursor, columns)
+            if self._partitioned:
+                self._maintain_partitions(cursor, datetime.now())
             
+            if self._poll_state is None:
+                self._poll_state = self._load_poll_state(cursor)
+            
+            # Fetch the response body (None when the server answers 304 Not
+            # Modified); a first streaming pass reads metadata and fingerprint
+            payload = self._fetch_payload()
             now = datetime.now()
+            metadata, row_count, fingerprint = (
+                self._scan_payload(payload) if payload is not None else ({}, 0, None)
+            )
+            snapshot = self._snapshot
             
-            for row in rows:
-                event = self._map_row_to_event(row, columns, source_title)
+            if self._poll_state.get('last_polled') and (
+                    payload is None or fingerprint == self._poll_state.get('payload_hash')):
+                # Same payload as the previous poll: only bump last_seen
+                touched = self._touch_unchanged(cursor, now)
+                result['status'] = 'unchanged'
+                result['events_fetched'] = row_count if payload is not None else touched
+                result['updated_events'] = touched
                 
-                # Use call_number + call_date as composite key (event_id from API changes every request)
-                # Call numbers reset daily, so we need both to uniquely identify an event
-                if not event['call_number'] or not event['call_created']:
-                    continue
+                print(f"Payload unchanged since {self._poll_state['last_polled']}")
+            else:
+                columns = metadata.get('columns', [])
+                source_title = metadata.get('title', '')
+                result['events_fetched'] = row_count
                 
-                # Extract date from call_created for composite key
-                call_date = event['call_created'].date() if event['call_created'] else None
+                print(f"Fetched {row_count} events from API")
+                print(f"Title: {source_title}")
                 
-                # Check if event already exists by call_number + call_date (the stable composite identifier)
-                cursor.execute(
-                    "SELECT id, times_seen FROM events WHERE call_number = %s AND DATE(call_created) = %s", 
-                    (event['call_number'], call_date)
-                )
-                existing = cursor.fetchone()
+                # Save metadata (only when it changed)
+                self._save_metadata(cursor, metadata)
                 
-                if existing:
-                    # Update last_seen timestamp, increment times_seen, and update event_id to latest
-                    cursor.execute(
-                        "UPDATE events SET last_seen = %s, times_seen = times_seen + 1, event_id = %s WHERE call_number = %s AND DATE(call_created) = %s",
-                        (now, event['event_id'], event['call_number'], call_date)
+                # Second streaming pass: map and write the rows chunk by chunk
+                snapshot = {}
+                delta = dict.fromkeys(('new', 'changed', 'unchanged', 'disappeared'), 0)
+                mapper = self._row_mapper(columns)
+                for rows in self._row_chunks(payload):
+                    events = [mapper(row, source_title) for row in rows]
+                    new_events, updated_events = self._write_delta(
+                        cursor, self._collapse_batch(events), now, snapshot, delta
                     )
-                    result['updated_events'] += 1
-                else:
-                    # Insert new event
-                    cursor.execute("""
-                        INSERT INTO events (
-                            event_id, call_number, address, call_type, units,
-                            call_created, jurisdiction, agency_type, longitude,
-                            latitude, link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
-                            column_1, column_2, column_3, column_4, column_5,
-                            column_6, column_7, column_8, column_9, column_10,
-                            first_seen, last_seen, times_seen, raw_data, source_title, source_token
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                    """, (
-                        event['event_id'],
-                        event['call_number'],
-                        event['address'],
-                        event['call_type'],
-                        event['units'],
-                        event['call_created'],
-                        event['jurisdiction'],
-                        event['agency_type'],
-                        event['longitude'],
-                        event['latitude'],
-                        event['link_url_1'],
-                        event['link_url_2'],
-                        event['link_url_3'],
-                        event['link_url_4'],
-                        event['link_url_5'],
-                        event['column_1'],
-                        event['column_2'],
-                        event['column_3'],
-                        event['column_4'],
-                        event['column_5'],
-                        event['column_6'],
-                        event['column_7'],
-                        event['column_8'],
-                        event['column_9'],
-                        event['column_10'],
-                        now,
-                        now,
-                        1,
-                        event['raw_data'],
-                        event['source_title'],
-                        event['source_token']
-                    ))
-                    result['new_events'] += 1
+                    result['new_events'] += new_events
+                    result['updated_events'] += updated_events
+                delta = self._finish_delta(snapshot, delta)
+                if delta is not None:
+                    result['delta'] = delta
+                    print(f"Delta: {delta['new']} new, {delta['changed']} changed, "
+                          f"{delta['unchanged']} unchanged, {delta['disappeared']} disappeared")
+                
+                self._poll_state = dict(
+                    self._response_validators, payload_hash=fingerprint,
+                    metadata_hash=self._poll_state.get('metadata_hash')
+                )
             
+            self._poll_state['last_polled'] = now
+            self._save_poll_state(cursor)
             conn.commit()
+            self._snapshot = snapshot
             
             result['duration_seconds'] = time.time() - start_time
             
-            # Log the ingestion
+            # Log the ingestion and announce it on NOTIFY_CHANNEL; listeners
+            # get the notification when the log entry commits
             cursor.execute("""
                 INSERT INTO ingestion_log (events_fetched, new_events, updated_events, status, duration_seconds, source_token)
                 VALUES (%s, %s, %s, %s, %s, %s)
-            """, (result['events_fetched'], result['new_events'], result['updated_events'], 'success', result['duration_seconds'], self.pub_token))
+                RETURNING id
+            """, (result['events_fetched'], result['new_events'], result['updated_events'], result['status'], result['duration_seconds'], self.pub_token))
+            self._notify_batch(cursor, cursor.fetchone()[0], result)
+            self._prune_changes(cursor)
             
             conn.commit()
             cursor.close()
-            conn.close()
+            self._release_connection(conn)
+            conn = None
             
             print(f"Ingestion complete: {result['new_events']} new, {result['updated_events']} updated ({result['duration_seconds']:.2f}s)")
             
@@ -508,6 +2567,17 @@ class DispatchIngester:
             result['duration_seconds'] = time.time() - start_time
             print(f"Error during ingestion: {e}")
             
+            # Nothing from this poll was committed: reload poll state from the
+            # database next time, start over without a snapshot and drop a
+            # connection that may be broken
+            self._poll_state = None
+            self._snapshot = None
+            if conn is not None:
+                try:
+                    self._release_connection(conn, discard=True)
+                except Exception:
+                    pass
+            
             # Log the error
             try:
                 conn = self._get_connection()
@@ -518,101 +2588,778 @@ class DispatchIngester:
                 """, (0, 0, 0, 'error', str(e), result['duration_seconds'], self.pub_token))
                 conn.commit()
                 cursor.close()
-                conn.close()
+                self._release_connection(conn)
             except:
                 pass
+        finally:
+            if payload is not None:
+                payload.close()
+        
+        return result
+    
+    def _notify_batch(self, cursor, batch_id: int, result: dict):
+        """
+        Queue the NOTIFY for a committed ingestion (sent when the caller commits).
+        
+        The payload on NOTIFY_CHANNEL is a JSON object:
+            
+            {"batch": 1234, "source": "<pubToken>", "status": "success",
+             "new": 3, "updated": 41, "max_id": 98765}
+        
+        batch is the ingestion's ingestion_log id, status is 'success' or
+        'unchanged', new and updated are its row counts (for 'unchanged',
+        updated counts the rows whose last_seen was bumped) and max_id is the
+        highest events id once it committed. Failed polls write nothing and
+        send nothing.
+        """
+        cursor.execute("""
+            SELECT pg_notify(%s, json_build_object(
+                'batch', %s::integer, 'source', %s::text, 'status', %s::text,
+                'new', %s::integer, 'updated', %s::integer,
+                'max_id', (SELECT MAX(id) FROM events)
+            )::text)
+        """, (self.NOTIFY_CHANNEL, batch_id, self.pub_token, result['status'],
+              result['new_events'], result['updated_events']))
+    
+    def subscribe(self, timeout: Optional[float] = None, channel: Optional[str] = None):
+        """
+        Wait for ingestions on NOTIFY_CHANNEL instead of polling events.
+        
+        Yields each notification's payload as a dict (see _notify_batch), in
+        commit order. Notifications sent while nobody listens are lost, so
+        read what you need once after the first yield (or timeout) and then
+        catch up from the previous payload's max_id and the batch's
+        last_seen.
+        
+        Args:
+            timeout: Seconds without a notification after which None is
+                yielded, e.g. to check for shutdown (default: wait forever)
+            channel: Channel to LISTEN on (default: NOTIFY_CHANNEL)
+        """
+        import select
+        import psycopg2
+        from psycopg2 import sql
+        
+        loads = json_codec()[1]
+        # A dedicated session: LISTEN lasts as long as the connection
+        conn = psycopg2.connect(**self.db_config)
+        try:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            cursor.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel or self.NOTIFY_CHANNEL)))
+            cursor.close()
+            while True:
+                if not select.select([conn], [], [], timeout)[0]:
+                    yield None
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    yield loads(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+    
+    def changes_since(self, seq: int = 0, limit: int = 1000) -> list:
+        """
+        Read event_changes entries after seq, oldest first.
+        
+        Each entry is a dict with seq, op ('insert', 'update' or 'delete'),
+        id, call_number, call_created, changed_at and event, the row's
+        current state in events (None once it is deleted or archived). Pass
+        the last entry's seq to get the next page; an empty list means the
+        consumer is caught up.
+        
+        Entries come in the order of the transactions that wrote them, seq
+        order within one, and only once every transaction that started
+        writing before them has finished (see _migrate_change_order). A seq
+        that is no longer kept reads from the oldest entry kept.
+        
+        Args:
+            seq: Last seq already processed (0 for everything kept)
+            limit: Maximum entries returned
+        """
+        from psycopg2.extras import RealDictCursor
+        
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute("""
+                SELECT seq, op, id, call_number, call_created, changed_at
+                FROM event_changes
+                WHERE (xid, seq) > (
+                        COALESCE((SELECT xid FROM event_changes WHERE seq = %(seq)s), '0'), %(seq)s
+                      )
+                  AND xid < pg_snapshot_xmin(pg_current_snapshot())
+                ORDER BY xid, seq
+                LIMIT %(limit)s
+            """, {'seq': seq, 'limit': limit})
+            changes = [dict(row) for row in cursor.fetchall()]
+            events = {}
+            if changes:
+                cursor.execute(
+                    "SELECT * FROM events WHERE id = ANY(%s)",
+                    (list({change['id'] for change in changes}),)
+                )
+                events = {row['id']: dict(row) for row in cursor.fetchall()}
+            cursor.close()
+            conn.rollback()
+        finally:
+            self._release_connection(conn)
+        for change in changes:
+            change['event'] = events.get(change['id'])
+        return changes
+    
+    def load_checkpoint(self, consumer: str) -> int:
+        """Return the seq a consumer last saved with save_checkpoint() (0 if none)."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT seq FROM change_consumers WHERE name = %s", (consumer,))
+            row = cursor.fetchone()
+            cursor.close()
+            conn.rollback()
+        finally:
+            self._release_connection(conn)
+        return row[0] if row else 0
+    
+    def save_checkpoint(self, consumer: str, seq: int):
+        """
+        Record that a consumer has processed event_changes up to seq.
+        
+        Registers the consumer on first use; prune_changes() keeps every
+        entry after the lowest registered checkpoint. A checkpoint never
+        moves backwards in the order changes_since() reads.
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO change_consumers (name, seq, xid)
+                VALUES (%(name)s, %(seq)s,
+                        COALESCE((SELECT xid FROM event_changes WHERE seq = %(seq)s), '0'))
+                ON CONFLICT (name) DO UPDATE SET
+                    seq = CASE WHEN (EXCLUDED.xid, EXCLUDED.seq) > (change_consumers.xid, change_consumers.seq)
+                               THEN EXCLUDED.seq ELSE change_consumers.seq END,
+                    xid = CASE WHEN (EXCLUDED.xid, EXCLUDED.seq) > (change_consumers.xid, change_consumers.seq)
+                               THEN EXCLUDED.xid ELSE change_consumers.xid END,
+                    updated_at = CURRENT_TIMESTAMP
+            """, {'name': consumer, 'seq': seq})
+            conn.commit()
+            cursor.close()
+        finally:
+            self._release_connection(conn)
+    
+    def drop_consumer(self, consumer: str) -> bool:
+        """Unregister a consumer so its checkpoint no longer holds back pruning."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM change_consumers WHERE name = %s", (consumer,))
+            dropped = cursor.rowcount > 0
+            conn.commit()
+            cursor.close()
+        finally:
+            self._release_connection(conn)
+        return dropped
+    
+    def prune_changes(self) -> int:
+        """
+        Delete event_changes entries every registered consumer has passed.
+        
+        Without registered consumers nothing is deleted, so history is kept
+        until the first consumer has caught up. ingest() prunes after each
+        poll.
+        
+        Returns:
+            int: Entries deleted
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            pruned = self._prune_changes(cursor)
+            conn.commit()
+            cursor.close()
+        finally:
+            self._release_connection(conn)
+        return pruned
+    
+    def _prune_changes(self, cursor) -> int:
+        """Delete event_changes entries up to the lowest checkpoint (caller commits)."""
+        cursor.execute("""
+            DELETE FROM event_changes
+            WHERE (xid, seq) <= (SELECT xid, seq FROM change_consumers ORDER BY xid, seq LIMIT 1)
+        """)
+        return cursor.rowcount
+    
+    def _merge_duplicates(self, cursor, by_source: bool = True) -> tuple:
+        """
+        Merge events that share a composite key into their lowest id row.
+        
+        The kept row gets the earliest first_seen, the latest last_seen and the
+        summed times_seen of its group; the other rows are deleted.
+        
+        Args:
+            by_source: Include source_token in the key, as the current
+                identity index does; migration 2 passes False to merge on
+                the two-column key its index is built on
+        
+        Returns:
+            tuple: (groups merged, rows removed)
+        """
+        token = ', source_token' if by_source else ''
+        cursor.execute(f"""
+            CREATE TEMP TABLE event_merge ON COMMIT DROP AS
+            SELECT call_number,
+                   call_created::date AS call_date{token},
+                   MIN(id) AS keep_id,
+                   MIN(first_seen) AS first_seen,
+                   MAX(last_seen) AS last_seen,
+                   SUM(times_seen) AS times_seen
+            FROM events
+            WHERE call_created IS NOT NULL
+            GROUP BY call_number, call_created::date{token}
+            HAVING COUNT(*) > 1
+        """)
+        groups = cursor.rowcount
+        
+        cursor.execute("""
+            UPDATE events e SET
+                first_seen = m.first_seen,
+                last_seen = m.last_seen,
+                times_seen = m.times_seen
+            FROM event_merge m
+            WHERE e.id = m.keep_id
+        """)
+        
+        cursor.execute(f"""
+            DELETE FROM events e
+            USING event_merge m
+            WHERE e.call_number = m.call_number
+              AND e.call_created::date = m.call_date
+              {'AND e.source_token IS NOT DISTINCT FROM m.source_token' if by_source else ''}
+              AND e.id <> m.keep_id
+        """)
+        removed = cursor.rowcount
+        
+        cursor.execute("DROP TABLE event_merge")
+        return groups, removed
+    
+    def merge_duplicate_events(self) -> dict:
+        """
+        Merge events that share a composite key and ensure idx_events_identity
+        (or the per-partition identity indexes of a partitioned table).
+        
+        Migration 2 does this automatically; the `dedupe` command repeats it as
+        a repair step (e.g. after restoring an old dump into the table).
+        
+        Returns:
+            dict: Number of duplicate groups merged and rows removed
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        groups, removed = self._merge_duplicates(cursor)
+        if self._events_partitioned(cursor):
+            cursor.execute("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'events'::regclass")
+            for (partition,) in cursor.fetchall():
+                self._create_identity_index(cursor, partition)
+        else:
+            self._create_identity_index(cursor, 'events')
+        
+        conn.commit()
+        cursor.close()
+        self._release_connection(conn)
+        
+        print(f"Merged {groups} duplicate groups ({removed} rows removed)")
+        return {'groups_merged': groups, 'rows_removed': removed}
+    
+    def archive_events(self, older_than_days: Optional[int] = None,
+                       archive_dir: Optional[str] = None) -> dict:
+        """
+        Move old events out of the database into Parquet files.
+        
+        Events whose call_created is before midnight older_than_days days ago
+        are written month by month to archive_dir/year=YYYY/month=MM/ as
+        zstd-compressed Parquet, and deleted from events in the same
+        transaction; a file is only kept once its delete commits. When events
+        is partitioned, a month archived in full drops its partition instead.
+        ArchiveReader reads the files back (see search_events and get_stats).
+        
+        Args:
+            older_than_days: Minimum age in days (default: ARCHIVE_AFTER_DAYS)
+            archive_dir: Archive directory (default: ARCHIVE_DIR)
+        
+        Returns:
+            dict: Events archived and files written
+        
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        from datetime import timedelta
+        
+        pa, pq = _import_pyarrow()
+        if older_than_days is None:
+            older_than_days = self.ARCHIVE_AFTER_DAYS
+        archive_dir = archive_dir or self.ARCHIVE_DIR
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        cutoff = today - timedelta(days=older_than_days)
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        select, schema = self._archive_schema(cursor, pa)
+        partitioned = self._events_partitioned(cursor)
+        cursor.execute("SELECT MIN(call_created) FROM events WHERE call_created < %s", (cutoff,))
+        first = cursor.fetchone()[0]
+        conn.commit()
+        cursor.close()
+        
+        archived = 0
+        files = []
+        month = self._add_months(first, 0) if first else cutoff
+        try:
+            while month < cutoff:
+                upper = self._add_months(month, 1)
+                count, path = self._archive_month(
+                    conn, pa, pq, select, schema, month, min(upper, cutoff),
+                    archive_dir, partitioned and upper <= cutoff
+                )
+                if path:
+                    archived += count
+                    files.append(path)
+                month = upper
+        finally:
+            self._release_connection(conn)
+        
+        print(f"Archived {archived} events older than {cutoff:%Y-%m-%d} to {len(files)} files in {archive_dir}")
+        return {'events_archived': archived, 'files': files, 'cutoff': cutoff}
+    
+    def _archive_schema(self, cursor, pa) -> tuple:
+        """
+        Return the SELECT list and Parquet schema for archiving events rows.
+        
+        All columns of events are archived, so columns added by later
+        migrations are kept too.
+        """
+        cursor.execute("""
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'events'
+            ORDER BY ordinal_position
+        """)
+        select = []
+        fields = []
+        for name, data_type in cursor.fetchall():
+            kind = self.ARCHIVE_TYPES.get(data_type)
+            if kind == 'timestamp':
+                fields.append(pa.field(name, pa.timestamp('us')))
+            elif kind:
+                fields.append(pa.field(name, getattr(pa, kind)()))
+            else:
+                fields.append(pa.field(name, pa.string()))
+            select.append(name if kind else f"{name}::text AS {name}")
+        return ', '.join(select), pa.schema(fields)
+    
+    def _archive_month(self, conn, pa, pq, select: str, schema, lower: datetime,
+                       upper: datetime, archive_dir: str, whole_partition: bool) -> tuple:
+        """
+        Archive the events with call_created in [lower, upper) to one file.
+        
+        Rows are streamed from a server-side cursor in ARCHIVE_BATCH_ROWS
+        batches. The file is written under a temporary name, renamed once the
+        rows are deleted, and removed again if the transaction fails. With
+        whole_partition, the month's partition is dropped (even if empty).
+        
+        Returns:
+            tuple: (events archived, file path or None if there were none)
+        """
+        cursor = conn.cursor()
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (self.ARCHIVE_LOCK_ID,))
+        table = 'events'
+        if whole_partition:
+            name = f"events_{lower:%Y_%m}"
+            cursor.execute("SELECT to_regclass(%s)", (name,))
+            if cursor.fetchone()[0] is not None:
+                # Keep late writes out of the month until its partition is gone
+                cursor.execute(f"LOCK TABLE {name} IN EXCLUSIVE MODE")
+                table = name
+        
+        directory = os.path.join(archive_dir, f"year={lower:%Y}", f"month={lower:%m}")
+        path = os.path.join(directory, f"events-{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}.parquet")
+        rows = conn.cursor(name='archive_events')
+        rows.itersize = self.ARCHIVE_BATCH_ROWS
+        rows.execute(f"""
+            SELECT {select} FROM {table}
+            WHERE call_created >= %s AND call_created < %s
+            ORDER BY call_created
+        """, (lower, upper))
+        
+        id_column = schema.get_field_index('id')
+        ids = []
+        writer = None
+        try:
+            while True:
+                batch = rows.fetchmany(self.ARCHIVE_BATCH_ROWS)
+                if not batch:
+                    break
+                if writer is None:
+                    os.makedirs(directory, exist_ok=True)
+                    writer = pq.ParquetWriter(path + '.tmp', schema, compression='zstd')
+                columns = list(zip(*batch))
+                writer.write_batch(pa.RecordBatch.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                ))
+                ids.extend(columns[id_column])
+            rows.close()
+            if writer is None:
+                # An empty partition in the archived range goes all the same
+                if table != 'events':
+                    self._drop_archived_partition(cursor, table, lower, upper)
+                conn.commit()
+                return 0, None
+            writer.close()
+            
+            if table != 'events':
+                self._drop_archived_partition(cursor, table, lower, upper)
+            else:
+                cursor.execute("DELETE FROM events WHERE id = ANY(%s)", (ids,))
+            os.replace(path + '.tmp', path)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            if writer is not None:
+                writer.close()
+            for leftover in (path + '.tmp', path):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            raise
+        finally:
+            cursor.close()
+        
+        return len(ids), path
+    
+    def _drop_archived_partition(self, cursor, table: str, lower: datetime, upper: datetime):
+        """
+        Drop an archived month's partition, its event_rollups hours and its
+        share of facet_counts, recording its rows as deleted in event_changes.
+        
+        Dropping bypasses the DELETE triggers, so the month is taken out of
+        the rollups and facets and written to the outbox here, in the same
+        transaction.
+        """
+        cursor.execute(f"""
+            INSERT INTO facet_counts (facet, value, agency_type, events)
+            SELECT f.facet, f.value, f.agency_type, -COUNT(*)
+            FROM {table} e,
+            LATERAL (VALUES
+                ('agency_type', COALESCE(e.agency_type, ''), ''),
+                ('jurisdiction', COALESCE(e.jurisdiction, ''), ''),
+                ('call_type', COALESCE(e.call_type, ''), COALESCE(e.agency_type, ''))
+            ) AS f (facet, value, agency_type)
+            WHERE e.is_canonical
+            GROUP BY 1, 2, 3
+            ORDER BY 1, 2, 3
+            ON CONFLICT (facet, value, agency_type)
+            DO UPDATE SET events = facet_counts.events + EXCLUDED.events
+        """)
+        cursor.execute(f"""
+            INSERT INTO event_changes (op, id, call_number, call_created)
+            SELECT 'delete', id, call_number, call_created
+            FROM {table} ORDER BY id
+        """)
+        cursor.execute(f"DROP TABLE {table}")
+        cursor.execute("DELETE FROM event_rollups WHERE hour >= %s AND hour < %s", (lower, upper))
+    
+    def get_stats(self, include_archive: bool = False, archive_dir: Optional[str] = None,
+                  fast: bool = False) -> dict:
+        """
+        Get database statistics.
+        
+        The breakdowns come from one GROUPING SETS pass over event_rollups
+        (see _stats_breakdowns), whose size grows with hours of history
+        rather than events. It runs concurrently with the date range, the
+        size and log queries and the archive scan, each on its own (pooled,
+        when open_pool() was called) connection.
+        
+        Args:
+            include_archive: Also count events moved to the archive (see
+                archive_events); needs pyarrow
+            archive_dir: Archive directory (default: ARCHIVE_DIR)
+            fast: Take total_events from the planner's row estimates for
+                events (total_estimated is set) instead of counting
+        """
+        from collections import Counter
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if not self._schema_checked:
+            # Check the schema once, before the parts connect concurrently
+            self._release_connection(self._get_connection())
+        
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix='stats') as executor:
+            archive = None
+            if include_archive:
+                archive = executor.submit(ArchiveReader(archive_dir or self.ARCHIVE_DIR).stats)
+            parts = [
+                executor.submit(self._stats_query, part, fast)
+                for part in (self._stats_breakdowns, self._stats_date_range, self._stats_activity)
+            ]
+            stats = {}
+            for part in parts:
+                stats.update(part.result())
+            archive = archive.result() if archive else None
+        
+        for key in ('top_call_types', 'top_jurisdictions'):
+            stats[key] = dict(Counter(stats[key]).most_common(None if archive else 15))
+        
+        if archive:
+            stats['total_events'] += archive['total_events']
+            for key, limit in (('by_agency_type', None), ('top_call_types', 15), ('top_jurisdictions', 15)):
+                counts = Counter(stats[key])
+                counts.update(archive[key])
+                stats[key] = dict(counts.most_common(limit))
+            if archive['earliest'] is not None:
+                date_range = stats['date_range']
+                earliest = [value for value in (date_range['earliest'], archive['earliest']) if value]
+                latest = [value for value in (date_range['latest'], archive['latest']) if value]
+                stats['date_range'] = {'earliest': min(earliest), 'latest': max(latest)}
+            stats['archive'] = {
+                'events': archive['total_events'],
+                'files': archive['files'],
+                'size': f"{archive['size_bytes'] / (1024 * 1024):.1f} MB",
+            }
+        stats['date_range'] = {key: str(value) for key, value in stats['date_range'].items()}
+        return stats
+    
+    def _stats_query(self, part, fast: bool) -> dict:
+        """Run one get_stats() part on its own connection and return its keys."""
+        from psycopg2.extras import RealDictCursor
         
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            result = part(cursor, fast)
+            cursor.close()
+            conn.rollback()
+        except Exception:
+            self._release_connection(conn, discard=True)
+            raise
+        self._release_connection(conn)
         return result
     
-    def get_stats(self) -> dict:
-        """Get database statistics."""
-        conn = self._get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        stats = {}
+    def _stats_breakdowns(self, cursor, fast: bool) -> dict:
+        """
+        Count events overall, by agency type, call type, jurisdiction and day.
         
-        # Total events
-        cursor.execute("SELECT COUNT(*) as count FROM events")
-        stats['total_events'] = cursor.fetchone()['count']
+        One GROUPING SETS query over event_rollups computes every breakdown;
+        GROUPING() tells the sets' rows apart. Days older than a week share
+        one bucket, which is skipped. Call types and jurisdictions are not
+        cut to the top 15 yet, so archived counts can be merged first.
         
-        # Events by agency type
+        Returns:
+            dict: total_events (unless fast), by_agency_type, top_call_types,
+                  top_jurisdictions and events_per_day
+        """
+        sets = {
+            7: ('by_agency_type', 'agency_type'),
+            11: ('top_call_types', 'call_type'),
+            13: ('top_jurisdictions', 'jurisdiction'),
+            14: ('events_per_day', 'day'),
+        }
         cursor.execute("""
-            SELECT agency_type, COUNT(*) as count 
-            FROM events 
-            GROUP BY agency_type 
+            SELECT GROUPING(agency_type, call_type, jurisdiction, day) AS grouping_set,
+                   NULLIF(agency_type, '') AS agency_type,
+                   NULLIF(call_type, '') AS call_type,
+                   NULLIF(jurisdiction, '') AS jurisdiction,
+                   day,
+                   SUM(events)::bigint AS count
+            FROM (
+                SELECT agency_type, call_type, jurisdiction, events,
+                       CASE WHEN hour >= CURRENT_DATE - INTERVAL '7 days' THEN hour::date END AS day
+                FROM event_rollups
+            ) AS r
+            GROUP BY GROUPING SETS ({total}(agency_type), (call_type), (jurisdiction), (day))
+            HAVING SUM(events) > 0
             ORDER BY count DESC
-        """)
-        stats['by_agency_type'] = {row['agency_type']: row['count'] for row in cursor.fetchall()}
-        
-        # Events by call type (top 15)
-        cursor.execute("""
-            SELECT call_type, COUNT(*) as count 
-            FROM events 
-            GROUP BY call_type 
-            ORDER BY count DESC 
-            LIMIT 15
-        """)
-        stats['top_call_types'] = {row['call_type']: row['count'] for row in cursor.fetchall()}
+        """.format(total="" if fast else "(), "))
         
-        # Events by jurisdiction (top 15)
-        cursor.execute("""
-            SELECT jurisdiction, COUNT(*) as count 
-            FROM events 
-            GROUP BY jurisdiction 
-            ORDER BY count DESC 
-            LIMIT 15
-        """)
-        stats['top_jurisdictions'] = {row['jurisdiction']: row['count'] for row in cursor.fetchall()}
+        stats = {key: {} for key, _ in sets.values()}
+        stats['total_events'] = 0
+        for row in cursor.fetchall():
+            if row['grouping_set'] == 15:
+                stats['total_events'] = row['count']
+                continue
+            key, column = sets[row['grouping_set']]
+            if column == 'day':
+                if row['day'] is not None:
+                    stats[key][str(row['day'])] = row['count']
+            else:
+                stats[key][row[column]] = row['count']
         
-        # Date range
+        stats['events_per_day'] = dict(sorted(stats['events_per_day'].items(), reverse=True))
+        if fast:
+            del stats['total_events']
+        return stats
+    
+    def _stats_date_range(self, cursor, fast: bool) -> dict:
+        """
+        Get the call_created range (from idx_events_call_created), and with
+        fast the total from the planner's row estimates of events and its
+        partitions (as of their last ANALYZE).
+        """
         cursor.execute("SELECT MIN(call_created) as earliest, MAX(call_created) as latest FROM events")
-        date_range = cursor.fetchone()
-        stats['date_range'] = {'earliest': str(date_range['earliest']), 'latest': str(date_range['latest'])}
-        
-        # Database size
+        stats = {'date_range': dict(cursor.fetchone())}
+        if fast:
+            cursor.execute("""
+                SELECT COALESCE(SUM(reltuples) FILTER (WHERE reltuples > 0), 0)::bigint AS estimate
+                FROM pg_class
+                WHERE oid = 'events'::regclass
+                   OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'events'::regclass)
+            """)
+            stats['total_events'] = cursor.fetchone()['estimate']
+            stats['total_estimated'] = True
+        return stats
+    
+    def _stats_activity(self, cursor, fast: bool) -> dict:
+        """Get the database size and the five most recent ingestions."""
         cursor.execute("""
             SELECT pg_size_pretty(pg_database_size(%s)) as size
         """, (self.db_config['database'],))
-        stats['database_size'] = cursor.fetchone()['size']
+        stats = {'database_size': cursor.fetchone()['size']}
         
-        # Recent ingestions
         cursor.execute("""
             SELECT timestamp, events_fetched, new_events, updated_events, status, duration_seconds
-            FROM ingestion_log 
-            ORDER BY timestamp DESC 
+            FROM ingestion_log
+            ORDER BY timestamp DESC
             LIMIT 5
         """)
         stats['recent_ingestions'] = [dict(row) for row in cursor.fetchall()]
-        
-        # Events per day (last 7 days)
-        cursor.execute("""
-            SELECT DATE(call_created) as date, COUNT(*) as count
-            FROM events
-            WHERE call_created >= CURRENT_DATE - INTERVAL '7 days'
-            GROUP BY DATE(call_created)
-            ORDER BY date DESC
-        """)
-        stats['events_per_day'] = {str(row['date']): row['count'] for row in cursor.fetchall()}
-        
-        cursor.close()
-        conn.close()
         return stats
     
-    def export_to_csv(self, output_path: str, limit: Optional[int] = None):
+    def export_to_csv(self, output_path: str, limit: Optional[int] = None,
+                      compression: Optional[str] = None) -> int:
         """
         Export events to CSV file.
         
+        The server writes the CSV itself (COPY ... TO STDOUT WITH CSV HEADER)
+        and psycopg2 streams it into the file, optionally through a gzip or
+        zstd compressor, so memory use does not grow with the table. A
+        progress line is printed every EXPORT_PROGRESS_ROWS rows.
+        
         Args:
             output_path: Path for output CSV file
             limit: Maximum number of records to export (None for all)
+            compression: 'gzip', 'zstd' or 'none' (default: from the file
+                suffix, .gz or .zst; zstd needs zstandard)
+        
+        Returns:
+            int: Events exported
+        """
+        query = """
+            SELECT call_number AS "Call Number", address AS "Address",
+                   call_type AS "Call Type", units AS "Units",
+                   call_created AS "Call Created", jurisdiction AS "Jurisdiction",
+                   agency_type AS "Agency Type", latitude AS "Latitude",
+                   longitude AS "Longitude", link_url_1 AS "Link URL",
+                   first_seen AS "First Seen", last_seen AS "Last Seen",
+                   times_seen AS "Times Seen"
+            FROM events
+            ORDER BY call_created DESC
         """
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        
         conn = self._get_connection()
-        cursor = conn.cursor()
+        try:
+            cursor = conn.cursor()
+            with _open_export(output_path, compression) as f:
+                progress = _CopyProgress(f, self.EXPORT_PROGRESS_ROWS)
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", progress)
+            cursor.close()
+            conn.rollback()
+        finally:
+            self._release_connection(conn)
+        
+        # The header line arrives as a row of its own
+        rows = max(progress.rows - 1, 0)
+        print(f"Exported {rows} events to {output_path}")
+        return rows
+    
+    def export_to_ndjson(self, output_path: str, limit: Optional[int] = None,
+                         compression: Optional[str] = None, itersize: Optional[int] = None) -> int:
+        """
+        Export events to a newline-delimited JSON file, one event per line.
+        
+        Rows come from a named (server-side) cursor itersize rows at a time,
+        already serialized by PostgreSQL (row_to_json), and are written as
+        they arrive, optionally through a gzip or zstd compressor, so memory
+        use does not grow with the table. Timestamps are ISO 8601. A progress
+        line is printed every EXPORT_PROGRESS_ROWS rows.
+        
+        Args:
+            output_path: Path for output file
+            limit: Maximum number of records to export (None for all)
+            compression: 'gzip', 'zstd' or 'none' (default: from the file
+                suffix, .gz or .zst; zstd needs zstandard)
+            itersize: Rows per round trip (default: EXPORT_ITERSIZE)
+        
+        Returns:
+            int: Events exported
+        """
+        itersize = itersize or self.EXPORT_ITERSIZE
+        query = """
+            SELECT row_to_json(e)::text
+            FROM (
+                SELECT event_id, call_number, address, call_type, units, call_created,
+                       jurisdiction, agency_type, latitude, longitude,
+                       link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
+                       first_seen, last_seen, times_seen
+                FROM events
+                ORDER BY call_created DESC
+                {limit}
+            ) AS e
+        """.format(limit=f"LIMIT {int(limit)}" if limit else "")
+        
+        rows = 0
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor(name='export_events')
+            cursor.itersize = itersize
+            cursor.execute(query)
+            with _open_export(output_path, compression) as f:
+                while True:
+                    batch = cursor.fetchmany(itersize)
+                    if not batch:
+                        break
+                    f.write(''.join(f"{line}\n" for line, in batch).encode('utf-8'))
+                    if (rows + len(batch)) // self.EXPORT_PROGRESS_ROWS > rows // self.EXPORT_PROGRESS_ROWS:
+                        print(f"  {rows + len(batch):,} rows", flush=True)
+                    rows += len(batch)
+            cursor.close()
+            conn.rollback()
+        finally:
+            self._release_connection(conn)
+        
+        print(f"Exported {rows} events to {output_path}")
+        return rows
+    
+    def export_to_json(self, output_path: str, limit: Optional[int] = None):
+        """
+        Export events to JSON file.
+        
+        Args:
+            output_path: Path for output JSON file
+            limit: Maximum number of records to export (None for all)
+        """
+        import json
+        from psycopg2.extras import RealDictCursor
+        
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
         
         query = """
-            SELECT call_number, address, call_type, units, call_created,
-                   jurisdiction, agency_type, latitude, longitude, 
-                   link_url_1, first_seen, last_seen, times_seen
+            SELECT event_id, call_number, address, call_type, units, call_created,
+                   jurisdiction, agency_type, latitude, longitude,
+                   link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
+                   first_seen, last_seen, times_seen
             FROM events 
             ORDER BY call_created DESC
         """
@@ -620,110 +3367,918 @@ class DispatchIngester:
             query += f" LIMIT {limit}"
         
         cursor.execute(query)
-        rows = cursor.fetchall()
+        rows = [dict(row) for row in cursor.fetchall()]
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2, default=str)
+        
+        cursor.close()
+        self._release_connection(conn)
+        print(f"Exported {len(rows)} events to {output_path}")
+    
+    def search_events(self, 
+                      call_type: Optional[str] = None,
+                      jurisdiction: Optional[str] = None,
+                      address: Optional[str] = None,
+                      start_date: Optional[str] = None,
+                      end_date: Optional[str] = None,
+                      limit: int = 100,
+                      include_archive: bool = False,
+                      archive_dir: Optional[str] = None) -> list:
+        """
+        Search for events based on criteria.
+        
+        Args:
+            call_type: Filter by call type (partial match)
+            jurisdiction: Filter by jurisdiction (partial match)
+            address: Filter by address (partial match)
+            start_date: Start date filter (YYYY-MM-DD)
+            end_date: End date filter (YYYY-MM-DD)
+            limit: Maximum results to return
+            include_archive: Also search events moved to the archive (see
+                archive_events); needs pyarrow
+            archive_dir: Archive directory (default: ARCHIVE_DIR)
+        
+        Returns:
+            list: Matching events
+        """
+        from psycopg2.extras import RealDictCursor
+        
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        
+        query = "SELECT * FROM events WHERE 1=1"
+        params = []
+        
+        if call_type:
+            query += " AND call_type ILIKE %s"
+            params.append(f"%{call_type}%")
+        
+        if jurisdiction:
+            query += " AND jurisdiction ILIKE %s"
+            params.append(f"%{jurisdiction}%")
+        
+        if address:
+            query += " AND address ILIKE %s"
+            params.append(f"%{address}%")
+        
+        if start_date:
+            query += " AND call_created >= %s"
+            params.append(start_date)
+        
+        if end_date:
+            query += " AND call_created <= %s"
+            params.append(end_date + " 23:59:59")
+        
+        query += f" ORDER BY call_created DESC LIMIT {limit}"
+        
+        cursor.execute(query, params)
+        results = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.close()
+        self._release_connection(conn)
+        
+        if include_archive:
+            results += ArchiveReader(archive_dir or self.ARCHIVE_DIR).search(
+                call_type, jurisdiction, address, start_date, end_date, limit
+            )
+            # Same order as the query: newest first, NULLs first
+            results.sort(
+                key=lambda row: (row['call_created'] is None, row['call_created'] or datetime.min),
+                reverse=True
+            )
+            del results[limit:]
+        return results
+
+
+def _open_export(path: str, compression: Optional[str] = None):
+    """
+    Open an export file for binary writing, compressed on the fly.
+    
+    Args:
+        path: Output file path
+        compression: 'gzip', 'zstd' or 'none' (default: from the suffix,
+            .gz or .zst)
+    
+    Raises:
+        ImportError: If zstd is requested and zstandard is not installed
+        ValueError: For an unknown compression
+    """
+    if compression is None:
+        compression = {'.gz': 'gzip', '.zst': 'zstd'}.get(os.path.splitext(path)[1], 'none')
+    if compression == 'none':
+        return open(path, 'wb')
+    if compression == 'gzip':
+        import gzip
+        
+        return gzip.open(path, 'wb', compresslevel=6)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd exports need zstandard: pip install zstandard") from None
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb'))
+    raise ValueError(f"unknown compression: {compression}")
+
+
+class _CopyProgress:
+    """
+    File wrapper for COPY ... TO STDOUT that counts rows as they stream.
+    
+    The server sends one CopyData message per row and psycopg2 writes each
+    with one write() call, so calls are rows (the CSV header included).
+    """
+    
+    def __init__(self, f, every: int):
+        self.f = f
+        self.every = every
+        self.rows = 0
+        self.bytes = 0
+    
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self.f.write(data)
+        self.rows += 1
+        self.bytes += len(data)
+        if self.rows % self.every == 0:
+            print(f"  {self.rows:,} rows, {self.bytes / (1024 * 1024):.1f} MB", flush=True)
+        return len(data)
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow for the Parquet archive.
+    
+    Returns:
+        tuple: (pyarrow, pyarrow.parquet)
+    
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("the Parquet archive needs pyarrow: pip install pyarrow") from None
+    return pyarrow, pyarrow.parquet
+
+
+class ArchiveReader:
+    """
+    Reads events moved to Parquet files by DispatchIngester.archive_events().
+    
+    Files live under root/year=YYYY/month=MM/. A date range only opens the
+    months it overlaps, and files written before a column was added read
+    it as NULL. Needs pyarrow.
+    
+    Example:
+        >>> reader = ArchiveReader('archive')
+        >>> reader.search(call_type='FIRE', start_date='2023-01-01', limit=10)
+    """
+    
+    def __init__(self, root: str):
+        self.root = root
+    
+    def months(self) -> list:
+        """Return the archived months as (year, month) tuples, oldest first."""
+        import re
         
-        headers = [
-            'Call Number', 'Address', 'Call Type', 'Units', 'Call Created',
-            'Jurisdiction', 'Agency Type', 'Latitude', 'Longitude',
-            'Link URL', 'First Seen', 'Last Seen', 'Times Seen'
+        if not os.path.isdir(self.root):
+            return []
+        found = []
+        for year in os.listdir(self.root):
+            year_match = re.fullmatch(r'year=(\d{4})', year)
+            if not year_match:
+                continue
+            for month in os.listdir(os.path.join(self.root, year)):
+                month_match = re.fullmatch(r'month=(\d{2})', month)
+                if month_match:
+                    found.append((int(year_match.group(1)), int(month_match.group(1))))
+        return sorted(found)
+    
+    def files(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> list:
+        """Return the Parquet files of the months overlapping [start, end]."""
+        paths = []
+        for year, month in self.months():
+            if start and (year, month) < (start.year, start.month):
+                continue
+            if end and (year, month) > (end.year, end.month):
+                continue
+            directory = os.path.join(self.root, f"year={year:04d}", f"month={month:02d}")
+            paths += sorted(
+                os.path.join(directory, name) for name in os.listdir(directory)
+                if name.endswith('.parquet')
+            )
+        return paths
+    
+    def _dataset(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        """Open the files for a date range as one dataset (None if there are none)."""
+        pa, pq = _import_pyarrow()
+        import pyarrow.dataset as ds
+        
+        paths = self.files(start, end)
+        if not paths:
+            return None
+        schema = pa.unify_schemas([pq.read_schema(path) for path in paths])
+        return ds.dataset(paths, schema=schema, format='parquet')
+    
+    def search(self,
+               call_type: Optional[str] = None,
+               jurisdiction: Optional[str] = None,
+               address: Optional[str] = None,
+               start_date: Optional[str] = None,
+               end_date: Optional[str] = None,
+               limit: int = 100) -> list:
+        """
+        Search archived events, with the filters of DispatchIngester.search_events().
+        
+        Returns:
+            list: Matching events as dicts, newest first
+        """
+        pa, _ = _import_pyarrow()
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        
+        start = datetime.fromisoformat(start_date) if start_date else None
+        end = datetime.fromisoformat(end_date + " 23:59:59") if end_date else None
+        dataset = self._dataset(start, end)
+        if dataset is None:
+            return []
+        
+        conditions = [
+            pc.match_substring(ds.field(column), text, ignore_case=True)
+            for column, text in (('call_type', call_type), ('jurisdiction', jurisdiction), ('address', address))
+            if text
         ]
+        if start:
+            conditions.append(ds.field('call_created') >= pa.scalar(start, pa.timestamp('us')))
+        if end:
+            conditions.append(ds.field('call_created') <= pa.scalar(end, pa.timestamp('us')))
+        condition = None
+        for expression in conditions:
+            condition = expression if condition is None else condition & expression
+        
+        table = dataset.to_table(filter=condition)
+        table = table.sort_by([('call_created', 'descending')]).slice(0, limit)
+        loads = json_codec()[1]
+        results = table.to_pylist()
+        for row in results:
+            if isinstance(row.get('raw_data'), str):
+                row['raw_data'] = loads(row['raw_data'])
+        return results
+    
+    def stats(self) -> dict:
+        """
+        Count archived events like DispatchIngester.get_stats() counts events.
+        
+        Returns:
+            dict: total_events, by_agency_type, top_call_types and
+                top_jurisdictions (full counts, not cut to 15), earliest,
+                latest, files and size_bytes
+        """
+        _import_pyarrow()
+        import pyarrow.compute as pc
+        
+        paths = self.files()
+        stats = {
+            'total_events': 0, 'by_agency_type': {}, 'top_call_types': {}, 'top_jurisdictions': {},
+            'earliest': None, 'latest': None, 'files': len(paths),
+            'size_bytes': sum(os.path.getsize(path) for path in paths),
+        }
+        dataset = self._dataset()
+        if dataset is None:
+            return stats
+        
+        table = dataset.to_table(columns=['agency_type', 'call_type', 'jurisdiction', 'call_created'])
+        stats['total_events'] = table.num_rows
+        for key, column in (('by_agency_type', 'agency_type'), ('top_call_types', 'call_type'),
+                            ('top_jurisdictions', 'jurisdiction')):
+            stats[key] = {
+                item['values']: item['counts'] for item in pc.value_counts(table[column]).to_pylist()
+            }
+        date_range = pc.min_max(table['call_created']).as_py()
+        stats['earliest'], stats['latest'] = date_range['min'], date_range['max']
+        return stats
+
+
+class AsyncIngestEngine:
+    """
+    asyncio ingest pipeline for many sources (opt-in with --async).
+    
+    Writes the same rows and ingestion_log entries as DispatchIngester.ingest(),
+    but fetches with aiohttp and writes with asyncpg, so polling dozens of
+    feeds needs neither a thread nor a blocking connection per source. Polls
+    flow through three overlapping stages:
+        
+        fetch    up to `fetchers` requests in flight
+        queue    fetched payloads waiting for a writer (bounded)
+        write    `writers` tasks that parse, map and write one payload each
+    
+    While one batch is being written the next sources are already fetched and
+    parsed. Per-source state (poll validators, snapshot) and the pure helpers
+    (fingerprint, mapping, collapse, delta classification) come from one
+    DispatchIngester per source, so both paths share their logic.
+    
+    Requires the optional aiohttp and asyncpg packages.
+    """
+    
+    # events columns written from a mapped event (in Event field order), with
+    # their element types for the unnest() arrays that carry a batch
+    EVENT_COLUMNS = (
+        ('event_id', 'text'), ('call_number', 'text'), ('address', 'text'),
+        ('call_type', 'text'), ('units', 'text'), ('call_created', 'timestamp'),
+        ('jurisdiction', 'text'), ('agency_type', 'text'),
+        ('longitude', 'double precision'), ('latitude', 'double precision'),
+        ('link_url_1', 'text'), ('link_url_2', 'text'), ('link_url_3', 'text'),
+        ('link_url_4', 'text'), ('link_url_5', 'text'),
+        ('column_1', 'text'), ('column_2', 'text'), ('column_3', 'text'),
+        ('column_4', 'text'), ('column_5', 'text'), ('column_6', 'text'),
+        ('column_7', 'text'), ('column_8', 'text'), ('column_9', 'text'),
+        ('column_10', 'text'), ('raw_data', 'jsonb'),
+        ('source_title', 'text'), ('source_token', 'text'),
+    )
+    
+    # Columns rewritten for events whose content changed (see _refresh_changed)
+    REFRESH_COLUMNS = tuple(
+        name for name, _ in EVENT_COLUMNS
+        if name not in ('call_number', 'source_title', 'source_token')
+    )
+    
+    # Payloads at least this large are scanned and mapped in a worker thread
+    # (see _prepare and _store) instead of on the event loop
+    EXECUTOR_MIN_BYTES = 256 * 1024
+    
+    def __init__(self, db_config: dict, sources: list, fetchers: int = 16, writers: int = 4):
+        """
+        Args:
+            db_config: PostgreSQL connection configuration
+            sources: Sources from load_sources()
+            fetchers: Requests in flight at the same time
+            writers: Concurrent database writers (and pooled connections)
+        """
+        self.db_config = db_config
+        self.sources = sources
+        self.fetchers = fetchers
+        self.writers = writers
+        self.ingesters = {
+            source['name']: DispatchIngester(db_config=db_config, pub_token=source['token'])
+            for source in sources
+        }
+        
+        columns = len(self.EVENT_COLUMNS)
+        self._incoming = "unnest({}, ${}::integer[]) AS i ({}, hits)".format(
+            ', '.join(f'${n}::{kind}[]' for n, (_, kind) in enumerate(self.EVENT_COLUMNS, 1)),
+            columns + 1,
+            ', '.join(name for name, _ in self.EVENT_COLUMNS)
+        )
+        self._seen_at = f'${columns + 2}::timestamp'
+    
+    async def run(self, interval_seconds: int = 300, once: bool = False) -> Optional[dict]:
+        """
+        Poll every source once (once=True) or on its own interval until stopped.
+        
+        Returns:
+            dict: Ingestion results by source name when once=True, else None
+        """
+        import asyncio
+        import signal
+        import aiohttp
+        import asyncpg
+        
+        # Schema check/migrations run once through the regular sync path
+        owner = next(iter(self.ingesters.values()))
+        owner._init_database().close()
+        self._owner = owner
+        
+        self._pool = await asyncpg.create_pool(
+            host=self.db_config['host'],
+            port=self.db_config['port'],
+            database=self.db_config['database'],
+            user=self.db_config['user'],
+            password=self.db_config['password'] or None,
+            min_size=1,
+            max_size=self.writers + 1,
+            init=self._init_connection
+        )
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.fetchers),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=DispatchIngester.CONNECT_TIMEOUT,
+                sock_read=DispatchIngester.READ_TIMEOUT
+            ),
+            headers={'Accept': 'application/json', 'Accept-Encoding': 'gzip, deflate'}
+        )
+        self._fetch_slots = asyncio.Semaphore(self.fetchers)
+        self._queue = asyncio.Queue(maxsize=self.writers * 2)
+        writers = [asyncio.create_task(self._writer()) for _ in range(self.writers)]
+        
+        try:
+            if once:
+                results = await asyncio.gather(*(self._poll(name) for name in self.ingesters))
+                return dict(zip(self.ingesters, results))
+            
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(signum, stop.set)
+            
+            print(f"Starting async ingest daemon for {len(self.sources)} sources (pid {os.getpid()})")
+            await asyncio.gather(*(
+                self._poll_forever(source, source['interval'] or interval_seconds, stop)
+                for source in self.sources
+            ))
+            return None
+        finally:
+            for task in writers:
+                task.cancel()
+            await asyncio.gather(*writers, return_exceptions=True)
+            await self._session.close()
+            await self._pool.close()
+            if not once:
+                print("Daemon stopped")
+    
+    async def _init_connection(self, conn):
+        """
+        Send jsonb parameters in binary format.
+        
+        raw_data arrives as serialized JSON bytes and is passed through as is
+        (binary jsonb is a version byte followed by the JSON text).
+        """
+        def encode(value) -> bytes:
+            return b'\x01' + (value if isinstance(value, bytes) else value.encode('utf-8'))
+        
+        def decode(data: bytes):
+            return json_codec()[1](data[1:])
+        
+        await conn.set_type_codec('jsonb', schema='pg_catalog', encoder=encode, decoder=decode, format='binary')
+    
+    async def _poll_forever(self, source: dict, interval: int, stop):
+        """Poll one source on a fixed monotonic timeline until stop is set (see run_daemon)."""
+        import asyncio
+        
+        next_run = time.monotonic()
+        while not stop.is_set():
+            await self._poll(source['name'])
+            
+            next_run += interval
+            now = time.monotonic()
+            if next_run <= now:
+                skipped = int((now - next_run) // interval) + 1
+                next_run += skipped * interval
+                print(f"Poll of {source['name']} overran its interval, skipping {skipped} slot(s)")
+            try:
+                await asyncio.wait_for(stop.wait(), next_run - now)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _poll(self, name: str) -> dict:
+        """
+        Fetch one source and hand the payload to a writer.
+        
+        Returns:
+            dict: Summary of ingestion results, as DispatchIngester.ingest()
+        """
+        import asyncio
+        
+        ingester = self.ingesters[name]
+        start_time = time.time()
+        result = {
+            'events_fetched': 0,
+            'new_events': 0,
+            'updated_events': 0,
+            'status': 'success',
+            'error_message': None,
+            'duration_seconds': 0
+        }
+        print(f"\n[{datetime.now().isoformat()}] Running ingestion for {name}...")
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(rows)
+        try:
+            async with self._fetch_slots:
+                if ingester._poll_state is None:
+                    async with self._pool.acquire() as conn:
+                        ingester._poll_state = await self._load_poll_state(conn, ingester)
+                payload = await self._fetch(ingester)
+        except Exception as e:
+            await self._fail(name, result, start_time, e)
+            return result
         
-        cursor.close()
-        conn.close()
-        print(f"Exported {len(rows)} events to {output_path}")
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((name, payload, datetime.now(), start_time, result, done))
+        return await done
     
-    def export_to_json(self, output_path: str, limit: Optional[int] = None):
+    async def _fetch(self, ingester: DispatchIngester):
         """
-        Export events to JSON file.
+        Fetch a source's payload; the async counterpart of _fetch_payload().
         
-        Args:
-            output_path: Path for output JSON file
-            limit: Maximum number of records to export (None for all)
+        Returns:
+            Spooled response body, or None if the server answered 304 Not Modified
         """
-        conn = self._get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        import tempfile
+        import aiohttp
         
-        query = """
-            SELECT event_id, call_number, address, call_type, units, call_created,
-                   jurisdiction, agency_type, latitude, longitude,
-                   link_url_1, link_url_2, link_url_3, link_url_4, link_url_5,
-                   first_seen, last_seen, times_seen
-            FROM events 
-            ORDER BY call_created DESC
+        headers = {}
+        state = ingester._poll_state or {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('http_last_modified'):
+            headers['If-Modified-Since'] = state['http_last_modified']
+        
+        try:
+            async with self._session.get(
+                    ingester.BASE_URL, params={'pubToken': ingester.pub_token}, headers=headers) as response:
+                if response.status == 304:
+                    return None
+                response.raise_for_status()
+                ingester._response_validators = {
+                    'etag': response.headers.get('ETag'),
+                    'http_last_modified': response.headers.get('Last-Modified')
+                }
+                payload = tempfile.SpooledTemporaryFile(max_size=ingester.SPOOL_MAX_MEMORY)
+                try:
+                    async for chunk in response.content.iter_chunked(ingester.STREAM_CHUNK_SIZE):
+                        payload.write(chunk)
+                except BaseException:
+                    payload.close()
+                    raise
+                payload.seek(0)
+                return payload
+        except aiohttp.ClientError as e:
+            raise Exception(f"Failed to fetch data: {e}")
+    
+    async def _writer(self):
+        """Write stage: take fetched payloads off the queue and store them."""
+        while True:
+            name, payload, now, start_time, result, done = await self._queue.get()
+            try:
+                await self._store(name, payload, now, start_time, result)
+            except Exception as e:
+                await self._fail(name, result, start_time, e)
+            finally:
+                if payload is not None:
+                    payload.close()
+                self._queue.task_done()
+            if not done.cancelled():
+                done.set_result(result)
+    
+    def _prepare(self, ingester: DispatchIngester, payload) -> tuple:
         """
-        if limit:
-            query += f" LIMIT {limit}"
+        Scan one payload and set up the mapping of its rows.
         
-        cursor.execute(query)
-        rows = [dict(row) for row in cursor.fetchall()]
+        The batches are produced lazily, one per _row_chunks chunk, so only
+        the chunk being written is held in memory, as on the sync path.
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(rows, f, indent=2, default=str)
+        Returns:
+            tuple: (metadata, row count, fingerprint, collapsed batches), the
+            batches a generator, or None when the payload matches the last
+            stored poll
+        """
+        if payload is None:
+            return {}, 0, None, None
+        metadata, row_count, fingerprint = ingester._scan_payload(payload)
+        state = ingester._poll_state
+        if state.get('last_polled') and fingerprint == state.get('payload_hash'):
+            return metadata, row_count, fingerprint, None
         
-        cursor.close()
-        conn.close()
-        print(f"Exported {len(rows)} events to {output_path}")
+        mapper = ingester._row_mapper(metadata.get('columns', []))
+        source_title = metadata.get('title', '')
+        batches = (
+            ingester._collapse_batch([mapper(row, source_title) for row in rows])
+            for rows in ingester._row_chunks(payload)
+        )
+        return metadata, row_count, fingerprint, batches
     
-    def search_events(self, 
-                      call_type: Optional[str] = None,
-                      jurisdiction: Optional[str] = None,
-                      address: Optional[str] = None,
-                      start_date: Optional[str] = None,
-                      end_date: Optional[str] = None,
-                      limit: int = 100) -> list:
+    async def _store(self, name: str, payload, now: datetime, start_time: float, result: dict):
         """
-        Search for events based on criteria.
+        Parse, map and write one payload; mirrors the body of DispatchIngester.ingest().
         
-        Args:
-            call_type: Filter by call type (partial match)
-            jurisdiction: Filter by jurisdiction (partial match)
-            address: Filter by address (partial match)
-            start_date: Start date filter (YYYY-MM-DD)
-            end_date: End date filter (YYYY-MM-DD)
-            limit: Maximum results to return
-            
-        Returns:
-            list: Matching events
+        The payload is scanned (_prepare) before a pooled connection is
+        taken, then mapped and written one chunk at a time. For payloads of
+        EXECUTOR_MIN_BYTES or more the scan and each chunk's mapping run in
+        the default executor, so other sources' fetches and writes keep
+        running meanwhile.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        import asyncio
         
-        query = "SELECT * FROM events WHERE 1=1"
-        params = []
+        ingester = self.ingesters[name]
+        owner = self._owner
+        loop = asyncio.get_running_loop()
+        if owner._partitioned and owner._partition_month != (now.year, now.month):
+            # New month in a resident daemon: prepare partitions on the sync path
+            owner._partition_month = (now.year, now.month)
+            await loop.run_in_executor(None, owner.ensure_partitions)
+        size = 0
+        if payload is not None:
+            payload.seek(0, os.SEEK_END)
+            size = payload.tell()
+        offload = size >= self.EXECUTOR_MIN_BYTES
+        if offload:
+            prepared = await loop.run_in_executor(None, self._prepare, ingester, payload)
+        else:
+            prepared = self._prepare(ingester, payload)
+        metadata, row_count, fingerprint, batches = prepared
+        snapshot = ingester._snapshot
         
-        if call_type:
-            query += " AND call_type ILIKE %s"
-            params.append(f"%{call_type}%")
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                state = ingester._poll_state
+                if batches is None:
+                    touched = await self._touch_unchanged(conn, ingester, now)
+                    result['status'] = 'unchanged'
+                    result['events_fetched'] = row_count if payload is not None else touched
+                    result['updated_events'] = touched
+                else:
+                    result['events_fetched'] = row_count
+                    
+                    await self._save_metadata(conn, ingester, metadata)
+                    
+                    snapshot = {}
+                    delta = dict.fromkeys(('new', 'changed', 'unchanged', 'disappeared'), 0)
+                    while True:
+                        if offload:
+                            batch = await loop.run_in_executor(None, next, batches, None)
+                        else:
+                            batch = next(batches, None)
+                        if batch is None:
+                            break
+                        new_events, updated_events = await self._write_delta(
+                            conn, ingester, batch, now, snapshot, delta)
+                        result['new_events'] += new_events
+                        result['updated_events'] += updated_events
+                    delta = ingester._finish_delta(snapshot, delta)
+                    if delta is not None:
+                        result['delta'] = delta
+                    
+                    ingester._poll_state = dict(
+                        ingester._response_validators, payload_hash=fingerprint,
+                        metadata_hash=state.get('metadata_hash')
+                    )
+                
+                ingester._poll_state['last_polled'] = now
+                await self._save_poll_state(conn, ingester)
+            ingester._snapshot = snapshot
+            
+            result['duration_seconds'] = time.time() - start_time
+            async with conn.transaction():
+                batch_id = await conn.fetchval("""
+                    INSERT INTO ingestion_log (events_fetched, new_events, updated_events, status, duration_seconds, source_token)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    RETURNING id
+                """, result['events_fetched'], result['new_events'], result['updated_events'],
+                    result['status'], result['duration_seconds'], ingester.pub_token)
+                await self._notify_batch(conn, ingester, batch_id, result)
+                await conn.execute("""
+                    DELETE FROM event_changes
+                    WHERE (xid, seq) <= (SELECT xid, seq FROM change_consumers ORDER BY xid, seq LIMIT 1)
+                """)
         
-        if jurisdiction:
-            query += " AND jurisdiction ILIKE %s"
-            params.append(f"%{jurisdiction}%")
+        print(f"Ingestion complete for {name}: {result['new_events']} new, "
+              f"{result['updated_events']} updated ({result['duration_seconds']:.2f}s)")
+    
+    async def _notify_batch(self, conn, ingester: DispatchIngester, batch_id: int, result: dict):
+        """Async counterpart of DispatchIngester._notify_batch()."""
+        await conn.execute("""
+            SELECT pg_notify($1, json_build_object(
+                'batch', $2::integer, 'source', $3::text, 'status', $4::text,
+                'new', $5::integer, 'updated', $6::integer,
+                'max_id', (SELECT MAX(id) FROM events)
+            )::text)
+        """, ingester.NOTIFY_CHANNEL, batch_id, ingester.pub_token, result['status'],
+            result['new_events'], result['updated_events'])
+    
+    async def _fail(self, name: str, result: dict, start_time: float, error: Exception):
+        """Record a failed poll the way DispatchIngester.ingest() does."""
+        ingester = self.ingesters[name]
+        result['status'] = 'error'
+        result['error_message'] = str(error)
+        result['duration_seconds'] = time.time() - start_time
+        print(f"Error during ingestion for {name}: {error}")
         
-        if address:
-            query += " AND address ILIKE %s"
-            params.append(f"%{address}%")
+        ingester._poll_state = None
+        ingester._snapshot = None
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute("""
+                    INSERT INTO ingestion_log (events_fetched, new_events, updated_events, status, error_message, duration_seconds, source_token)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7)
+                """, 0, 0, 0, 'error', str(error), result['duration_seconds'], ingester.pub_token)
+        except Exception:
+            pass
+    
+    async def _load_poll_state(self, conn, ingester: DispatchIngester) -> dict:
+        """Async counterpart of DispatchIngester._load_poll_state()."""
+        row = await conn.fetchrow("""
+            SELECT etag, http_last_modified, payload_hash, last_polled, metadata_hash
+            FROM source_metadata
+            WHERE source_token = $1
+        """, ingester.pub_token)
+        return dict(row) if row else {}
+    
+    async def _save_poll_state(self, conn, ingester: DispatchIngester):
+        """Async counterpart of DispatchIngester._save_poll_state()."""
+        state = ingester._poll_state
+        await conn.execute("""
+            UPDATE source_metadata SET
+                etag = $1,
+                http_last_modified = $2,
+                payload_hash = $3,
+                last_polled = $4,
+                metadata_hash = $5
+            WHERE source_token = $6
+        """, state.get('etag'), state.get('http_last_modified'), state.get('payload_hash'),
+            state.get('last_polled'), state.get('metadata_hash'), ingester.pub_token)
+    
+    async def _touch_unchanged(self, conn, ingester: DispatchIngester, now: datetime) -> int:
+        """Async counterpart of DispatchIngester._touch_unchanged()."""
+        status = await conn.execute(
+            """
+            UPDATE events SET last_seen = $1, times_seen = times_seen + 1
+            WHERE source_token = $2 AND last_seen = $3
+            """,
+            now, ingester.pub_token, ingester._poll_state['last_polled']
+        )
+        return int(status.split()[-1])
+    
+    async def _save_source_metadata(self, conn, ingester: DispatchIngester, data: dict):
+        """Async counterpart of DispatchIngester._save_source_metadata()."""
+        import json
         
-        if start_date:
-            query += " AND call_created >= %s"
-            params.append(start_date)
+        await conn.execute("""
+            INSERT INTO source_metadata (
+                source_token, title, logo_url, disclaimer, time_format,
+                filters, default_sort_column, default_sort_direction, last_updated
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, CURRENT_TIMESTAMP)
+            ON CONFLICT (source_token) DO UPDATE SET
+                title = EXCLUDED.title,
+                logo_url = EXCLUDED.logo_url,
+                disclaimer = EXCLUDED.disclaimer,
+                time_format = EXCLUDED.time_format,
+                filters = EXCLUDED.filters,
+                default_sort_column = EXCLUDED.default_sort_column,
+                default_sort_direction = EXCLUDED.default_sort_direction,
+                last_updated = CURRENT_TIMESTAMP
+        """, ingester.pub_token, data.get('title'), data.get('logoUrl'), data.get('disclaimer'),
+            data.get('timeFormat'), json.dumps(data.get('filters', [])),
+            data.get('defaultSortColumn'), data.get('defaultSortDirection'))
+    
+    async def _save_metadata(self, conn, ingester: DispatchIngester, metadata: dict) -> bool:
+        """Async counterpart of DispatchIngester._save_metadata()."""
+        fingerprint = ingester._metadata_fingerprint(metadata)
+        if fingerprint == ingester._poll_state.get('metadata_hash'):
+            return False
         
-        if end_date:
-            query += " AND call_created <= %s"
-            params.append(end_date + " 23:59:59")
+        await self._save_source_metadata(conn, ingester, metadata)
+        await self._save_column_definitions(conn, ingester, metadata.get('columns', []))
+        ingester._poll_state['metadata_hash'] = fingerprint
+        return True
+    
+    async def _save_column_definitions(self, conn, ingester: DispatchIngester, columns: list):
+        """Async counterpart of DispatchIngester._save_column_definitions(), over unnest() arrays."""
+        rows = ingester._column_rows(columns)
+        if not rows:
+            return
+        _, fields, headers, orders = zip(*rows)
+        await conn.execute("""
+            INSERT INTO column_definitions (source_token, column_field, column_header, column_order, last_updated)
+            SELECT $1, c.field, c.header, c.column_order, CURRENT_TIMESTAMP
+            FROM unnest($2::text[], $3::text[], $4::integer[]) AS c (field, header, column_order)
+            ON CONFLICT (source_token, column_field) DO UPDATE SET
+                column_header = EXCLUDED.column_header,
+                column_order = EXCLUDED.column_order,
+                last_updated = CURRENT_TIMESTAMP
+        """, ingester.pub_token, list(fields), list(headers), list(orders))
+    
+    def _batch_arrays(self, batch: list) -> list:
+        """
+        Turn a collapsed batch into one array per EVENT_COLUMNS entry plus hits.
         
-        query += f" ORDER BY call_created DESC LIMIT {limit}"
+        asyncpg encodes parameters strictly by type, so text columns get str
+        values and timestamps drop any UTC offset, matching what psycopg2's
+        literal casts store on the sync path.
+        """
+        arrays = []
+        for (_, kind), values in zip(self.EVENT_COLUMNS, zip(*(event for event, _ in batch))):
+            values = list(values)
+            if kind == 'text':
+                values = [value if value is None or isinstance(value, str) else str(value) for value in values]
+            elif kind == 'timestamp':
+                values = [value.replace(tzinfo=None) if value is not None else None for value in values]
+            arrays.append(values)
+        arrays.append([hits for _, hits in batch])
+        return arrays
+    
+    async def _write_delta(self, conn, ingester: DispatchIngester, batch: list, now: datetime,
+                           snapshot: dict, delta: dict) -> tuple:
+        """Async counterpart of DispatchIngester._write_delta()."""
+        unknown, changed, unchanged, repeated = ingester._classify_batch(batch, snapshot)
+        delta['new'] += len(unknown)
+        delta['changed'] += len(changed)
+        delta['unchanged'] += len(unchanged)
         
-        cursor.execute(query, params)
-        results = [dict(row) for row in cursor.fetchall()]
+        updated_events = 0
+        missing = []
+        for entries, refresh in ((changed, self._refresh_changed),
+                                 (unchanged + repeated, self._bump_unchanged)):
+            if entries:
+                hits, not_found = ingester._match_refreshed(entries, await refresh(conn, entries, now))
+                updated_events += hits
+                missing += not_found
         
-        cursor.close()
-        conn.close()
-        return results
+        new_events, upserted = await self._upsert_events(conn, ingester, unknown + missing, now)
+        updated_events += upserted
+        return new_events, updated_events
+    
+    async def _refresh_changed(self, conn, batch: list, now: datetime) -> set:
+        """Async counterpart of DispatchIngester._refresh_changed()."""
+        rows = await conn.fetch(f"""
+            UPDATE events e SET
+                {', '.join(f'{name} = i.{name}' for name in self.REFRESH_COLUMNS)},
+                last_seen = {self._seen_at},
+                times_seen = e.times_seen + i.hits
+            FROM {self._incoming}
+            WHERE e.call_number = i.call_number
+              AND e.call_created::date = i.call_created::date
+              AND e.source_token = i.source_token
+            RETURNING i.call_number, i.call_created::date
+        """, *self._batch_arrays(batch), now)
+        return {tuple(row) for row in rows}
+    
+    async def _bump_unchanged(self, conn, batch: list, now: datetime) -> set:
+        """Async counterpart of DispatchIngester._bump_unchanged()."""
+        arrays = self._batch_arrays(batch)
+        rows = await conn.fetch("""
+            UPDATE events e SET
+                last_seen = $1,
+                times_seen = e.times_seen + s.hits,
+                event_id = s.event_id
+            FROM unnest($2::text[], $3::date[], $4::text[], $5::integer[])
+                AS s (call_number, call_date, event_id, hits)
+            WHERE e.call_number = s.call_number
+              AND e.call_created::date = s.call_date
+              AND e.source_token = $6
+            RETURNING s.call_number, s.call_date
+        """, now, arrays[1], [event.call_created.date() for event, _ in batch], arrays[0], arrays[-1],
+            batch[0][0].source_token)
+        return {tuple(row) for row in rows}
+    
+    async def _upsert_events(self, conn, ingester: DispatchIngester, batch: list, now: datetime) -> tuple:
+        """Upsert a collapsed batch in one INSERT ... ON CONFLICT over unnest() arrays."""
+        if not batch:
+            return 0, 0
+        if self._owner._partitioned:
+            return await self._update_then_insert(conn, ingester, batch, now)
+        
+        columns = ', '.join(name for name, _ in self.EVENT_COLUMNS)
+        rows = await conn.fetch(f"""
+            INSERT INTO events ({columns}, first_seen, last_seen, times_seen)
+            SELECT {', '.join(f'i.{name}' for name, _ in self.EVENT_COLUMNS)},
+                   {self._seen_at}, {self._seen_at}, i.hits
+            FROM {self._incoming}
+            ON CONFLICT (call_number, (call_created::date), source_token) DO UPDATE SET
+                {', '.join(f'{name} = EXCLUDED.{name}' for name in self.REFRESH_COLUMNS)},
+                last_seen = EXCLUDED.last_seen,
+                times_seen = events.times_seen + EXCLUDED.times_seen
+            RETURNING (xmax = 0) AS inserted, call_number, call_created::date
+        """, *self._batch_arrays(batch), now)
+        return ingester._count_upserted(batch, [tuple(row) for row in rows])
+    
+    async def _update_then_insert(self, conn, ingester: DispatchIngester, batch: list, now: datetime) -> tuple:
+        """
+        Upsert without ON CONFLICT, for a partitioned events table.
+        
+        Mirrors the update-then-insert statement of DispatchIngester._upsert_events().
+        """
+        columns = ', '.join(name for name, _ in self.EVENT_COLUMNS)
+        rows = await conn.fetch(f"""
+            WITH updated AS (
+                UPDATE events e SET
+                    {', '.join(f'{name} = i.{name}' for name in self.REFRESH_COLUMNS)},
+                    last_seen = {self._seen_at},
+                    times_seen = e.times_seen + i.hits
+                FROM {self._incoming}
+                WHERE e.call_number = i.call_number
+                  AND e.call_created::date = i.call_created::date
+                  AND e.source_token = i.source_token
+                RETURNING i.call_number, i.call_created::date AS call_date
+            ),
+            inserted AS (
+                INSERT INTO events ({columns}, first_seen, last_seen, times_seen)
+                SELECT {', '.join(f'i.{name}' for name, _ in self.EVENT_COLUMNS)},
+                       {self._seen_at}, {self._seen_at}, i.hits
+                FROM {self._incoming}
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM events e
+                    WHERE e.call_number = i.call_number
+                      AND e.call_created::date = i.call_created::date
+                      AND e.source_token = i.source_token
+                )
+                RETURNING call_number, call_created::date AS call_date
+            )
+            SELECT true, call_number, call_date FROM inserted
+            UNION ALL
+            SELECT DISTINCT false, call_number, call_date FROM updated
+        """, *self._batch_arrays(batch), now)
+        return ingester._count_upserted(batch, [tuple(row) for row in rows])
 
 
 def run_scheduler(ingester: DispatchIngester, interval_minutes: int = 15):
@@ -744,6 +4299,233 @@ def run_scheduler(ingester: DispatchIngester, interval_minutes: int = 15):
         time.sleep(interval_minutes * 60)
 
 
+def run_daemon(ingester: DispatchIngester, interval_seconds: int = 300, pool_size: int = 2):
+    """
+    Run ingestion cycles in a resident process.
+    
+    Unlike a cron launch per cycle, the process keeps its database connection
+    pool and HTTP session warm, and database setup runs only once at startup.
+    Cycles are scheduled on a fixed monotonic timeline (start + n * interval),
+    so run time does not accumulate as drift; if a cycle overruns, the missed
+    slots are skipped. SIGTERM and SIGINT stop the daemon after the current
+    cycle.
+    
+    Args:
+        ingester: DispatchIngester instance
+        interval_seconds: Seconds between cycle starts
+        pool_size: Maximum pooled database connections
+    """
+    import signal
+    import threading
+    
+    stop = threading.Event()
+    
+    def request_stop(signum, frame):
+        print(f"\nReceived signal {signum}, stopping after current cycle")
+        stop.set()
+    
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    
+    ingester.open_pool(minconn=1, maxconn=pool_size)
+    print(f"Starting ingest daemon every {interval_seconds} seconds (pid {os.getpid()})")
+    
+    next_run = time.monotonic()
+    try:
+        while not stop.is_set():
+            print(f"\n[{datetime.now().isoformat()}] Running ingestion...")
+            ingester.ingest()
+            
+            next_run += interval_seconds
+            now = time.monotonic()
+            if next_run <= now:
+                skipped = int((now - next_run) // interval_seconds) + 1
+                next_run += skipped * interval_seconds
+                print(f"Cycle overran the interval, skipping {skipped} slot(s)")
+            
+            stop.wait(next_run - now)
+    finally:
+        ingester.close()
+        print("Daemon stopped")
+
+
+def load_sources(path: str) -> list:
+    """
+    Read a sources config file for multi-source ingestion.
+    
+    The file is JSON, either a list of sources or {"sources": [...]}. Each
+    source needs a pubToken under "token" and may set a "name" (used in log
+    output) and an "interval" in seconds:
+        
+        {"sources": [
+            {"name": "snohomish", "token": "...", "interval": 300},
+            {"name": "king", "token": "...", "interval": 120}
+        ]}
+    
+    Args:
+        path: Path to the config file
+    
+    Returns:
+        list: Sources as dicts with name, token and interval (None: default)
+    
+    Raises:
+        ValueError: If a source has no token or a token is listed twice
+    """
+    import json
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    entries = config.get('sources', []) if isinstance(config, dict) else config
+    
+    sources = []
+    seen = set()
+    for i, entry in enumerate(entries, 1):
+        token = entry.get('token')
+        if not token:
+            raise ValueError(f"{path}: source {i} has no token")
+        if token in seen:
+            raise ValueError(f"{path}: token {token} is listed more than once")
+        seen.add(token)
+        sources.append({
+            'name': entry.get('name') or token,
+            'token': token,
+            'interval': entry.get('interval')
+        })
+    return sources
+
+
+def run_sources(db_config: dict, sources: list, interval_seconds: int = 300,
+                workers: int = 8, pool_size: int = 2, once: bool = False) -> Optional[dict]:
+    """
+    Ingest several FirstWatch sources concurrently from one process.
+    
+    Each source gets its own DispatchIngester (HTTP session, poll state,
+    snapshot), and all of them share one database connection pool. Polls run
+    on a thread pool, so slow feeds overlap instead of queueing behind each
+    other. Failures stay isolated: an error in one source is logged for that
+    source and the others carry on.
+    
+    With once=True every source is ingested once and the results are
+    returned. Otherwise sources are scheduled like run_daemon, each on its own
+    fixed timeline (its "interval", or interval_seconds); a slot that comes up
+    while the source's previous poll is still running is skipped.
+    
+    Args:
+        db_config: PostgreSQL connection configuration
+        sources: Sources from load_sources()
+        interval_seconds: Default seconds between polls of a source
+        workers: Sources polled at the same time
+        pool_size: Maximum pooled database connections (raised to workers)
+        once: Ingest each source once and return instead of running resident
+    
+    Returns:
+        dict: Ingestion results by source name when once=True, else None
+    """
+    import heapq
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    
+    ingesters = {
+        source['name']: DispatchIngester(db_config=db_config, pub_token=source['token'])
+        for source in sources
+    }
+    owner = next(iter(ingesters.values()))
+    owner.open_pool(minconn=1, maxconn=max(pool_size, workers))
+    for ingester in ingesters.values():
+        if ingester is not owner:
+            ingester.share_pool(owner)
+    
+    def poll(name: str) -> dict:
+        print(f"\n[{datetime.now().isoformat()}] Running ingestion for {name}...")
+        try:
+            return ingesters[name].ingest()
+        except Exception as e:
+            # ingest() logs its own errors; this only guards the worker thread
+            print(f"Error during ingestion for {name}: {e}")
+            return {'status': 'error', 'error_message': str(e)}
+    
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ingest')
+    try:
+        if once:
+            return dict(zip(ingesters, executor.map(poll, ingesters)))
+        
+        import signal
+        
+        stop = threading.Event()
+        
+        def request_stop(signum, frame):
+            print(f"\nReceived signal {signum}, stopping after running polls")
+            stop.set()
+        
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        
+        print(f"Starting ingest daemon for {len(sources)} sources with {workers} workers (pid {os.getpid()})")
+        
+        start = time.monotonic()
+        schedule = [(start, i, source) for i, source in enumerate(sources)]
+        running = {}
+        while not stop.is_set():
+            due, i, source = schedule[0]
+            now = time.monotonic()
+            if due > now:
+                stop.wait(due - now)
+                continue
+            
+            name = source['name']
+            if name in running and not running[name].done():
+                print(f"Previous poll of {name} still running, skipping a slot")
+            else:
+                running[name] = executor.submit(poll, name)
+            
+            interval = source['interval'] or interval_seconds
+            due += interval
+            if due <= now:
+                due += (int((now - due) // interval) + 1) * interval
+            heapq.heapreplace(schedule, (due, i, source))
+        return None
+    finally:
+        executor.shutdown(wait=True)
+        for ingester in ingesters.values():
+            if ingester is not owner:
+                ingester.close()
+        owner.close()
+        if not once:
+            print("Daemon stopped")
+
+
+def run_async(db_config: dict, sources: list, interval_seconds: int = 300,
+              fetchers: int = 16, writers: int = 4, once: bool = False) -> Optional[dict]:
+    """
+    Ingest sources with AsyncIngestEngine (the asyncio counterpart of run_sources).
+    
+    Args:
+        db_config: PostgreSQL connection configuration
+        sources: Sources from load_sources()
+        interval_seconds: Default seconds between polls of a source
+        fetchers: Requests in flight at the same time
+        writers: Concurrent database writers
+        once: Ingest each source once and return instead of running resident
+    
+    Returns:
+        dict: Ingestion results by source name when once=True, else None
+    
+    Raises:
+        ImportError: If aiohttp or asyncpg is not installed
+    """
+    import asyncio
+    import importlib.util
+    
+    missing = [name for name in ('aiohttp', 'asyncpg') if importlib.util.find_spec(name) is None]
+    if missing:
+        raise ImportError(
+            f"the async engine needs {' and '.join(missing)}: pip install aiohttp asyncpg"
+        )
+    
+    engine = AsyncIngestEngine(db_config, sources, fetchers, writers)
+    return asyncio.run(engine.run(interval_seconds, once))
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -766,6 +4548,22 @@ def main():
     
     # Ingest command
     ingest_parser = subparsers.add_parser('ingest', help='Run a single ingestion')
+    ingest_parser.add_argument(
+        '--sources',
+        help='JSON sources config: ingest every listed token concurrently'
+    )
+    ingest_parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Sources polled at the same time with --sources/--async (default: 8)'
+    )
+    ingest_parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Use the asyncio engine (needs aiohttp and asyncpg)'
+    )
     
     # Schedule command
     schedule_parser = subparsers.add_parser('schedule', help='Run on a schedule')
@@ -776,14 +4574,134 @@ def main():
         help='Minutes between ingestions (default: 15)'
     )
     
+    # Daemon command
+    daemon_parser = subparsers.add_parser(
+        'daemon',
+        help='Run resident ingestion with pooled connections (replaces cron)'
+    )
+    daemon_parser.add_argument(
+        '--interval',
+        type=int,
+        default=300,
+        help='Seconds between ingestions (default: 300)'
+    )
+    daemon_parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=2,
+        help='Maximum pooled database connections (default: 2)'
+    )
+    daemon_parser.add_argument(
+        '--sources',
+        help='JSON sources config: poll every listed token on its own interval'
+    )
+    daemon_parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Sources polled at the same time with --sources/--async (default: 8)'
+    )
+    daemon_parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Use the asyncio engine (needs aiohttp and asyncpg); --pool-size sets the writers'
+    )
+    
+    # Migrate command
+    migrate_parser = subparsers.add_parser('migrate', help='Apply pending schema migrations')
+    
+    # Dedupe command
+    dedupe_parser = subparsers.add_parser(
+        'dedupe',
+        help='Merge duplicate events and ensure the unique composite key index'
+    )
+    
+    # Partition command
+    partition_parser = subparsers.add_parser(
+        'partition-events',
+        help='Convert events to monthly partitions on call_created (or add upcoming ones)'
+    )
+    
+    # Rollups command
+    rollups_parser = subparsers.add_parser(
+        'rebuild-rollups',
+        help='Recount the hourly event_rollups behind stats from events'
+    )
+    
+    # Facets command
+    facets_parser = subparsers.add_parser(
+        'rebuild-facets',
+        help='Recount the facet_counts behind the dashboard filters from events'
+    )
+    
+    # Archive command
+    archive_parser = subparsers.add_parser(
+        'archive',
+        help='Move old events to compressed Parquet files (needs pyarrow)'
+    )
+    archive_parser.add_argument(
+        '--older-than-days',
+        type=int,
+        default=DispatchIngester.ARCHIVE_AFTER_DAYS,
+        help='Archive events older than this many days (default: 365 or DISPATCH_ARCHIVE_AFTER_DAYS env)'
+    )
+    archive_parser.add_argument(
+        '--archive-dir',
+        default=DispatchIngester.ARCHIVE_DIR,
+        help='Archive directory (default: archive or DISPATCH_ARCHIVE_DIR env)'
+    )
+    
+    # Listen command
+    listen_parser = subparsers.add_parser(
+        'listen',
+        help='Print each committed ingestion announced on the notify channel'
+    )
+    listen_parser.add_argument(
+        '--channel',
+        default=DispatchIngester.NOTIFY_CHANNEL,
+        help='Channel to listen on (default: dispatch_events or DISPATCH_NOTIFY_CHANNEL env)'
+    )
+    
+    # Changes command
+    changes_parser = subparsers.add_parser(
+        'changes',
+        help='Print event_changes entries after a consumer checkpoint or seq'
+    )
+    changes_parser.add_argument('--consumer', help='Read from and advance this consumer\'s checkpoint')
+    changes_parser.add_argument('--since', type=int, help='Read after this seq (default: the checkpoint, or 0)')
+    changes_parser.add_argument('--limit', type=int, default=1000, help='Maximum entries (default: 1000)')
+    
     # Stats command
     stats_parser = subparsers.add_parser('stats', help='Show database statistics')
+    stats_parser.add_argument('--include-archive', action='store_true', help='Include archived events')
+    stats_parser.add_argument('--archive-dir', default=DispatchIngester.ARCHIVE_DIR, help='Archive directory')
+    stats_parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Estimate the total from table statistics instead of counting'
+    )
     
     # Export command
     export_parser = subparsers.add_parser('export', help='Export data')
-    export_parser.add_argument('format', choices=['csv', 'json'], help='Export format')
+    export_parser.add_argument(
+        'format',
+        choices=['csv', 'json', 'ndjson'],
+        help='Export format (ndjson: one JSON event per line, streamed)'
+    )
     export_parser.add_argument('--output', '-o', required=True, help='Output file path')
     export_parser.add_argument('--limit', type=int, help='Limit number of records')
+    export_parser.add_argument(
+        '--compress',
+        choices=['gzip', 'zstd', 'none'],
+        help='Compress csv or ndjson on the fly (default: from the suffix, .gz or .zst)'
+    )
+    export_parser.add_argument(
+        '--itersize',
+        type=int,
+        default=DispatchIngester.EXPORT_ITERSIZE,
+        help='Rows fetched per round trip for ndjson (default: 5000)'
+    )
     
     # Search command
     search_parser = subparsers.add_parser('search', help='Search events')
@@ -793,9 +4711,16 @@ def main():
     search_parser.add_argument('--start', help='Start date (YYYY-MM-DD)')
     search_parser.add_argument('--end', help='End date (YYYY-MM-DD)')
     search_parser.add_argument('--limit', type=int, default=20, help='Max results')
+    search_parser.add_argument('--include-archive', action='store_true', help='Include archived events')
+    search_parser.add_argument('--archive-dir', default=DispatchIngester.ARCHIVE_DIR, help='Archive directory')
     
     args = parser.parse_args()
     
+    if not args.command:
+        # No subcommand: show help without touching the database
+        parser.print_help()
+        return
+    
     # Build database config from args
     db_config = {
         'host': args.host,
@@ -805,10 +4730,37 @@ def main():
         'password': args.password
     }
     
-    # Initialize ingester
+    if getattr(args, 'sources', None) or getattr(args, 'use_async', False):
+        import json
+        
+        if args.sources:
+            sources = load_sources(args.sources)
+            if not sources:
+                parser.error(f"no sources in {args.sources}")
+        else:
+            token = args.token or DispatchIngester.DEFAULT_TOKEN
+            sources = [{'name': token, 'token': token, 'interval': None}]
+        
+        once = args.command == 'ingest'
+        interval = getattr(args, 'interval', 300)
+        pool_size = getattr(args, 'pool_size', 2)
+        if args.use_async:
+            try:
+                results = run_async(db_config, sources, interval, args.workers, pool_size, once)
+            except ImportError as e:
+                parser.error(str(e))
+        else:
+            results = run_sources(db_config, sources, interval, args.workers, pool_size, once)
+        if once:
+            print(f"\nResult: {json.dumps(results, indent=2, default=str)}")
+        return
+    
+    # Initialize ingester (the database is first contacted by the command itself)
     ingester = DispatchIngester(db_config=db_config, pub_token=args.token)
     
     if args.command == 'ingest':
+        import json
+        
         result = ingester.ingest()
         print(f"\nResult: {json.dumps(result, indent=2, default=str)}")
         
@@ -818,11 +4770,70 @@ def main():
         except KeyboardInterrupt:
             print("\nScheduler stopped")
             
+    elif args.command == 'daemon':
+        run_daemon(ingester, args.interval, args.pool_size)
+        
+    elif args.command == 'migrate':
+        version = ingester.migrate()
+        print(f"Database schema is at version {version}")
+    
+    elif args.command == 'dedupe':
+        ingester.merge_duplicate_events()
+    
+    elif args.command == 'partition-events':
+        ingester.partition_events()
+        created = ingester.ensure_partitions()
+        if created:
+            print(f"Created partitions: {', '.join(created)}")
+        
+    elif args.command == 'rebuild-rollups':
+        ingester.rebuild_rollups()
+    
+    elif args.command == 'rebuild-facets':
+        ingester.rebuild_facets()
+    
+    elif args.command == 'archive':
+        try:
+            ingester.archive_events(args.older_than_days, args.archive_dir)
+        except ImportError as e:
+            parser.error(str(e))
+    
+    elif args.command == 'listen':
+        import json
+        
+        try:
+            for notification in ingester.subscribe(channel=args.channel):
+                print(json.dumps(notification), flush=True)
+        except KeyboardInterrupt:
+            pass
+    
+    elif args.command == 'changes':
+        seq = args.since
+        if seq is None:
+            seq = ingester.load_checkpoint(args.consumer) if args.consumer else 0
+        changes = ingester.changes_since(seq, args.limit)
+        for change in changes:
+            print(f"{change['seq']} {change['op']} id={change['id']} "
+                  f"{change['call_number']} ({change['call_created']})")
+        if args.consumer:
+            # Saved even when nothing was read, so a new consumer is registered
+            ingester.save_checkpoint(args.consumer, changes[-1]['seq'] if changes else seq)
+        print(f"{len(changes)} changes")
+    
     elif args.command == 'stats':
-        stats = ingester.get_stats()
+        try:
+            stats = ingester.get_stats(args.include_archive, args.archive_dir, args.fast)
+        except ImportError as e:
+            parser.error(str(e))
         print("\n=== Database Statistics ===")
-        print(f"Total Events: {stats['total_events']:,}")
+        if stats.get('total_estimated'):
+            print(f"Total Events: ~{stats['total_events']:,} (estimated)")
+        else:
+            print(f"Total Events: {stats['total_events']:,}")
         print(f"Database Size: {stats['database_size']}")
+        if 'archive' in stats:
+            archive = stats['archive']
+            print(f"Archived: {archive['events']:,} events in {archive['files']} files ({archive['size']})")
         print(f"\nDate Range: {stats['date_range']['earliest']} to {stats['date_range']['latest']}")
         print("\nBy Agency Type:")
         for agency, count in stats['by_agency_type'].items():
@@ -842,19 +4853,32 @@ def main():
             
     elif args.command == 'export':
         if args.format == 'csv':
-            ingester.export_to_csv(args.output, args.limit)
+            try:
+                ingester.export_to_csv(args.output, args.limit, args.compress)
+            except ImportError as e:
+                parser.error(str(e))
+        elif args.format == 'ndjson':
+            try:
+                ingester.export_to_ndjson(args.output, args.limit, args.compress, args.itersize)
+            except ImportError as e:
+                parser.error(str(e))
         else:
             ingester.export_to_json(args.output, args.limit)
             
     elif args.command == 'search':
-        results = ingester.search_events(
-            call_type=args.call_type,
-            jurisdiction=args.jurisdiction,
-            address=args.address,
-            start_date=args.start,
-            end_date=args.end,
-            limit=args.limit
-        )
+        try:
+            results = ingester.search_events(
+                call_type=args.call_type,
+                jurisdiction=args.jurisdiction,
+                address=args.address,
+                start_date=args.start,
+                end_date=args.end,
+                limit=args.limit,
+                include_archive=args.include_archive,
+                archive_dir=args.archive_dir
+            )
+        except ImportError as e:
+            parser.error(str(e))
         print(f"\nFound {len(results)} events:\n")
         for event in results:
             print(f"[{event['call_created']}] {event['call_type']}")